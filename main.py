@@ -1,6 +1,71 @@
-from src.game_manager import GameManager
+import argparse
+import os
+import sys
 
-if __name__ == "__main__":
-    game = GameManager()
-    game.run()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense")
+    parser.add_argument('--profile-out', default=None, metavar='PATH',
+                        help="프레임 구간별 측정을 켜고 종료할 때 저장 (.csv 또는 .json)")
+    parser.add_argument('--latency-out', default=None, metavar='PATH',
+                        help="입력 지연 측정을 켜고 종료할 때 JSON으로 저장")
+    parser.add_argument('--seed', type=int, default=None, help="난수 시드 (같은 시드와 입력이면 같은 게임)")
+    parser.add_argument('--record', default=None, metavar='PATH',
+                        help="입력을 녹화해서 종료할 때 저장 (.gz면 압축)")
+    parser.add_argument('--replay', default=None, metavar='PATH',
+                        help="녹화 파일을 최대 속도로 재생하고 결과 확인")
+    parser.add_argument('--render', action='store_true', help="재생할 때 화면에도 그리기")
+    return parser.parse_args(argv)
+
+def run_replay(args):
+    if not args.render:
+        # 창 없이 재생
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from src.replay import Recording, ReplayMismatch, replay
+    recording = Recording.load(args.replay)
+    try:
+        result = replay(recording, render=args.render)
+    except ReplayMismatch as e:
+        print(f"[실패] {e}")
+        return 1
+    print(f"[재생] 결과 일치: {result}")
+    return 0
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.replay:
+        return run_replay(args)
 
+    from src.game_manager import GameManager
+    from src.profiler import profiler
+    from src.latency import latency
+    from src.replay import Recorder
+    from src.settings import BACKGROUND_LOADING, SCORE_STORE
+    from src.score_store import ScoreStore
+    if args.profile_out:
+        profiler.enabled = True
+    if args.latency_out:
+        latency.enabled = True
+    # 녹화는 시작할 때 언어 목록이 필요하므로 로딩이 끝난 뒤 시작
+    store = ScoreStore() if SCORE_STORE else None
+    game = GameManager(seed=args.seed, background_load=BACKGROUND_LOADING and not args.record,
+                       store=store)
+    recorder = Recorder(game) if args.record else None
+    try:
+        game.run()
+    finally:
+        if recorder:
+            recorder.finish(args.record)
+            print(f"[녹화] {len(recorder.recording.events)}개 입력을 {args.record}에 저장했습니다.")
+        if store:
+            store.close()  # 남은 기록 저장
+        if args.profile_out:
+            profiler.dump(args.profile_out)
+            print(f"[측정] {profiler.frames}프레임 기록을 {args.profile_out}에 저장했습니다.")
+        if args.latency_out:
+            latency.dump(args.latency_out)
+            print(f"[측정] 입력 지연 기록을 {args.latency_out}에 저장했습니다.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+"""
+성능 벤치마크 실행기
+
+SDL 더미 비디오 드라이버로 창 없이 실행:
+    python -m src.benchmark --output bench.json
+    python -m src.benchmark --baseline bench_base.json --gate p99 --tolerance 0.10
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import pygame
+from .settings import *
+from .data_manager import DataManager
+from .simulation import Simulation, SimulationConfig
+from .sprites import Enemy, Bullet
+from .word_sampler import SamplerTemplate
+from .glossary_search import GlossaryIndex
+from .word_snapshot import snapshot_path_for
+from .profiler import percentile
+
+DEFAULT_COUNTS = [10, 100, 1000]  # 10000까지 늘리려면 --counts 10,100,1000,10000
+DEFAULT_DATA_SIZES = [100, 1000, 10000, 100000]
+PERCENTILES = (50, 90, 95, 99)
+
+def summarize(samples_ns):
+    """나노초 샘플 목록을 밀리초 통계로 변환"""
+    values = sorted(v / 1e6 for v in samples_ns)
+    result = {
+        'samples': len(values),
+        'mean': sum(values) / len(values) if values else 0.0,
+        'min': values[0] if values else 0.0,
+        'max': values[-1] if values else 0.0,
+    }
+    for p in PERCENTILES:
+        result[f'p{p}'] = percentile(values, p)
+    return result
+
+def synthetic_words(count, rng):
+    """임의의 단어/설명 데이터 생성"""
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = []
+    for i in range(count):
+        word = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 10)))
+        words.append({'word': f"{word}{i}", 'desc': f"합성 용어 {i}: {word} 설명"})
+    return words
+
+class SyntheticData:
+    """DataManager 대신 쓰는 메모리 상의 단어 데이터"""
+    def __init__(self, count, rng):
+        self.data = {'Bench': synthetic_words(count, rng)}
+
+    def get_language_list(self):
+        return list(self.data.keys())
+
+    def get_random_word(self, language, rng=None):
+        return (rng or random).choice(self.data[language])
+
+    def get_sampler(self, language):
+        return SamplerTemplate(self.data[language]).sampler()
+
+class Benchmark:
+    """벤치마크 항목 실행 및 결과 수집"""
+    def __init__(self, samples=100, seed=0, physics=PHYSICS_BACKEND, collision=COLLISION_BACKEND):
+        self.samples = samples
+        self.seed = seed
+        self.physics = physics
+        self.collision = collision
+        self.results = {}
+
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def record(self, name, samples_ns, **params):
+        self.results[name] = dict(summarize(samples_ns), params=params)
+        stats = self.results[name]
+        print(f"{name:<32} p50={stats['p50']:8.3f}ms p99={stats['p99']:8.3f}ms")
+
+    # --- 준비 ---
+    def make_game(self, enemy_count, bullet_count, word_count=200):
+        """적/총알이 채워진 GameManager 생성 (창은 더미 드라이버)"""
+        from .game_manager import GameManager
+        rng = random.Random(self.seed)
+        game = GameManager(seed=self.seed)
+        game.data_manager.stop_watching()
+        data = SyntheticData(word_count, rng)
+        game.data_manager = data
+        game.selected_language = 'Bench'
+        game.physics_backend = self.physics
+        game.collision_backend = self.collision
+        game.start_game()
+        # 측정 중 게임이 끝나지 않도록 생명력을 넉넉하게
+        game.sim.config = SimulationConfig(lives=10**9)
+        game.sim.lives = game.sim.config.lives
+        game.sim.phase = game.state = "PLAYING"
+        self.populate(game.sim, enemy_count, bullet_count, rng)
+        return game
+
+    def populate(self, sim, enemy_count, bullet_count, rng):
+        """적은 화면 위쪽, 총알은 아래쪽에 배치 (처음엔 서로 겹치지 않음)"""
+        sim.enemies.empty()
+        sim.bullets.empty()
+        for _ in range(enemy_count):
+            enemy = Enemy(sim.data_manager.get_random_word('Bench', rng), speed=60, rng=rng,
+                          render=not sim.headless)
+            enemy.y = enemy.prev_y = rng.randint(0, SCREEN_HEIGHT // 3)
+            enemy.sync_rect()
+            sim.all_sprites.add(enemy)
+            sim.enemies.add(enemy)
+        enemies = sim.enemies.sprites()
+        for _ in range(bullet_count):
+            target = rng.choice(enemies) if enemies else None
+            bullet = Bullet(rng.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT - rng.randint(0, 200),
+                            target, rng=rng, render=not sim.headless)
+            sim.all_sprites.add(bullet)
+            sim.bullets.add(bullet)
+
+    def timed(self, fn, setup=None, samples=None, reset_every=0):
+        """fn 실행 시간 측정 (setup은 reset_every 샘플마다 측정 밖에서 실행)"""
+        samples_ns = []
+        for i in range(samples or self.samples):
+            if setup and (i == 0 or (reset_every and i % reset_every == 0)):
+                setup()
+            start = time.perf_counter_ns()
+            fn()
+            samples_ns.append(time.perf_counter_ns() - start)
+        return samples_ns
+
+    # --- 항목 ---
+    def bench_frame(self, counts):
+        """GameManager.update / draw 프레임 시간"""
+        for n in counts:
+            game = self.make_game(n, n)
+            rng = random.Random(self.seed)
+            reset = lambda: self.populate(game.sim, n, n, rng)
+            self.record(f"update[n={n}]", self.timed(game.update, reset, reset_every=20),
+                        enemies=n, bullets=n)
+            self.record(f"draw[n={n}]", self.timed(game.draw, reset, reset_every=20),
+                        enemies=n, bullets=n)
+
+    def bench_enemy_construct(self):
+        """Enemy 생성 비용"""
+        rng = random.Random(self.seed)
+        data = SyntheticData(1000, rng)
+        fn = lambda: Enemy(data.get_random_word('Bench', rng), speed=60, rng=rng)
+        self.record("enemy_construct", self.timed(fn, samples=self.samples * 10))
+
+    def bench_collide(self, counts):
+        """PLAYING 단계의 총알-적 충돌 판정"""
+        for n in counts:
+            game = self.make_game(n, n)
+            sim = game.sim
+            rng = random.Random(self.seed)
+            reset = lambda: self.populate(sim, n, n, rng)
+            self.record(f"collide[n={n}]", self.timed(sim.resolve_collisions, reset, reset_every=1),
+                        enemies=n, bullets=n)
+
+    def bench_collide_crossover(self, counts):
+        """
+        groupcollide와 공간 해시(격자 갱신 + 판정) 비교
+        스프라이트가 적을 때는 groupcollide가 빠를 수 있어서 역전되는 지점을 출력
+        """
+        data = SyntheticData(200, random.Random(self.seed))
+        crossover = None
+        for n in counts:
+            p50 = {}
+            for backend in ("groupcollide", "grid"):
+                sim = Simulation(data, 'Bench', rng=random.Random(self.seed), headless=True,
+                                 physics=self.physics, collision=backend)
+                rng = random.Random(self.seed)
+                reset = lambda: self.populate(sim, n, n, rng)
+
+                def collide():
+                    if sim.enemy_grid is not None:
+                        sim.enemy_grid.refresh(sim.enemies)
+                        sim.bullet_grid.refresh(sim.bullets)
+                    sim.resolve_collisions()
+                name = f"crossover_{backend}[n={n}]"
+                self.record(name, self.timed(collide, reset, reset_every=1), enemies=n, bullets=n)
+                p50[backend] = self.results[name]['p50']
+            if crossover is None and p50['grid'] < p50['groupcollide']:
+                crossover = n
+        if crossover is None:
+            print("[crossover] 측정한 범위에서는 groupcollide가 더 빠름")
+        else:
+            print(f"[crossover] 적/총알 {crossover}개부터 공간 해시가 더 빠름")
+
+    def bench_spawn(self):
+        """
+        적 생성 비용 (아틀라스 없음 / 아틀라스 배치만 / 카운트다운 동안 미리 렌더링)
+        미리 렌더링한 경우 생성 시 텍스트 렌더링이 없어야 함 (misses=0)
+        """
+        from .sprites import _enemy_images
+        for mode in ("none", "cold", "warm"):
+            game = self.make_game(0, 0, word_count=1000)
+            sim = game.sim
+            _enemy_images.clear()
+            if mode == "none":
+                sim.atlas = None
+            elif mode == "warm":
+                sim.atlas.warm()
+
+            def spawn():
+                enemy = sim.spawn_enemy()
+                enemy.kill()
+            self.record(f"spawn[atlas={mode}]", self.timed(spawn, samples=self.samples * 10), atlas=mode)
+            if sim.atlas is not None:
+                stats = sim.atlas.stats()
+                print(f"{'':<32} atlas hits={stats['hits']} misses={stats['misses']}")
+
+    def bench_sampler(self, sizes):
+        """단어 뽑기: 균등(random.choice) / 가중치 샘플러 뽑기 / 결과 반영, 그리고 기본 트리 구성 시간"""
+        for size in sizes:
+            rng = random.Random(self.seed)
+            words = synthetic_words(size, rng)
+            self.record(f"sampler_build[words={size}]",
+                        self.timed(lambda: SamplerTemplate(words), samples=max(3, self.samples // 10)),
+                        words=size)
+            sampler = SamplerTemplate(words).sampler()
+            self.record(f"sample_uniform[words={size}]",
+                        self.timed(lambda: rng.choice(words), samples=self.samples * 10), words=size)
+            self.record(f"sample_weighted[words={size}]",
+                        self.timed(lambda: sampler.draw(rng), samples=self.samples * 10), words=size)
+            outcomes = ('hit', 'floor')
+            self.record(f"sample_update[words={size}]",
+                        self.timed(lambda: sampler.record(rng.randrange(size), rng.choice(outcomes)),
+                                   samples=self.samples * 10), words=size)
+
+    def bench_check_input(self, counts):
+        """엔터 입력 시 정답 확인"""
+        for n in counts:
+            game = self.make_game(n, 0)
+            sim = game.sim
+            words = [enemy.word for enemy in sim.enemies]
+            rng = random.Random(self.seed)
+
+            def setup():
+                sim.bullets.empty()
+                sim.input_text = rng.choice(words)
+            self.record(f"check_input[n={n}]", self.timed(sim.check_input, setup, reset_every=1),
+                        enemies=n)
+
+    def bench_data_load(self, sizes):
+        """합성 words.json 로드 (JSON 파싱 + 검증 / 스냅샷)"""
+        rng = random.Random(self.seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            for size in sizes:
+                path = os.path.join(tmp, f"words_{size}.json")
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump({'Bench': synthetic_words(size, rng)}, f, ensure_ascii=False)
+                samples = max(3, min(self.samples, 2_000_000 // size))
+                self.record(f"data_load[n={size}]",
+                            self.timed(lambda: DataManager(path, use_snapshot=False), samples=samples),
+                            entries=size, bytes=os.path.getsize(path))
+                # 스냅샷 로드 (첫 실행에서 만든 스냅샷을 mmap으로 열기)
+                DataManager(path)
+                snapshot = snapshot_path_for(path)
+                self.record(f"data_snapshot[n={size}]",
+                            self.timed(lambda: DataManager(path), samples=samples),
+                            entries=size, bytes=os.path.getsize(snapshot))
+
+    def bench_startup(self, sizes):
+        """GameManager 생성부터 첫 화면 / 메뉴까지 (동기 로딩과 작업 스레드 로딩 비교)"""
+        from .game_manager import GameManager
+        rng = random.Random(self.seed)
+        with tempfile.TemporaryDirectory() as tmp:
+            for size in sizes:
+                path = os.path.join(tmp, f"words_{size}.json")
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump({'Bench': synthetic_words(size, rng)}, f, ensure_ascii=False)
+                snapshot = snapshot_path_for(path)
+                for mode, background in (('sync', False), ('thread', True)):
+                    first_frame, menu = [], []
+                    for _ in range(max(3, min(self.samples, 200_000 // size))):
+                        # 스냅샷 없이 JSON을 처음 읽는 경우 (단어 파일을 새로 배포한 직후)
+                        if os.path.exists(snapshot):
+                            os.remove(snapshot)
+                        game = GameManager(seed=self.seed, background_load=background, data_path=path)
+                        while game.state == "LOADING":
+                            game.clock.tick(FPS)  # 실제 루프처럼 프레임 사이에는 쉼
+                            game.events()
+                            game.update()
+                            game.draw()
+                        game.loader.wait()
+                        game.data_manager.stop_watching()
+                        first_frame.append(game.startup_times['first_frame'] * 1e6)
+                        menu.append(game.startup_times['menu'] * 1e6)
+                    self.record(f"startup_first_frame[{mode},n={size}]", first_frame, entries=size)
+                    self.record(f"startup_menu[{mode},n={size}]", menu, entries=size)
+
+    def bench_study(self, sizes):
+        """용어 공부 화면 그리기"""
+        for size in sizes:
+            game = self.make_game(0, 0, word_count=size)
+            game.state = "STUDY"
+            game.study_scroll_offset = 0
+            game.open_glossary('Bench')
+            game.glossary_index.ready.wait()  # 검색 색인 스레드가 끝난 뒤 측정
+
+            def scroll():
+                game.study_scroll_offset = (game.study_scroll_offset + 30) % max(1, game.study_max_scroll)
+                game.draw()
+                pygame.event.pump()
+            self.record(f"study_draw[n={size}]", self.timed(scroll), entries=size)
+
+    def bench_study_search(self, sizes):
+        """
+        용어 검색: 색인 구성 시간, 검색어를 한 글자씩 칠 때(오타 포함)와 지울 때 한 번의 검색 시간
+        """
+        queries = ("abc", "용어 123", "xyzq", "abdc", "설명")
+        for size in sizes:
+            rng = random.Random(self.seed)
+            words = synthetic_words(size, rng)
+            started = time.perf_counter_ns()
+            index = GlossaryIndex(words).build()
+            self.record(f"study_index_build[n={size}]", [time.perf_counter_ns() - started], entries=size)
+            samples = []
+            for _ in range(max(1, self.samples // 10)):
+                for query in queries:
+                    index._cache.clear()
+                    steps = [query[:k] for k in range(1, len(query) + 1)]
+                    for text in steps + steps[-2::-1]:
+                        started = time.perf_counter_ns()
+                        index.search(text)
+                        samples.append(time.perf_counter_ns() - started)
+            self.record(f"study_search[n={size}]", samples, entries=size)
+
+    def meta(self):
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'samples': self.samples,
+            'seed': self.seed,
+            'physics': self.physics,
+            'collision': self.collision,
+        }
+
+def compare(results, baseline, metric, tolerance):
+    """기준 결과와 비교해서 metric이 tolerance 이상 나빠진 항목 목록 반환"""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base or metric not in base or base[metric] <= 0:
+            continue
+        ratio = stats[metric] / base[metric]
+        mark = "REGRESSION" if ratio > 1 + tolerance else "ok"
+        print(f"{name:<32} {metric}: {base[metric]:8.3f} -> {stats[metric]:8.3f}ms ({ratio:5.2f}x) {mark}")
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+def parse_list(text):
+    return [int(v) for v in text.split(',') if v]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense 성능 벤치마크")
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument('--gate', default='p99', help="회귀 판정에 쓰는 통계 (기본 p99)")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="허용 비율 (0.10 = 10%%)")
+    parser.add_argument('--samples', type=int, default=100, help="항목별 샘플 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--physics', default=PHYSICS_BACKEND, choices=("python", "numpy"),
+                        help="적/총알 물리 백엔드")
+    parser.add_argument('--collision', default=COLLISION_BACKEND, choices=("grid", "groupcollide"),
+                        help="충돌 판정 방식")
+    parser.add_argument('--counts', type=parse_list, default=DEFAULT_COUNTS,
+                        help="적/총알 수 목록 (예: 10,100,1000)")
+    parser.add_argument('--data-sizes', type=parse_list, default=DEFAULT_DATA_SIZES,
+                        help="합성 words.json 항목 수 목록")
+    parser.add_argument('--only', default=None,
+                        help="실행할 항목 (frame,enemy,collide,crossover,spawn,sampler,input,data,study,search,startup 중 쉼표 구분)")
+    args = parser.parse_args(argv)
+
+    only = set(args.only.split(',')) if args.only else None
+    bench = Benchmark(samples=args.samples, seed=args.seed, physics=args.physics,
+                      collision=args.collision)
+    suites = [
+        ('frame', lambda: bench.bench_frame(args.counts)),
+        ('enemy', bench.bench_enemy_construct),
+        ('collide', lambda: bench.bench_collide(args.counts)),
+        ('crossover', lambda: bench.bench_collide_crossover(args.counts)),
+        ('spawn', bench.bench_spawn),
+        ('sampler', lambda: bench.bench_sampler(args.data_sizes)),
+        ('input', lambda: bench.bench_check_input(args.counts)),
+        ('data', lambda: bench.bench_data_load(args.data_sizes)),
+        ('study', lambda: bench.bench_study(args.data_sizes)),
+        ('search', lambda: bench.bench_study_search(args.data_sizes)),
+        ('startup', lambda: bench.bench_startup(args.data_sizes)),
+    ]
+    for name, suite in suites:
+        if only is None or name in only:
+            suite()
+
+    report = {'meta': bench.meta(), 'results': bench.results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(bench.results, baseline, args.gate, args.tolerance)
+        if regressions:
+            print(f"[실패] {len(regressions)}개 항목이 기준보다 느려졌습니다: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
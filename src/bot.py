@@ -0,0 +1,134 @@
+"""
+자동 타자 봇 (부하 테스트용)
+
+사람처럼 화면에서 가장 아래쪽 적을 골라 한 글자씩 치고, 가끔 틀리면 백스페이스로 고친 뒤 엔터로 발사함
+시간은 틱 단위로 세므로 같은 시드면 항상 같은 입력이 나옴
+- TypistBot.policy: Simulation.run(policy=...)에 넘겨 시뮬레이션에 직접 입력
+- TypistBot.drive(game): 키 이벤트를 GameManager.handle_event로 넣음 (GameManager.check_input을 거침)
+"""
+import random
+import string
+import pygame
+from .settings import *
+
+BACKSPACE = '\b'
+ENTER = '\r'
+
+class TypistBot:
+    """설정한 타이핑 속도, 오타율, 반응 시간으로 게임을 하는 봇"""
+    def __init__(self, wpm=BOT_WPM, error_rate=BOT_ERROR_RATE, reaction_delay=BOT_REACTION_DELAY,
+                 rng=None, tick_rate=SIM_HZ):
+        self.wpm = wpm
+        self.error_rate = error_rate
+        self.chars_per_tick = wpm * 5 / 60 / tick_rate
+        self.reaction_ticks = round(reaction_delay * tick_rate)
+        self.rng = rng or random.Random()
+        self.budget = 0.0   # 이번 틱까지 칠 수 있는 글자 수 (소수점은 다음 틱으로 이월)
+        self.wait = 0       # 반응 시간이 끝날 때까지 남은 틱
+        self.target = None  # 지금 치고 있는 적
+        self.target_generation = 0
+        self.keystrokes = 0
+        self.errors = 0
+        self.shots = 0
+
+    def target_valid(self):
+        target = self.target
+        return target is not None and target.alive() and target.generation == self.target_generation
+
+    def pick_target(self, sim):
+        """총알이 아직 쫓고 있지 않은 적 중 가장 아래쪽 적 선택"""
+        chased = {bullet.target for bullet in sim.bullets if bullet.target_alive()}
+        lowest = None
+        for enemy in sim.enemies:
+            if enemy in chased:
+                continue
+            if lowest is None or enemy.rect.bottom > lowest.rect.bottom:
+                lowest = enemy
+        self.target = lowest
+        self.target_generation = lowest.generation if lowest is not None else 0
+        return lowest
+
+    def next_key(self, sim):
+        """다음에 누를 키 (지금 칠 게 없으면 None)"""
+        typed = sim.input_text
+        if not self.target_valid():
+            self.target = None
+            if typed:
+                return BACKSPACE  # 목표가 사라졌으면 치던 글자 지우기
+            if self.pick_target(sim) is None:
+                return None
+            self.wait = self.reaction_ticks
+            if self.wait > 0:
+                return None
+        word = self.target.word
+        if typed == word:
+            return ENTER
+        if not word.startswith(typed):
+            return BACKSPACE  # 오타 고치기
+        if self.rng.random() < self.error_rate:
+            self.errors += 1
+            return self.rng.choice(string.ascii_lowercase.replace(word[len(typed)].lower(), ''))
+        return word[len(typed)]
+
+    def step(self, sim, press):
+        """
+        한 틱 동안 봇 진행, press(key)로 키를 하나씩 누름
+        키를 누를 때마다 입력 상태가 바로 바뀌므로 (자동 발사 등) 다음 키는 바뀐 상태를 보고 정함
+        """
+        if sim.phase != "PLAYING":
+            return
+        if self.wait > 0:
+            self.wait -= 1
+            return
+        self.budget += self.chars_per_tick
+        while self.budget >= 1.0:
+            key = self.next_key(sim)
+            if key is None:
+                break
+            self.budget -= 1.0
+            self.keystrokes += 1
+            press(key)
+            if key != BACKSPACE and not sim.input_text:
+                # 엔터 또는 자동 발사로 입력이 비워짐 -> 다음 단어로
+                self.shots += 1
+                self.target = None
+            if self.wait > 0:
+                break
+        else:
+            return
+        self.budget = 0.0  # 칠 게 없는 동안에는 속도를 모아두지 않음
+
+    def policy(self, sim):
+        """Simulation.run(policy=bot.policy)용: 시뮬레이션에 직접 입력"""
+        def press(key):
+            if key == BACKSPACE:
+                sim.backspace()
+            elif key == ENTER:
+                sim.submit()
+            else:
+                sim.type_text(key)
+        self.step(sim, press)
+
+    def drive(self, game):
+        """GameManager에 KEYDOWN 이벤트로 입력 (다음 update() 전에 호출)"""
+        if game.sim is None:
+            return
+        self.step(game.sim, lambda key: game.handle_event(key_event(key, game.text_input)))
+
+    def stats(self):
+        return {
+            'keystrokes': self.keystrokes,
+            'errors': self.errors,
+            'shots': self.shots,
+        }
+
+def key_event(key, text_input=False):
+    """봇이 누른 키를 pygame 이벤트로 변환 (text_input이면 글자는 TEXTINPUT 이벤트)"""
+    if key == BACKSPACE:
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode='\b', mod=0, scancode=0)
+    if key == ENTER:
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode='\r', mod=0, scancode=0)
+    if text_input:
+        return pygame.event.Event(pygame.TEXTINPUT, text=key)
+    return pygame.event.Event(pygame.KEYDOWN, key=ord(key.lower()) if key.isascii() else 0,
+                              unicode=key, mod=0, scancode=0)
@@ -1,18 +1,91 @@
 import json
 import os
 import random
+from .word_snapshot import SnapshotError, WordSnapshot, snapshot_path_for, write_snapshot
+from .word_shards import MANIFEST_NAME, ShardedWords
+from .word_sampler import SamplerTemplate
 
 class DataManager:
     """
     words.json 파일 읽어오고 관리하는 클래스
+    검증까지 끝난 데이터는 바이너리 스냅샷(words.snapshot)으로 저장해 두고,
+    원본이 바뀌지 않았으면 다음 실행부터 스냅샷을 mmap으로 바로 읽음
+    file_path가 매니페스트(또는 매니페스트가 있는 폴더)면 언어별 샤드를 필요할 때 읽음
     """
-    def __init__(self):
-        # 현재 파일 위치 기준으로 data 폴더 경로 찾기
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.file_path = os.path.join(base_path, 'data', 'words.json')
+    def __init__(self, file_path=None, snapshot_path=None, use_snapshot=True):
+        # 경로를 따로 주지 않으면 현재 파일 위치 기준으로 data 폴더 경로 찾기
+        if file_path is None:
+            base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            data_path = os.path.join(base_path, 'data')
+            manifest_path = os.path.join(data_path, MANIFEST_NAME)
+            file_path = manifest_path if os.path.exists(manifest_path) else os.path.join(data_path, 'words.json')
+        elif os.path.isdir(file_path):
+            file_path = os.path.join(file_path, MANIFEST_NAME)
+        self.file_path = file_path
+        self.snapshot_path = snapshot_path or snapshot_path_for(file_path)
+        self.use_snapshot = use_snapshot
+        self.snapshot = None
         self.data = self.load_data()
+        self.watcher = None
+        self.listeners = []  # 다시 읽은 언어가 있을 때 호출할 함수 (바뀐 언어 집합을 받음)
+        self.samplers = {}   # 언어 -> 단어 샘플러 기본 가중치/트리 (처음 쓸 때 만듦)
 
     def load_data(self):
+        """
+        단어 데이터 로드
+        최신 스냅샷이 있으면 그대로 사용하고, 없거나 원본이 더 새로우면
+        JSON을 읽어 검증한 뒤 스냅샷을 다시 만듦
+        """
+        if os.path.basename(self.file_path) == MANIFEST_NAME:
+            return self.load_manifest()
+        if not self.use_snapshot:
+            return self.load_json()
+        data = self.load_snapshot()
+        if data is not None:
+            return data
+        data = self.load_json()
+        if data:
+            self.save_snapshot(data)
+        return data
+
+    def load_manifest(self):
+        """매니페스트만 읽고, 각 샤드는 같은 방식(스냅샷/JSON)으로 필요할 때 로드"""
+        try:
+            return ShardedWords(self.file_path, self.load_shard)
+        except FileNotFoundError:
+            print(f"[오류] {self.file_path} 파일을 찾을 수 없습니다.")
+        except (json.JSONDecodeError, AttributeError) as e:
+            print(f"[오류] 매니페스트 파싱 실패: {e}")
+        return {}
+
+    def load_shard(self, path):
+        """샤드 하나 로드 (샤드 파일도 words.json과 같은 형식)"""
+        return DataManager(path, use_snapshot=self.use_snapshot).data
+
+    def load_snapshot(self):
+        """원본과 일치하는 스냅샷이 있으면 {언어: 단어 목록} 반환, 아니면 None"""
+        try:
+            source_stat = os.stat(self.file_path)
+        except OSError:
+            source_stat = None  # 원본 없이 스냅샷만 배포한 경우
+        try:
+            snapshot = WordSnapshot(self.snapshot_path)
+        except (OSError, SnapshotError):
+            return None
+        if source_stat is not None and not snapshot.matches(source_stat):
+            snapshot.close()
+            return None
+        self.snapshot = snapshot
+        return dict(snapshot.languages)
+
+    def save_snapshot(self, data):
+        """검증된 데이터를 스냅샷으로 저장 (실패해도 게임 진행에는 영향 없음)"""
+        try:
+            write_snapshot(data, self.snapshot_path, os.stat(self.file_path))
+        except OSError as e:
+            print(f"[경고] 단어 스냅샷을 저장하지 못했습니다: {e}")
+
+    def load_json(self):
         """JSON 파일 읽어서 딕셔너리로 변환하고 유효성 검증"""
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
@@ -34,7 +107,7 @@ class DataManager:
         """
         데이터 구조 유효성 검증
         - 각 언어는 리스트여야 함
-        - 각 단어 객체는 'word'와 'desc' 키를 가져야 함
+        - 각 단어 객체는 문자열 'word'와 'desc' 키를 가져야 함
         """
         if not isinstance(data, dict):
             print("[경고] 데이터가 딕셔너리 형식이 아닙니다.")
@@ -42,44 +115,109 @@ class DataManager:
         
         validated_data = {}
         for language, word_list in data.items():
-            if not isinstance(word_list, list):
-                print(f"[경고] '{language}'의 데이터가 리스트 형식이 아닙니다. 건너뜁니다.")
-                continue
-            
-            if len(word_list) == 0:
-                print(f"[경고] '{language}'의 단어 리스트가 비어있습니다. 건너뜁니다.")
-                continue
-            
-            # 유효한 단어만 필터링
-            valid_words = []
-            for word_obj in word_list:
-                if isinstance(word_obj, dict) and 'word' in word_obj and 'desc' in word_obj:
-                    valid_words.append(word_obj)
-                else:
-                    print(f"[경고] '{language}'에 유효하지 않은 단어 객체가 있습니다. 건너뜁니다.")
-            
+            valid_words = self._validate_language(language, word_list)
             if valid_words:
                 validated_data[language] = valid_words
-            else:
-                print(f"[경고] '{language}'에 유효한 단어가 없습니다. 건너뜁니다.")
         
         return validated_data
 
+    def _validate_language(self, language, word_list):
+        """한 언어의 단어 리스트 검증 (유효한 단어 리스트, 쓸 수 없으면 None)"""
+        if not isinstance(word_list, list):
+            print(f"[경고] '{language}'의 데이터가 리스트 형식이 아닙니다. 건너뜁니다.")
+            return None
+        
+        if len(word_list) == 0:
+            print(f"[경고] '{language}'의 단어 리스트가 비어있습니다. 건너뜁니다.")
+            return None
+        
+        # 유효한 단어만 필터링
+        valid_words = [word_obj for word_obj in word_list
+                       if isinstance(word_obj, dict)
+                       and isinstance(word_obj.get('word'), str)
+                       and isinstance(word_obj.get('desc'), str)]
+        skipped = len(word_list) - len(valid_words)
+        if skipped:
+            print(f"[경고] '{language}'에 유효하지 않은 단어 객체 {skipped}개를 건너뜁니다.")
+        
+        if not valid_words:
+            print(f"[경고] '{language}'에 유효한 단어가 없습니다. 건너뜁니다.")
+            return None
+        return valid_words
+
+    def start_watching(self, interval=None):
+        """원본 파일 감시 시작 (바뀐 내용은 apply_reload()에서 반영)"""
+        from .word_watcher import WordWatcher
+        if self.watcher is None and self.data:
+            self.watcher = WordWatcher(self) if interval is None else WordWatcher(self, interval)
+            self.watcher.start()
+
+    def stop_watching(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def apply_reload(self):
+        """
+        감시 스레드가 다시 읽어 둔 언어를 한 번에 교체 (메인 스레드에서 프레임 사이에 호출)
+        바뀐 언어 집합 반환
+        """
+        if self.watcher is None:
+            return set()
+        changes, entries = self.watcher.take()
+        if not changes and entries is None:
+            return set()
+        if isinstance(self.data, ShardedWords):
+            if entries is not None:
+                self.data.set_entries(entries)
+            for language, words in changes.items():
+                self.data.replace(language, words)
+        else:
+            for language, words in changes.items():
+                if words is None:
+                    self.data.pop(language, None)
+                else:
+                    self.data[language] = words
+        changed = set(changes)
+        for language in changed:
+            self.samplers.pop(language, None)
+        for listener in self.listeners:
+            listener(changed)
+        return changed
+
     def get_language_list(self):
         """선택 가능한 언어 목록 반환"""
         return list(self.data.keys())
 
-    def get_random_word(self, language):
+    def get_random_word(self, language, rng=None):
         """
         특정 언어에서 랜덤 단어 객체 반환
         반환 형식: {'word': 'def', 'desc': '함수 정의'}
         언어 없거나 빈 리스트면 None 반환
+        rng를 넘기면 해당 난수 생성기 사용 (시드 고정 시뮬레이션용)
         """
         if language not in self.data:
             return None
         
         word_list = self.data[language]
-        if not isinstance(word_list, list) or len(word_list) == 0:
+        if len(word_list) == 0:
             return None
         
-        return random.choice(word_list)
\ No newline at end of file
+        return (rng or random).choice(word_list)
+
+    def get_sampler(self, language):
+        """
+        특정 언어의 가중치 단어 샘플러 (게임 한 판마다 새로 받아서 사용)
+        기본 가중치 트리는 언어마다 한 번 만들고, 단어 데이터가 바뀌면 다시 만듦
+        언어 없거나 빈 리스트면 None 반환
+        """
+        template = self.samplers.get(language)
+        if template is None:
+            word_list = self.data.get(language)
+            if not word_list:
+                return None
+            template = self.samplers[language] = SamplerTemplate(word_list)
+        return template.sampler()
\ No newline at end of file
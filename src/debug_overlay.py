@@ -0,0 +1,77 @@
+import pygame
+from .settings import *
+from .profiler import profiler
+from .latency import latency
+from .text_cache import get_font, get_cache_stats
+
+class ProfilerOverlay:
+    """
+    F3로 켜는 성능 정보 오버레이
+    구간별 p50/p95/p99, 입력 지연, 스프라이트 수, 캐시 적중률을 반투명 패널로 표시
+    값은 매 프레임 바뀌므로 텍스트 캐시를 쓰지 않고, 패널은 일정 간격으로만 다시 만듦
+    """
+    PHASES = ('frame', 'events', 'update', 'draw', 'spawn', 'collide', 'floor', 'move', 'text_render')
+
+    def __init__(self, governor=None, refresh_interval=0.25):
+        self.visible = False
+        self.governor = governor  # 프레임 예산 조절기 (있으면 현재 품질 단계 표시)
+        self.rect = pygame.Rect(10, 60, 430, 420)
+        self.refresh_interval = refresh_interval
+        self.font = None  # 처음 그릴 때 로드 (시작할 때 폰트 검색을 하지 않도록)
+        self._panel = None
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._panel = None
+        return self.visible
+
+    def lines(self):
+        """표시할 문자열 목록"""
+        summary = profiler.summary()
+        frame = summary.get('frame')
+        lines = []
+        if frame and frame['mean'] > 0:
+            lines.append(f"frame {frame['mean']:6.2f}ms  ({1000 / frame['mean']:5.1f} fps)")
+        lines.append(f"{'phase':<12}{'p50':>8}{'p95':>8}{'p99':>8}  (ms)")
+        for name in self.PHASES:
+            stats = summary.get(name)
+            if stats:
+                lines.append(f"{name:<12}{stats['p50']:8.2f}{stats['p95']:8.2f}{stats['p99']:8.2f}")
+        delays = latency.summary()
+        if delays:
+            lines.append(f"{'latency':<12}{'p50':>8}{'p95':>8}{'p99':>8}{'n':>7}")
+            for stage, stats in delays.items():
+                lines.append(f"{stage:<12}{stats['p50']:8.2f}{stats['p95']:8.2f}{stats['p99']:8.2f}"
+                             f"{stats['count']:7d}")
+            if 'drain' in delays:
+                lines.append(f"events/frame {delays['drain']['events_per_frame']:.2f}")
+        if self.governor is not None:
+            lines.append(self.governor.describe())
+        gauges = profiler.gauges
+        if gauges:
+            lines.append("  ".join(f"{name} {value}" for name, value in gauges.items()))
+        cache = get_cache_stats()
+        text_total = cache['text_hits'] + cache['text_misses']
+        font_total = cache['font_hits'] + cache['font_misses']
+        lines.append(f"text cache {cache['text_hits'] / text_total if text_total else 0:6.1%}"
+                     f"  font cache {cache['font_hits'] / font_total if font_total else 0:6.1%}")
+        return lines
+
+    def _render_panel(self):
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        if self.font is None:
+            self.font = get_font(16)
+        line_height = self.font.get_linesize()
+        for i, line in enumerate(self.lines()):
+            panel.blit(self.font.render(line, True, GREEN), (8, 6 + i * line_height))
+        return panel
+
+    def draw(self, screen, now):
+        """오버레이 그리기 (다시 그린 영역 반환)"""
+        if self._panel is None or now - self._last_refresh >= self.refresh_interval:
+            self._panel = self._render_panel()
+            self._last_refresh = now
+        screen.blit(self._panel, self.rect)
+        return self.rect
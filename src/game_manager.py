@@ -1,106 +1,275 @@
+import random
+import time
 import pygame
 from .settings import *
-from .data_manager import DataManager
-from .sprites import Enemy, Player, Bullet
+from .loader import StartupLoader
+from .simulation import Simulation
+from .glossary import GlossaryView
+from .glossary_search import GlossaryIndex
+from .text_cache import get_font, render_text, text_cache
+from .profiler import profiler
+from .latency import latency
+from .debug_overlay import ProfilerOverlay
+from .governor import FrameGovernor, LEVEL_HUD
+from .sprites import allocation_count
 
 class GameManager:
     """
     게임의 전체 상태(메뉴, 플레이, 게임오버)를 관리하는 핵심 클래스
+    실제 게임 규칙은 Simulation이 처리하고, 여기서는 입력 전달과 그리기만 담당
     """
-    def __init__(self):
-        pygame.init()
+    def __init__(self, seed=None, headless=False, background_load=False, data_path=None, store=None):
+        """
+        background_load=True면 창과 로딩 화면을 먼저 띄우고 데이터/폰트 준비는 작업 스레드에서 진행
+        (run()이 도는 동안 준비가 끝나면 메뉴로 넘어감), False면 준비가 끝난 뒤 반환
+        store(ScoreStore)를 주면 게임 결과와 단어별 기록을 저장
+        """
+        self.started = time.perf_counter()
+        self.startup_times = {}  # 생성 시작부터 첫 화면/메뉴까지 걸린 시간 (ms)
+        # 창과 로딩 화면에 필요한 모듈만 먼저 초기화 (나머지는 첫 화면 이후)
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
+        self.text_input = INPUT_TEXT_MODE == "textinput"  # 글자를 TEXTINPUT 이벤트로 받을지
+        self.configure_events()
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(FONT_NAME, 30)
+        self.font = None  # 메뉴/HUD 폰트 (로딩이 끝나면 설정)
         
-        self.data_manager = DataManager()
+        # 로딩 화면 글자는 기본 폰트로 미리 렌더링 (시스템 폰트 검색 없음, 작업 스레드와 겹치지 않음)
+        loading_font = pygame.font.Font(None, 32)
+        self.loading_labels = {
+            'title': loading_font.render("Loading...", True, WHITE),
+            'words': loading_font.render("words", True, GRAY),
+            'fonts': loading_font.render("fonts", True, GRAY),
+            'atlas': loading_font.render("atlas", True, GRAY),
+        }
+        self.data_manager = None
+        self.loader = StartupLoader(data_path, atlas=WORD_ATLAS and not headless)
         self.running = True
-        self.state = "MENU" # 초기 상태: 메뉴
+        self.state = "LOADING" # 초기 상태: 로딩 (끝나면 메뉴)
         
         # 게임 관련 변수
         self.selected_language = None
-        self.score = 0
-        self.input_text = "" # 사용자가 현재 타이핑 중인 글자
-        self.lives = 3  # 생명력 (하트 3개)
-        
-        # 카운트다운 관련
-        self.countdown_timer = 0
-        self.countdown_number = 3
-        
-        # 스프라이트 그룹
-        self.all_sprites = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.player = Player()
-        self.all_sprites.add(self.player)
-
-        # 적 생성 타이머
-        self.spawn_timer = 0
+        # 게임마다 새 시뮬레이션을 만들고, 시드는 이 난수 생성기에서 뽑음
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.sim = None
+        self.headless = headless  # True면 스프라이트 이미지 없이 진행 (재생 검증용, 그리지 않음)
+        self.ticks = 0  # 지금까지 진행한 고정 틱 수 (상태와 무관하게 증가, 입력 녹화 기준)
+        self.recorder = None  # 입력 녹화기 (replay.Recorder)
+        self.physics_backend = PHYSICS_BACKEND  # 적/총알 물리 백엔드
+        self.collision_backend = COLLISION_BACKEND  # 충돌 판정 방식
+        self.sim_config = None  # 게임 규칙 (None이면 기본값, 스트레스 테스트에서 바꿈)
+        self.store = store  # 점수/단어 기록 저장소 (None이면 저장 안 함)
+        self.store_session = None  # 저장소에 기록 중인 게임 번호
         
         # 용어 공부 스크롤 관련
         self.study_scroll_offset = 0
         self.study_max_scroll = 0
+        self.glossary = None  # 선택한 언어의 미리 렌더링된 용어 목록
+        self.glossary_index = None  # 선택한 언어의 검색 색인 (작업 스레드에서 구성)
+        self.study_query = ""  # 용어 검색어
         
         # 입력 커서 관련
-        self.cursor_timer = 0
+        self.cursor_timer = 0.0
         self.cursor_visible = True
+        
+        # 렌더링 보간 비율 (0: 이전 틱 위치, 1: 현재 틱 위치)
+        self.alpha = 1.0
+        
+        # 더티 렉트 렌더링 관련
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background.fill(BLACK)
+        self._scene_key = None  # 마지막으로 전체를 그린 화면 (None이면 다시 그림)
+        self._hud_values = {}
+        self.player_group = pygame.sprite.RenderUpdates()
+        # HUD 영역과 해당 영역을 그리는 함수
+        self.hud_regions = {
+            'score': pygame.Rect(0, 0, SCREEN_WIDTH // 2, 50),
+            'hearts': pygame.Rect(SCREEN_WIDTH - 120, 0, 120, 50),
+            'input': pygame.Rect(0, SCREEN_HEIGHT - 45, SCREEN_WIDTH, 45),
+        }
+        self.hud_painters = {
+            'score': self.draw_score,
+            'hearts': self.draw_hearts,
+            'input': self.draw_input_line,
+        }
+        
+        # 프레임 예산 조절기 (run()에서 프레임 작업 시간을 보고 품질 단계를 정함)
+        self.governor = FrameGovernor() if GOVERNOR else None
+        self.quality = 0  # 현재 품질 단계 (0: 전체 품질)
+        self._hud_frame = 0  # HUD 간소화 단계에서 HUD 갱신 간격을 세는 프레임 수
+
+        # 성능 정보 오버레이 (F3)
+        self.overlay = ProfilerOverlay(self.governor)
+        self.measure_was_enabled = (False, False)  # 오버레이를 켜기 전 측정기 상태 (profiler, latency)
+        self._allocations = 0  # 지난 프레임까지 새로 만든 스프라이트/Surface 수
+
+        if background_load:
+            self.loader.start()
+        else:
+            self.loader.run()
+            self.finish_loading()
+        self.draw()
+        self.mark_startup('first_frame')
+        pygame.init()  # 나머지 모듈 (이미 초기화한 모듈은 건너뜀)
+
+    def mark_startup(self, name):
+        """시작 시점부터 걸린 시간 기록"""
+        self.startup_times[name] = (time.perf_counter() - self.started) * 1000
+        profiler.gauge(f"{name}_ms", round(self.startup_times[name], 1))
+
+    def finish_loading(self):
+        """로더가 준비한 단어 데이터와 폰트로 메뉴 열기"""
+        if self.loader.error is not None:
+            raise self.loader.error
+        self.data_manager = self.loader.data_manager
+        self.data_manager.add_listener(self.on_words_reloaded)
+        if WORD_HOT_RELOAD:
+            self.data_manager.start_watching()
+        self.font = get_font(30)
+        self.state = "MENU"
+        self.mark_startup('menu')
 
     def run(self):
-        """게임 메인 루프"""
+        """
+        게임 메인 루프 (고정 시간 간격 시뮬레이션)
+        실제 경과 시간을 누적해서 TIMESTEP 단위로 update()를 필요한 만큼 돌리고,
+        남은 시간 비율로 보간해서 그림 -> 렌더링 FPS나 느린 프레임과 무관하게 같은 속도
+        """
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
             self.clock.tick(FPS)
-            self.events()
-            self.update()
-            self.draw()
+            now = time.perf_counter()
+            accumulator += min(now - previous, MAX_FRAME_TIME)
+            previous = now
+            
+            # 감시 스레드가 다시 읽은 단어 데이터는 프레임 사이에 반영
+            if self.data_manager is not None:
+                self.data_manager.apply_reload()
+            with profiler.section('events'):
+                self.events()
+            with profiler.section('update'):
+                while accumulator >= TIMESTEP:
+                    self.update()
+                    accumulator -= TIMESTEP
+            self.alpha = accumulator / TIMESTEP
+            with profiler.section('draw'):
+                self.draw()
+            if profiler.enabled and self.sim is not None:
+                profiler.gauge('enemies', len(self.sim.enemies))
+                profiler.gauge('bullets', len(self.sim.bullets))
+                allocations = allocation_count()
+                profiler.gauge('allocs', allocations - self._allocations)
+                self._allocations = allocations
+                profiler.gauge('quality', self.quality)
+            profiler.end_frame()
+            self.govern(time.perf_counter() - now)
+        self.end_session()
+        if self.data_manager is not None:
+            self.data_manager.stop_watching()
+
+    def configure_events(self):
+        """
+        이벤트 큐 설정
+        필터를 켜면 게임이 쓰는 이벤트만 받아서 마우스 이동 같은 이벤트가 큐를 채우지 않음
+        TEXTINPUT은 pygame이 KEYDOWN의 unicode를 채우는 데도 쓰므로 항상 받음
+        """
+        if INPUT_EVENT_FILTER:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([
+                pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT,
+                pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+                pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+            ])
+        else:
+            pygame.event.set_allowed(None)
+        if self.text_input:
+            pygame.key.start_text_input()
 
     def events(self):
         """키보드 및 마우스 입력 처리"""
-        for event in pygame.event.get():
+        received = time.perf_counter()
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
-            
-            if self.state == "MENU":
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_menu_click(event.pos)
-            
-            elif self.state == "GAMEOVER":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        # 메뉴로 복귀
-                        self.state = "MENU"
-            
-            elif self.state == "STUDY_MENU":
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_study_menu_click(event.pos)
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.state = "MENU"
-            
-            elif self.state == "STUDY":
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
-                        self.state = "STUDY_MENU"
-                elif event.type == pygame.MOUSEWHEEL:
-                    # 마우스 휠로 스크롤
-                    self.study_scroll_offset -= event.y * 30  # 스크롤 속도 조절
-                    # 스크롤 범위 제한
-                    self.study_scroll_offset = max(0, min(self.study_scroll_offset, self.study_max_scroll))
-            
-            elif self.state == "PLAYING":
-                if event.type == pygame.KEYDOWN:
-                    # 방향키는 단어 입력에서 제외 (WASD는 단어 입력 가능)
-                    if event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
-                        # 방향키는 무시 (플레이어 이동도 안 함)
-                        pass
-                    elif event.key == pygame.K_BACKSPACE:
-                        self.input_text = self.input_text[:-1]
-                    elif event.key == pygame.K_RETURN:
-                        self.check_input() # 엔터 치면 정답 확인
-                        self.input_text = ""
-                    elif event.unicode and event.unicode.isprintable():
-                        # 글자 입력 추가 (WASD 포함, 모든 문자 입력 가능)
-                        self.input_text += event.unicode
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 창이 가려졌다 다시 보이면 전체 다시 그리기
+                self._scene_key = None
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_overlay()
+            else:
+                latency.receive(received)
+                self.handle_event(event)
+                latency.done()
+        latency.drained(len(events), received)
+
+    def handle_event(self, event):
+        """
+        게임 입력 이벤트 하나 처리 (키, 마우스 클릭, 휠)
+        녹화 중이면 현재 틱과 함께 기록되고, 재생할 때도 이 함수로 다시 들어옴
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, event)
+        if self.state == "MENU":
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_menu_click(event.pos)
+        
+        elif self.state == "GAMEOVER":
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                    # 메뉴로 복귀
+                    self.state = "MENU"
+        
+        elif self.state == "STUDY_MENU":
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_study_menu_click(event.pos)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.state = "MENU"
+        
+        elif self.state == "STUDY":
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE and self.study_query:
+                    self.set_study_query("")  # 검색 중이면 먼저 검색어만 지움
+                elif event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
+                    self.state = "STUDY_MENU"
+                elif event.key == pygame.K_BACKSPACE:
+                    self.set_study_query(self.study_query[:-1])
+                elif not self.text_input and event.unicode and event.unicode.isprintable():
+                    self.set_study_query(self.study_query + event.unicode)
+            elif event.type == pygame.TEXTINPUT and self.text_input:
+                if event.text.isprintable():
+                    self.set_study_query(self.study_query + event.text)
+            elif event.type == pygame.MOUSEWHEEL:
+                # 마우스 휠로 스크롤
+                self.study_scroll_offset -= event.y * 30  # 스크롤 속도 조절
+                # 스크롤 범위 제한
+                self.study_scroll_offset = max(0, min(self.study_scroll_offset, self.study_max_scroll))
+        
+        elif self.state == "PLAYING":
+            if event.type == pygame.KEYDOWN:
+                # 방향키는 단어 입력에서 제외 (WASD는 단어 입력 가능)
+                if event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN):
+                    # 방향키는 무시 (플레이어 이동도 안 함)
+                    pass
+                elif event.key == pygame.K_BACKSPACE:
+                    latency.typed()
+                    self.sim.backspace()
+                elif event.key == pygame.K_RETURN:
+                    self.check_input() # 엔터 치면 정답 확인
+                elif not self.text_input and event.unicode and event.unicode.isprintable():
+                    # 글자 입력 추가 (WASD 포함, 모든 문자 입력 가능)
+                    latency.typed()
+                    self.sim.type_text(event.unicode)
+            elif event.type == pygame.TEXTINPUT and self.text_input:
+                # TEXTINPUT 모드: IME로 조합이 끝난 글자가 한 번에 들어옴
+                if event.text.isprintable():
+                    latency.typed()
+                    self.sim.type_text(event.text)
 
     def handle_menu_click(self, pos):
         """메뉴 화면에서 언어 선택 및 용어 공부 처리"""
@@ -142,53 +311,134 @@ class GameManager:
             if rect.collidepoint(pos):
                 self.selected_language = lang
                 self.study_scroll_offset = 0  # 스크롤 초기화
+                self.study_query = ""
+                self.open_glossary(lang)
                 self.state = "STUDY"
                 break
+
+    def open_glossary(self, language):
+        """
+        선택한 언어의 용어 목록을 한 번 렌더링해 두고 최대 스크롤 계산
+        검색 색인은 언어마다 한 번 작업 스레드에서 만들고, 현재 검색어가 있으면 결과만 다시 적용
+        """
+        if self.glossary is None or self.glossary.language != language:
+            words = self.data_manager.data.get(language, [])
+            self.glossary = GlossaryView(words, language)
+        if self.glossary_index is None or self.glossary_index.language != language:
+            self.glossary_index = GlossaryIndex(self.glossary.words, language).start()
+        self.glossary.set_rows(self.glossary_index.search(self.study_query))
+        self.glossary.prerender()
+        content_area_height = SCREEN_HEIGHT - 150  # 제목과 안내 문구 제외한 높이
+        self.study_max_scroll = self.glossary.max_scroll(content_area_height)
+
+    def set_study_query(self, query):
+        """검색어를 바꾸고 결과를 용어 목록에 반영 (맨 위로 스크롤)"""
+        self.study_query = query
+        self.glossary.set_rows(self.glossary_index.search(query))
+        self.study_scroll_offset = 0
+        self.study_max_scroll = self.glossary.max_scroll(SCREEN_HEIGHT - 150)
+    
+    def govern(self, work):
+        """
+        프레임 작업 시간(초, clock.tick 대기 제외)을 조절기에 알리고 단계가 바뀌면 적용
+        게임 화면에서만 판단 (로딩/메뉴의 일시적인 부하로 단계가 바뀌지 않도록)
+        """
+        if self.governor is None or self.state != "PLAYING":
+            return
+        level = self.governor.observe(work)
+        if level is not None:
+            self.set_quality(level)
+
+    def set_quality(self, level):
+        """
+        품질 단계 적용 (governor.py 참고)
+        규칙에 영향이 있는 단계도 있으므로 녹화 중이면 지금 틱과 함께 기록
+        """
+        self.quality = level
+        if self.governor is not None:
+            self.governor.level = level  # 재생 등 밖에서 바꾼 경우도 조절기가 이어서 판단
+        if self.recorder is not None:
+            self.recorder.record_quality(self.ticks, level)
+        if self.sim is not None:
+            self.sim.set_quality(level)
+        if level >= LEVEL_HUD:
+            self.cursor_visible = True  # 커서를 깜빡이지 않고 계속 표시
+
+    def toggle_overlay(self):
+        """성능 정보 오버레이 켜기/끄기 (켜져 있는 동안 측정도 함께 켜짐)"""
+        if self.state == "LOADING":
+            return  # 작업 스레드가 폰트를 로드하는 중
+        if self.overlay.toggle():
+            self.measure_was_enabled = (profiler.enabled, latency.enabled)
+            profiler.enabled = latency.enabled = True
+        else:
+            profiler.enabled, latency.enabled = self.measure_was_enabled
+        self._scene_key = None  # 오버레이 자리를 지우기 위해 전체 다시 그리기
     
+    def on_words_reloaded(self, languages):
+        """
+        단어 데이터가 바뀌었을 때 호출됨
+        이미 떠 있는 적은 자기 단어를 그대로 유지하고, 새로 나오는 적부터 새 단어를 씀
+        용어집은 해당 언어면 다시 만들고 스크롤 위치는 범위 안에서 유지
+        """
+        if self.sim is not None and self.sim.language in languages:
+            self.sim.reset_sampler()  # 새 단어 목록의 가중치로 다시 시작
+            if self.sim.atlas is not None:
+                self.sim.build_atlas()  # 새 단어로 다시 배치, 렌더링은 게임 중에 조금씩
+        if self.loader.atlas is not None and self.loader.atlas[0] in languages:
+            self.loader.atlas = None  # 로딩 때 그린 아틀라스는 예전 단어
+        if self.glossary_index is not None and self.glossary_index.language in languages:
+            self.glossary_index = None  # 새 단어로 다시 색인
+        if self.glossary is not None and self.glossary.language in languages:
+            language = self.glossary.language
+            self.glossary = None
+            if self.state == "STUDY":
+                self.open_glossary(language)
+                self.study_scroll_offset = min(self.study_scroll_offset, self.study_max_scroll)
+        self._scene_key = None  # 메뉴의 언어 목록 등도 다시 그리기
+    
+    def draw_loading(self):
+        """로딩 화면 (미리 렌더링한 글자와 진행 막대만 그림)"""
+        title = self.loading_labels['title']
+        self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)))
+        bar = pygame.Rect(0, 0, 400, 20)
+        bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        pygame.draw.rect(self.screen, GRAY, bar, 2)
+        fill = bar.inflate(-8, -8)
+        fill.width = int(fill.width * self.loader.progress)
+        pygame.draw.rect(self.screen, GREEN, fill)
+        label = self.loading_labels.get(self.loader.stage)
+        if label is not None:
+            self.screen.blit(label, label.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)))
+
     def draw_study_screen(self):
         """용어 공부 화면 그리기"""
         # 제목
-        title_font = pygame.font.SysFont(FONT_NAME, 40, bold=True)
         title_text = f"{self.selected_language} 용어집"
-        title_surf = title_font.render(title_text, True, WHITE)
+        title_surf = render_text(title_text, 40, WHITE, bold=True)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH//2, 30))
         self.screen.blit(title_surf, title_rect)
+
+        # 검색어와 결과 수 (글자를 치면 바로 검색)
+        search_surf = render_text(f"검색: {self.study_query}_", 20, YELLOW)
+        self.screen.blit(search_surf, (50, 55))
+        if self.study_query and self.glossary is not None:
+            count_surf = render_text(f"{self.glossary.count}개", 20, GRAY)
+            self.screen.blit(count_surf, count_surf.get_rect(topright=(SCREEN_WIDTH - 50, 55)))
         
-        # 용어 목록 가져오기
-        if self.selected_language in self.data_manager.data:
-            words = self.data_manager.data[self.selected_language]
-            
-            word_font = pygame.font.SysFont(FONT_NAME, 28, bold=True)
-            desc_font = pygame.font.SysFont(FONT_NAME, 20)
-            
+        # 용어 목록 (언어 선택 시 미리 렌더링해 둔 타일에서 보이는 부분만 복사)
+        if self.glossary is not None and self.glossary.words:
             start_y = 80
-            line_height = 60
             content_area_height = SCREEN_HEIGHT - 150  # 제목과 안내 문구 제외한 높이
-            
-            # 전체 콘텐츠 높이 계산
-            total_content_height = len(words) * line_height
-            self.study_max_scroll = max(0, total_content_height - content_area_height)
+            total_content_height = self.glossary.total_height
             
             # 스크롤 범위 제한
             self.study_scroll_offset = max(0, min(self.study_scroll_offset, self.study_max_scroll))
             
             # 스크롤 가능한 영역 설정
             scroll_area_top = start_y
-            scroll_area_bottom = SCREEN_HEIGHT - 100
-            
-            # 용어 목록 그리기 (스크롤 오프셋 적용)
-            for i, word_data in enumerate(words):
-                y_pos = start_y + (i * line_height) - self.study_scroll_offset
-                
-                # 화면에 보이는 범위 내에만 그리기
-                if scroll_area_top <= y_pos <= scroll_area_bottom + line_height:
-                    # 단어 (빨간색, 굵게)
-                    word_surf = word_font.render(word_data['word'], True, RED)
-                    self.screen.blit(word_surf, (50, y_pos))
-                    
-                    # 설명 (회색)
-                    desc_surf = desc_font.render(word_data['desc'], True, GRAY)
-                    self.screen.blit(desc_surf, (300, y_pos + 5))
+            list_area = pygame.Rect(0, scroll_area_top, SCREEN_WIDTH, SCREEN_HEIGHT - scroll_area_top)
+            self.glossary.draw(self.screen, list_area, self.study_scroll_offset)
             
             # 스크롤바 그리기 (스크롤이 필요한 경우만)
             if self.study_max_scroll > 0:
@@ -210,84 +460,83 @@ class GameManager:
                                 (scrollbar_x, handle_y, scrollbar_width, handle_height))
         
         # 안내 문구
-        hint_font = pygame.font.SysFont(FONT_NAME, 20)
-        hint_text = "ESC 또는 ENTER: 뒤로가기 | 마우스 휠: 스크롤"
-        hint_surf = hint_font.render(hint_text, True, GRAY)
+        hint_text = "입력: 검색 | ESC: 검색어 지우기/뒤로가기 | ENTER: 뒤로가기 | 마우스 휠: 스크롤"
+        hint_surf = render_text(hint_text, 20, GRAY)
         hint_rect = hint_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
         self.screen.blit(hint_surf, hint_rect)
     
     def start_game(self):
         """게임을 시작 상태로 변경 (카운트다운부터)"""
-        self.state = "COUNTDOWN"
-        self.score = 0
-        self.input_text = ""
-        self.lives = 3  # 생명력 초기화
-        self.enemies.empty()
-        self.bullets.empty()
-        # 플레이어 위치 초기화
-        self.player.rect.centerx = SCREEN_WIDTH // 2
-        # 카운트다운 초기화
-        self.countdown_timer = 0
-        self.countdown_number = 3
+        # 로딩 중 미리 그려둔 아틀라스가 있으면 사용
+        # 아직 그리는 중이면 작업 스레드를 멈추고 덜 그린 아틀라스를 넘겨받아 카운트다운 동안 이어서 그림
+        self.loader.cancel()
+        atlas = None
+        if self.loader.atlas is not None and self.loader.atlas[0] == self.selected_language:
+            atlas = self.loader.atlas[1]
+        self.end_session()
+        sim_seed = self.rng.randrange(2**32)
+        self.sim = Simulation(self.data_manager, self.selected_language,
+                              rng=random.Random(sim_seed),
+                              config=self.sim_config,
+                              headless=self.headless,
+                              physics=self.physics_backend,
+                              collision=self.collision_backend,
+                              atlas=atlas)
+        self.sim.set_quality(self.quality)
+        self.state = self.sim.phase
+        if self.store is not None:
+            self.begin_session(sim_seed)
+        self.player_group = pygame.sprite.RenderUpdates(self.sim.player)
+        # 커서 초기화
+        self.cursor_timer = 0.0
+        self.cursor_visible = True
+
+    def begin_session(self, seed):
+        """저장소에 새 게임 기록 시작, 단어가 끝날 때마다 기록 (큐에 넣기만 함)"""
+        store = self.store
+        language = self.selected_language
+        handle = self.store_session = store.begin_session(language, seed)
+        self.sim.word_listener = lambda word, outcome, type_ms, tick: store.record_word(
+            handle, language, word, outcome, type_ms, tick)
+
+    def end_session(self):
+        """기록 중인 게임의 결과 저장 (게임 오버, 새 게임 시작, 종료할 때)"""
+        if self.store_session is None:
+            return
+        self.store.end_session(self.store_session, self.sim.score, self.sim.lives, self.sim.tick,
+                               self.sim.phase)
+        self.store_session = None
+        self.sim.word_listener = None
 
     def update(self):
-        """게임 상태 업데이트"""
-        if self.state == "COUNTDOWN":
-            # 카운트다운 처리
-            self.countdown_timer += 1
-            if self.countdown_timer >= FPS:  # 1초마다 숫자 감소
-                self.countdown_timer = 0
-                self.countdown_number -= 1
-                if self.countdown_number <= 0:
-                    self.state = "PLAYING"
-                    self.countdown_number = 0
-        
-        elif self.state == "PLAYING":
-            # 1. 적 생성 (약 2초마다)
-            self.spawn_timer += 1
-            if self.spawn_timer >= 120:
-                self.spawn_timer = 0
-                word_data = self.data_manager.get_random_word(self.selected_language)
-                if word_data:
-                    enemy = Enemy(word_data, speed=1 + (self.score // 100)) # 점수 높으면 빨라짐
-                    self.all_sprites.add(enemy)
-                    self.enemies.add(enemy)
+        """게임 상태 업데이트 (고정 간격 한 틱)"""
+        self.ticks += 1
+        if self.state == "LOADING":
+            # 언어 목록과 폰트가 준비되면 메뉴 열기 (아틀라스는 계속 작업 스레드에서)
+            if self.loader.menu_ready.is_set():
+                self.finish_loading()
+            return
+        if self.state in ("COUNTDOWN", "PLAYING"):
+            # 규칙 진행은 시뮬레이션이 담당
+            self.sim.step()
+            self.state = self.sim.phase
+            if self.state == "GAMEOVER":
+                self.end_session()
             
-            # 2. 충돌 체크 (총알 -> 적)
-            hits = pygame.sprite.groupcollide(self.enemies, self.bullets, True, True)
-            for hit in hits:
-                self.score += 10
-                # 적이 총알에 맞아서 제거됨
-            
-            # 3. 게임 오버 체크 (적이 바닥에 닿았는지)
-            for enemy in self.enemies:
-                if enemy.rect.bottom > SCREEN_HEIGHT:
-                    enemy.kill()  # 적 제거
-                    self.lives -= 1  # 생명력 감소
-                    if self.lives <= 0:
-                        # 게임 오버
-                        self.state = "GAMEOVER"
-                        break
-
-            # 플레이어 업데이트 (방향키 이동 비활성화)
-            self.player.update()
-            
-            # 나머지 스프라이트 업데이트
-            self.enemies.update()
-            self.bullets.update()
-            
-            # 커서 깜빡임 업데이트 (약 0.5초마다)
-            self.cursor_timer += 1
-            if self.cursor_timer >= FPS // 2:  # 0.5초마다 토글
-                self.cursor_timer = 0
-                self.cursor_visible = not self.cursor_visible
+            if self.state == "PLAYING" and self.quality < LEVEL_HUD:
+                # 커서 깜빡임 업데이트 (0.5초마다)
+                self.cursor_timer += TIMESTEP
+                if self.cursor_timer >= 0.5:  # 0.5초마다 토글
+                    self.cursor_timer -= 0.5
+                    self.cursor_visible = not self.cursor_visible
 
     def _draw_broken_heart(self, screen, x, y, size):
         """깨진 하트 그리기"""
         # 회색 하트 배경
-        heart_font = pygame.font.SysFont('Arial', size, bold=True)
-        heart_surf = heart_font.render('♥', True, GRAY)
+        heart_surf = render_text('♥', size, GRAY, bold=True, name='Arial')
         screen.blit(heart_surf, (x, y))
+        if self.quality >= LEVEL_HUD:
+            return  # HUD 간소화 단계에서는 금을 그리지 않음
         
         # 깨진 효과 (지그재그 크랙)
         center_x = x + size // 2
@@ -309,21 +558,149 @@ class GameManager:
                         (center_x + size // 4, center_y + size // 6), 2)
 
     def check_input(self):
-        """입력한 단어가 화면의 적과 일치하는지 확인"""
-        for enemy in self.enemies:
-            if self.input_text == enemy.word:
-                # 일치하면 총알 발사 (적은 총알이 맞출 때까지 살아있음)
-                bullet = Bullet(self.player.rect.centerx, self.player.rect.top, enemy)
-                self.all_sprites.add(bullet)
-                self.bullets.add(bullet)
-                break # 한 번에 하나만 발사
+        """엔터 입력: 시뮬레이션에 정답 확인 요청 후 입력 초기화"""
+        self.sim.submit()
+
+    def draw_sprites(self):
+        """적, 하이라이트, 총알, 플레이어 그리기 (새로 그린 영역 목록 반환)"""
+        sim = self.sim
+        dirty = sim.enemies.draw(self.screen)
+        # 입력 중인 접두사와 일치하는 적 하이라이트 (적 영역 안쪽에 그려서 함께 지워짐)
+        for enemy in sim.target_candidates:
+            if enemy.alive():
+                pygame.draw.rect(self.screen, YELLOW, enemy.rect, 2)
+        dirty += sim.bullets.draw(self.screen)
+        dirty += self.player_group.draw(self.screen)
+        return dirty
+
+    def draw_score(self):
+        """점수 표시"""
+        score_surf = text_cache.render(f"Score: {self.sim.score}", self.font, WHITE)
+        self.screen.blit(score_surf, (10, 10))
+
+    def draw_hearts(self):
+        """생명력 표시 (하트) - 화면 오른쪽"""
+        heart_size = 30
+        heart_x = SCREEN_WIDTH - 110
+        heart_y = 10
+        for i in range(self.sim.config.lives):
+            if i < self.sim.lives:
+                # 빨간 하트 (♥)
+                heart_surf = render_text('♥', heart_size, RED, bold=True, name='Arial')
+                self.screen.blit(heart_surf, (heart_x + i * 35, heart_y))
+            else:
+                # 깨진 하트 그리기
+                self._draw_broken_heart(self.screen, heart_x + i * 35, heart_y, heart_size)
+
+    def draw_input_line(self):
+        """입력창과 깜빡이는 커서 표시"""
+        input_text = f"Target: {self.sim.input_text}"
+        input_surf = text_cache.render(input_text, self.font, YELLOW)
+        self.screen.blit(input_surf, (10, SCREEN_HEIGHT - 40))
+        
+        # 깜빡이는 커서 그리기
+        if self.cursor_visible:
+            input_text_width = self.font.size(input_text)[0]
+            cursor_x = 10 + input_text_width
+            cursor_y = SCREEN_HEIGHT - 40
+            cursor_height = self.font.get_height()
+            # 커서를 세로선으로 그리기
+            pygame.draw.line(self.screen, YELLOW, 
+            (cursor_x, cursor_y), 
+            (cursor_x, cursor_y + cursor_height), 3)
+
+    def hud_values(self):
+        """HUD 영역별로 화면에 표시되는 값 (바뀐 영역만 다시 그리기 위함)"""
+        return {
+            'score': self.sim.score,
+            'hearts': self.sim.lives,
+            'input': (self.sim.input_text, self.cursor_visible),
+        }
+
+    def scene_key(self):
+        """
+        현재 화면 내용을 결정하는 값 묶음
+        정적인 화면은 이 값이 그대로면 다시 그릴 필요가 없음
+        """
+        if self.state == "LOADING":
+            return (self.state, self.loader.stage, round(self.loader.progress * 100))
+        if self.state in ("MENU", "STUDY_MENU"):
+            return (self.state, tuple(self.data_manager.get_language_list()))
+        if self.state == "STUDY":
+            return (self.state, self.selected_language, self.study_scroll_offset, self.study_query)
+        if self.state == "COUNTDOWN":
+            return (self.state, self.sim.countdown_number)
+        if self.state == "GAMEOVER":
+            return (self.state, self.sim.score)
+        return (self.state,)
+
+    def draw_playing_dirty(self):
+        """
+        PLAYING 화면을 바뀐 영역만 다시 그리기
+        스프라이트는 이전 위치를 배경으로 지운 뒤 다시 그리고,
+        HUD는 값이 바뀌었거나 스프라이트와 겹칠 때만 다시 그림
+        """
+        sim = self.sim
+        groups = (sim.enemies, sim.bullets, self.player_group)
+        
+        # 이번 프레임에 다시 그려야 할 HUD 영역 판단
+        # HUD 간소화 단계에서는 값이 바뀐 HUD도 몇 프레임마다만 갱신 (스프라이트가 지운 부분은 바로)
+        values = self.hud_values()
+        self._hud_frame += 1
+        refresh = self.quality < LEVEL_HUD or self._hud_frame % GOVERNOR_HUD_INTERVAL == 0
+        sprite_rects = [rect for group in groups for rect in group.spritedict.values() if rect]
+        sprite_rects += [sprite.rect for group in groups for sprite in group]
+        hud_dirty = [name for name, region in self.hud_regions.items()
+                     if (refresh and values[name] != self._hud_values.get(name))
+                     or region.collidelist(sprite_rects) != -1]
+        
+        # 1. 이전 스프라이트 위치 지우기 + 다시 그릴 HUD 영역 비우기
+        for group in groups:
+            group.clear(self.screen, self.background)
+        for name in hud_dirty:
+            self.screen.blit(self.background, self.hud_regions[name], self.hud_regions[name])
+        if self.overlay.visible:
+            self.screen.blit(self.background, self.overlay.rect, self.overlay.rect)
+        
+        # 2. 스프라이트 그리기
+        dirty = self.draw_sprites()
+        
+        # 3. HUD 다시 그리기 (스프라이트 위에 표시)
+        for name in hud_dirty:
+            self.hud_painters[name]()
+            dirty.append(self.hud_regions[name])
+            self._hud_values[name] = values[name]
+        
+        # 4. 성능 정보 오버레이 (맨 위)
+        if self.overlay.visible:
+            dirty.append(self.overlay.draw(self.screen, time.perf_counter()))
+        
+        pygame.display.update(dirty)
+        latency.presented()
 
     def draw(self):
         """화면 그리기"""
+        if self.state == "PLAYING" and INTERPOLATE_RENDERING:
+            # 틱 사이 위치로 보간해서 그리기
+            self.sim.interpolate(self.alpha)
+        
+        if DIRTY_RECT_RENDERING:
+            if self.state == "PLAYING" and self._scene_key == (self.state,):
+                # 게임 화면은 첫 프레임 이후 바뀐 영역만 갱신
+                self.draw_playing_dirty()
+                return
+            key = self.scene_key()
+            if key == self._scene_key and not self.overlay.visible:
+                return  # 바뀐 게 없는 정적 화면은 다시 그리지 않음
+            self._scene_key = key
+        
         self.screen.fill(BLACK)
         
-        if self.state == "MENU":
-            title_surf = self.font.render("언어를 선택하세요", True, WHITE)
+        if self.state == "LOADING":
+            self.draw_loading()
+
+        elif self.state == "MENU":
+            title_surf = text_cache.render("언어를 선택하세요", self.font, WHITE)
             title_rect = title_surf.get_rect(center=(SCREEN_WIDTH//2, 100))
             self.screen.blit(title_surf, title_rect)
             
@@ -342,20 +719,20 @@ class GameManager:
                 button_y = start_y + (i * button_spacing)
                 # 버튼 그리기
                 pygame.draw.rect(self.screen, GRAY, (button_x, button_y, button_width, button_height))
-                text_surf = self.font.render(lang, True, BLACK)
+                text_surf = text_cache.render(lang, self.font, BLACK)
                 text_rect = text_surf.get_rect(center=(button_x + button_width//2, button_y + button_height//2))
                 self.screen.blit(text_surf, text_rect)
             
             # "용어 공부" 버튼 추가
             study_button_y = start_y + len(langs) * button_spacing + 20
             pygame.draw.rect(self.screen, BLUE, (button_x, study_button_y, button_width, button_height))
-            study_text = self.font.render("용어 공부", True, WHITE)
+            study_text = text_cache.render("용어 공부", self.font, WHITE)
             study_text_rect = study_text.get_rect(center=(button_x + button_width//2, study_button_y + button_height//2))
             self.screen.blit(study_text, study_text_rect)
         
         elif self.state == "STUDY_MENU":
             # 용어 공부 언어 선택 메뉴
-            title_surf = self.font.render("용어 공부 - 언어를 선택하세요", True, WHITE)
+            title_surf = text_cache.render("용어 공부 - 언어를 선택하세요", self.font, WHITE)
             title_rect = title_surf.get_rect(center=(SCREEN_WIDTH//2, 80))
             self.screen.blit(title_surf, title_rect)
             
@@ -369,12 +746,12 @@ class GameManager:
             for i, lang in enumerate(langs):
                 button_y = start_y + (i * button_spacing)
                 pygame.draw.rect(self.screen, GRAY, (button_x, button_y, button_width, button_height))
-                text_surf = self.font.render(lang, True, BLACK)
+                text_surf = text_cache.render(lang, self.font, BLACK)
                 text_rect = text_surf.get_rect(center=(button_x + button_width//2, button_y + button_height//2))
                 self.screen.blit(text_surf, text_rect)
             
             # 안내 문구
-            hint_text = self.font.render("ESC: 뒤로가기", True, GRAY)
+            hint_text = text_cache.render("ESC: 뒤로가기", self.font, GRAY)
             hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
             self.screen.blit(hint_text, hint_rect)
         
@@ -383,77 +760,47 @@ class GameManager:
             self.draw_study_screen()
 
         elif self.state == "PLAYING":
-            # 스프라이트 그리기 (적과 총알 먼저)
-            self.enemies.draw(self.screen)
-            self.bullets.draw(self.screen)
-            # 플레이어는 마지막에 그려서 위에 표시
-            self.screen.blit(self.player.image, self.player.rect)
+            # 스프라이트 그리기 (적과 총알 먼저, 플레이어는 마지막에 그려서 위에 표시)
+            self.draw_sprites()
             
-            # UI 그리기 (점수, 입력창)
-            score_surf = self.font.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_surf, (10, 10))
-            
-            # 생명력 표시 (하트) - 화면 오른쪽
-            heart_size = 30
-            heart_x = SCREEN_WIDTH - 110
-            heart_y = 10
-            for i in range(3):
-                if i < self.lives:
-                    # 빨간 하트 (♥)
-                    heart_font = pygame.font.SysFont('Arial', heart_size, bold=True)
-                    heart_surf = heart_font.render('♥', True, RED)
-                    self.screen.blit(heart_surf, (heart_x + i * 35, heart_y))
-                else:
-                    # 깨진 하트 그리기
-                    self._draw_broken_heart(self.screen, heart_x + i * 35, heart_y, heart_size)
-            
-            input_surf = self.font.render(f"Target: {self.input_text}", True, YELLOW)
-            self.screen.blit(input_surf, (10, SCREEN_HEIGHT - 40))
-            
-            # 깜빡이는 커서 그리기
-            if self.cursor_visible:
-                input_text_width = self.font.size(f"Target: {self.input_text}")[0]
-                cursor_x = 10 + input_text_width
-                cursor_y = SCREEN_HEIGHT - 40
-                cursor_height = self.font.get_height()
-                # 커서를 세로선으로 그리기
-                pygame.draw.line(self.screen, YELLOW, 
-                (cursor_x, cursor_y), 
-                (cursor_x, cursor_y + cursor_height), 3)
+            # UI 그리기 (점수, 생명력, 입력창)
+            self.draw_score()
+            self.draw_hearts()
+            self.draw_input_line()
+            self._hud_values = self.hud_values()
         
         elif self.state == "COUNTDOWN":
             # 카운트다운 화면
-            countdown_font = pygame.font.SysFont(FONT_NAME, 120, bold=True)
-            countdown_text = str(self.countdown_number) if self.countdown_number > 0 else "GO!"
-            countdown_color = RED if self.countdown_number > 0 else GREEN
-            countdown_surf = countdown_font.render(countdown_text, True, countdown_color)
+            countdown_number = self.sim.countdown_number
+            countdown_text = str(countdown_number) if countdown_number > 0 else "GO!"
+            countdown_color = RED if countdown_number > 0 else GREEN
+            countdown_surf = render_text(countdown_text, 120, countdown_color, bold=True)
             countdown_rect = countdown_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(countdown_surf, countdown_rect)
             
             # 플레이어 표시 (준비 상태)
-            self.screen.blit(self.player.image, self.player.rect)
+            self.player_group.draw(self.screen)
         
         elif self.state == "GAMEOVER":
             # 게임 오버 화면
-            gameover_font = pygame.font.SysFont(FONT_NAME, 60, bold=True)
-            score_font = pygame.font.SysFont(FONT_NAME, 40)
-            instruction_font = pygame.font.SysFont(FONT_NAME, 25)
-            
             # "Game Over" 텍스트
-            gameover_surf = gameover_font.render("Game Over", True, RED)
+            gameover_surf = render_text("Game Over", 60, RED, bold=True)
             gameover_rect = gameover_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
             self.screen.blit(gameover_surf, gameover_rect)
             
             # 스코어 표시
-            score_text = f"Final Score: {self.score}"
-            score_surf = score_font.render(score_text, True, WHITE)
+            score_text = f"Final Score: {self.sim.score}"
+            score_surf = render_text(score_text, 40, WHITE)
             score_rect = score_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(score_surf, score_rect)
             
             # 안내 문구
             instruction_text = "Press ENTER or SPACE to return to menu"
-            instruction_surf = instruction_font.render(instruction_text, True, GRAY)
+            instruction_surf = render_text(instruction_text, 25, GRAY)
             instruction_rect = instruction_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
             self.screen.blit(instruction_surf, instruction_rect)
 
-        pygame.display.flip()
\ No newline at end of file
+        if self.overlay.visible:
+            self.overlay.draw(self.screen, time.perf_counter())
+        pygame.display.flip()
+        latency.presented()
\ No newline at end of file
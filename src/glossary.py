@@ -0,0 +1,93 @@
+import pygame
+from collections import OrderedDict
+from .settings import *
+from .text_cache import get_font
+
+class GlossaryView:
+    """
+    용어 공부 화면의 용어 목록을 미리 렌더링해 두는 클래스
+    목록을 일정 줄 수씩 타일(Surface)로 나눠 그려두고,
+    스크롤할 때는 보이는 타일의 해당 부분만 blit함
+    타일 수는 제한되어 있어서 용어가 수천 개여도 메모리가 일정함
+    set_rows()로 보여줄 항목(검색 결과)을 정하면 그 항목들만 같은 방식으로 그림
+    """
+    def __init__(self, words, language=None, width=SCREEN_WIDTH, line_height=60,
+                 rows_per_tile=GLOSSARY_ROWS_PER_TILE, max_tiles=GLOSSARY_TILE_CACHE):
+        self.words = words
+        self.language = language
+        self.width = width
+        self.line_height = line_height
+        self.rows_per_tile = rows_per_tile
+        self.tile_height = rows_per_tile * line_height
+        self.max_tiles = max_tiles
+        self.rows = None  # 보여줄 항목의 words 인덱스 (None이면 전체)
+        self._tiles = OrderedDict()
+        self._layout(len(words))
+
+        self.word_font = get_font(28, bold=True)
+        self.desc_font = get_font(20)
+
+    def _layout(self, count):
+        self.count = count
+        self.total_height = count * self.line_height
+        self.tile_count = (count + self.rows_per_tile - 1) // self.rows_per_tile
+
+    def set_rows(self, rows):
+        """보여줄 항목 변경 (None이면 전체), 타일은 보이는 부분부터 다시 그림"""
+        self.rows = rows
+        self._tiles.clear()
+        self._layout(len(self.words) if rows is None else len(rows))
+
+    def max_scroll(self, view_height):
+        """보이는 높이 기준 최대 스크롤 값"""
+        return max(0, self.total_height - view_height)
+
+    def _render_tile(self, index):
+        """index번째 타일 렌더링 (해당 줄들의 단어와 설명)"""
+        tile = pygame.Surface((self.width, self.tile_height))
+        tile.fill(BLACK)
+        first = index * self.rows_per_tile
+        if self.rows is None:
+            entries = self.words[first:first + self.rows_per_tile]
+        else:
+            entries = [self.words[i] for i in self.rows[first:first + self.rows_per_tile]]
+        for row, word_data in enumerate(entries):
+            y = row * self.line_height
+            # 단어 (빨간색, 굵게)
+            tile.blit(self.word_font.render(word_data['word'], True, RED), (50, y))
+            # 설명 (회색)
+            tile.blit(self.desc_font.render(word_data['desc'], True, GRAY), (300, y + 5))
+        return tile
+
+    def get_tile(self, index):
+        """캐시된 타일 반환 (없으면 렌더링, 오래된 타일부터 버림)"""
+        tile = self._tiles.get(index)
+        if tile is None:
+            tile = self._tiles[index] = self._render_tile(index)
+            if len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(index)
+        return tile
+
+    def prerender(self, tiles=None):
+        """앞쪽 타일 미리 렌더링 (언어 선택 시 호출)"""
+        count = min(self.tile_count, tiles if tiles is not None else self.max_tiles)
+        for index in range(count):
+            self.get_tile(index)
+
+    def draw(self, screen, area, scroll):
+        """
+        area 영역에 scroll 위치부터 보이는 부분만 그리기
+        보이는 타일은 스크롤 값에서 바로 계산하므로 전체 목록을 훑지 않음
+        """
+        top = scroll
+        bottom = min(scroll + area.height, self.total_height)
+        y = top
+        while y < bottom:
+            index = y // self.tile_height
+            offset = y - index * self.tile_height
+            height = min(self.tile_height - offset, bottom - y)
+            screen.blit(self.get_tile(index), (area.x, area.y + y - top),
+                        pygame.Rect(0, offset, area.width, height))
+            y += height
@@ -0,0 +1,150 @@
+"""
+용어 공부 화면 검색 (단어 + 설명)
+
+n-gram 역색인을 언어마다 한 번 만들어 두고 글자를 칠 때마다 결과를 갱신함
+- 1글자: 단어 접두사 (정렬된 단어 목록에서 이분 탐색)
+- 2~3글자: 해당 n-gram의 색인 목록이 곧 부분 문자열 결과 (단어나 설명 어디든)
+- 4글자 이상: 직전 결과(검색어가 이어지는 경우)와 가장 드문 3-gram 목록 중 작은 쪽만 확인
+- 결과가 거의 없으면 단어 3-gram을 충분히 공유하는 단어를 오타 후보로 뒤에 붙임
+한글 설명도 글자(음절) 단위 n-gram이라 같은 방식으로 찾음
+색인 구성은 수만 개 항목이면 몇 초 걸리므로 작업 스레드에서 하고, 끝나기 전에는 전체를 훑어서 찾음
+"""
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from .settings import *
+
+def _fold(text):
+    return text.casefold()
+
+class GlossaryIndex:
+    """
+    한 언어 용어 목록의 검색 색인
+    검색 결과는 words의 인덱스 목록 (GlossaryView.set_rows()에 그대로 넘김)
+    """
+    def __init__(self, words, language=None):
+        self.words = words
+        self.language = language
+        self.ready = threading.Event()
+        self.texts = None        # 항목별 "단어\n설명" (소문자)
+        self.folded_words = None
+        self.grams = None        # 2/3-gram -> 항목 인덱스 array (오름차순)
+        self.word_grams = None   # 단어 3-gram (앞에 공백 하나) -> 항목 인덱스 array (오타 후보용)
+        self.prefix_keys = None  # 정렬된 단어 (1글자 접두사 검색용)
+        self.prefix_ids = None
+        self._cache = OrderedDict()  # 최근 검색어 -> (정확히 일치한 결과, 전체 결과)
+        self._last = None            # 직전 검색어
+
+    def start(self):
+        """작업 스레드에서 색인 구성"""
+        threading.Thread(target=self.build, name="glossary-index", daemon=True).start()
+        return self
+
+    def build(self):
+        """
+        색인 구성 (모든 속성을 다 만든 뒤 ready를 알리므로 메인 스레드는 ready 이후에만 사용)
+        """
+        texts = [_fold(f"{word_data['word']}\n{word_data['desc']}") for word_data in self.words]
+        folded_words = [text[:text.index('\n')] for text in texts]
+        grams = defaultdict(list)
+        for i, text in enumerate(texts):
+            entry = {text[j:j + 2] for j in range(len(text) - 1)}
+            entry.update(text[j:j + 3] for j in range(len(text) - 2))
+            for gram in entry:
+                grams[gram].append(i)
+        word_grams = defaultdict(list)
+        for i, word in enumerate(folded_words):
+            padded = f" {word} "
+            for gram in {padded[j:j + 3] for j in range(len(padded) - 2)}:
+                word_grams[gram].append(i)
+        order = sorted(range(len(folded_words)), key=folded_words.__getitem__)
+
+        self.texts = texts
+        self.folded_words = folded_words
+        self.grams = {gram: array('i', ids) for gram, ids in grams.items()}
+        self.word_grams = {gram: array('i', ids) for gram, ids in word_grams.items()}
+        self.prefix_keys = [folded_words[i] for i in order]
+        self.prefix_ids = array('i', order)
+        self._cache.clear()
+        self.ready.set()
+        return self
+
+    def search(self, query):
+        """
+        검색어에 맞는 항목 인덱스 목록 (검색어가 비었으면 None = 전체)
+        정확히 맞는 항목이 앞에 오고, 결과가 적으면 오타 후보가 뒤에 붙음
+        """
+        q = _fold(query)
+        if not q:
+            self._last = None
+            return None
+        if not self.ready.is_set():
+            # 색인이 준비되기 전: 전체를 훑어서 찾음 (오타 후보 없음)
+            return [i for i, word_data in enumerate(self.words)
+                    if q in _fold(word_data['word']) or q in _fold(word_data['desc'])]
+        cached = self._cache.get(q)
+        if cached is None:
+            exact = self._exact(q)
+            results = exact
+            if len(q) >= GLOSSARY_FUZZY_MIN_LENGTH and len(exact) < GLOSSARY_FUZZY_THRESHOLD:
+                seen = set(exact)
+                results = list(exact) + [i for i in self._fuzzy(q) if i not in seen]
+            cached = self._cache[q] = (exact, results)
+            if len(self._cache) > GLOSSARY_SEARCH_CACHE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(q)
+        self._last = q
+        return cached[1]
+
+    def _exact(self, q):
+        """검색어를 단어/설명에 부분 문자열로 포함하는 항목"""
+        if len(q) == 1:
+            # 1글자는 거의 모든 항목에 들어 있으므로 단어 접두사만 (알파벳 순)
+            lo = bisect_left(self.prefix_keys, q)
+            hi = bisect_right(self.prefix_keys, q + '\U0010ffff')
+            return self.prefix_ids[lo:hi]
+        if len(q) <= 3:
+            # n-gram 색인 목록이 곧 결과 (개수가 많으면 순위 정렬은 생략)
+            return self._rank(q, self.grams.get(q, ()))
+        # 검색어 안의 3-gram 중 가장 드문 것의 목록
+        candidates = min((self.grams.get(q[j:j + 3], ()) for j in range(len(q) - 2)), key=len)
+        # 직전 검색어에 글자를 덧붙인 경우 직전 결과 안에서만 찾아도 됨
+        if self._last and q.startswith(self._last) and len(self._last) > 1:
+            previous = self._cache.get(self._last)
+            if previous is not None and len(previous[0]) < len(candidates):
+                candidates = previous[0]
+        texts = self.texts
+        return self._rank(q, [i for i in candidates if q in texts[i]])
+
+    def _rank(self, q, ids):
+        """결과가 적으면 단어 접두사 > 단어 포함 > 설명만 포함 순으로 정렬 (같으면 원래 순서)"""
+        if len(ids) > GLOSSARY_RANK_LIMIT:
+            return ids
+        words = self.folded_words
+
+        def rank(i):
+            word = words[i]
+            return (0 if word.startswith(q) else 1 if q in word else 2, i)
+        return sorted(ids, key=rank)
+
+    def _fuzzy(self, q):
+        """
+        단어 3-gram을 1/3 이상 공유하는 단어 (공유한 수가 많고 길이가 비슷한 순)
+        글자 하나가 바뀌거나 두 글자가 뒤바뀌면 3-gram이 3~4개 깨지므로 절반 기준은 너무 엄격함
+        """
+        padded = f" {q}"  # 치는 중인 검색어라 뒤쪽 공백은 붙이지 않음
+        query_grams = {padded[j:j + 3] for j in range(len(padded) - 2)}
+        counts = defaultdict(int)
+        for gram in query_grams:
+            ids = self.word_grams.get(gram, ())
+            if len(ids) > GLOSSARY_FUZZY_POSTING_LIMIT:
+                continue  # 너무 흔한 3-gram은 후보를 가르는 데 도움이 안 됨
+            for i in ids:
+                counts[i] += 1
+        needed = (len(query_grams) + 2) // 3
+        words = self.folded_words
+        matches = [i for i, shared in counts.items() if shared >= needed]
+        matches.sort(key=lambda i: (-counts[i], abs(len(words[i]) - len(q)), i))
+        return matches[:GLOSSARY_FUZZY_LIMIT]
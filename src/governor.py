@@ -0,0 +1,72 @@
+"""
+프레임 예산 조절기
+
+프레임마다 실제로 일한 시간(이벤트 + update + 그리기, clock.tick 대기 제외)을 FPS 예산과 비교해서
+계속 빠듯하면 품질 단계를 하나 올리고(=품질을 낮추고), 여유가 충분히 오래 이어지면 하나 내림
+- 단계를 올리는 조건: 최근 GOVERNOR_WINDOW 프레임 중 GOVERNOR_OVER_SHARE 이상이 예산의 GOVERNOR_OVER_RATIO 초과
+- 단계를 내리는 조건: GOVERNOR_RECOVER_FRAMES 프레임 연속으로 예산의 GOVERNOR_RECOVER_RATIO 미만
+두 기준 사이에 간격이 있고 단계를 바꾼 뒤에는 창을 비우므로 단계가 오르내리며 떨지 않음
+
+단계 (누적)
+0: 전체 품질
+1: HUD 간소화 - 커서 깜빡임/깨진 하트 금 그리기 생략, 값이 바뀐 HUD도 GOVERNOR_HUD_INTERVAL 프레임마다만 갱신
+2: 총알 간소화 - 곡선 흔들림 끔, 타겟과 GOVERNOR_HOMING_RANGE보다 멀면 방향 재계산 생략
+3: 총알 수 제한 - 동시에 GOVERNOR_MAX_BULLETS개까지, 넘으면 자리가 날 때까지 발사를 미룸 (명중 결과는 같음)
+2단계부터는 게임 결과에 영향이 있으므로 단계가 바뀐 틱을 녹화에 기록함 (재생 때 같은 틱에 적용)
+"""
+from collections import deque
+from .settings import *
+
+LEVEL_NAMES = ('full', 'hud', 'bullets', 'cap')
+LEVEL_HUD = 1
+LEVEL_BULLETS = 2
+LEVEL_CAP = 3
+MAX_LEVEL = len(LEVEL_NAMES) - 1
+
+class FrameGovernor:
+    """최근 프레임 작업 시간으로 품질 단계를 정하는 조절기"""
+    def __init__(self, budget=1.0 / FPS, window=GOVERNOR_WINDOW, max_level=MAX_LEVEL):
+        self.budget = budget
+        self.window = window
+        self.max_level = max_level
+        self.level = 0
+        self.changes = 0       # 지금까지 단계를 바꾼 횟수
+        self._over = deque(maxlen=window)  # 최근 프레임이 예산을 넘었는지
+        self._over_count = 0
+        self._calm = 0         # 여유 있는 프레임이 연속된 수
+
+    def reset(self):
+        """측정 기록만 비움 (단계는 유지)"""
+        self._over.clear()
+        self._over_count = 0
+        self._calm = 0
+
+    def observe(self, work):
+        """
+        프레임 하나의 작업 시간(초) 반영
+        단계가 바뀌면 새 단계, 아니면 None 반환
+        """
+        over = work > self.budget * GOVERNOR_OVER_RATIO
+        if len(self._over) == self.window:
+            self._over_count -= self._over[0]
+        self._over.append(over)
+        self._over_count += over
+        self._calm = self._calm + 1 if work < self.budget * GOVERNOR_RECOVER_RATIO else 0
+
+        if (self.level < self.max_level and len(self._over) == self.window
+                and self._over_count >= self.window * GOVERNOR_OVER_SHARE):
+            return self._change(self.level + 1)
+        if self.level > 0 and self._calm >= GOVERNOR_RECOVER_FRAMES:
+            return self._change(self.level - 1)
+        return None
+
+    def _change(self, level):
+        self.level = level
+        self.changes += 1
+        self.reset()
+        return level
+
+    def describe(self):
+        """오버레이 표시용 문자열"""
+        share = self._over_count / len(self._over) if self._over else 0.0
+        return f"quality {self.level} ({LEVEL_NAMES[self.level]})  over {share:4.0%}  changes {self.changes}"
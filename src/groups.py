@@ -0,0 +1,29 @@
+import pygame
+
+class TrackedGroup(pygame.sprite.RenderUpdates):
+    """
+    스프라이트가 추가/제거(kill 포함)될 때 등록된 추적기에 알려주는 그룹
+    추적기는 add(sprite), remove(sprite) 메서드만 있으면 됨 (색인, 물리 엔진 등)
+    RenderUpdates 기반이라 draw()가 바뀐 영역 목록을 반환함
+    """
+    def __init__(self, *sprites):
+        self.trackers = []
+        super().__init__(*sprites)
+
+    def add_tracker(self, tracker):
+        """추적기 등록 (이미 들어있는 스프라이트도 알려줌)"""
+        self.trackers.append(tracker)
+        for sprite in self.sprites():
+            tracker.add(sprite)
+
+    def add_internal(self, sprite, layer=None):
+        if sprite not in self.spritedict:
+            for tracker in self.trackers:
+                tracker.add(sprite)
+        super().add_internal(sprite, layer)
+
+    def remove_internal(self, sprite):
+        if sprite in self.spritedict:
+            for tracker in self.trackers:
+                tracker.remove(sprite)
+        super().remove_internal(sprite)
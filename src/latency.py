@@ -0,0 +1,158 @@
+"""
+입력 지연 측정기
+
+키 이벤트를 큐에서 꺼낸 시각을 check_input, Bullet 생성, 총알이 처음 그려진 화면, 충돌까지 넘겨서
+단계별 지연(ms)을 고정 크기 링 버퍼에 보관함
+- echo: 글자/백스페이스 키 -> 입력창에 반영된 첫 화면
+- fire: 발사 키(엔터 또는 자동 발사된 글자) -> Bullet 생성
+- shown: 발사 키 -> 총알이 처음 그려진 화면
+- hit: 발사 키 -> 총알이 적에 맞은 틱
+- drain: 프레임마다 이벤트 큐를 비우고 처리한 시간 (이벤트 필터 효과 확인용)
+꺼져 있으면 모든 함수가 바로 반환하므로 비용이 거의 없고, 게임 결과(재생)에도 영향 없음
+"""
+import json
+import time
+from array import array
+from .settings import LATENCY_CAPACITY
+from .profiler import percentile
+
+STAGES = ('echo', 'fire', 'shown', 'hit', 'drain')
+HISTOGRAM_EDGES_MS = (1, 2, 4, 8, 16, 33, 50, 100, 200, 500)
+
+class LatencyTracker:
+    """단계별 입력 지연 링 버퍼"""
+    def __init__(self, capacity=LATENCY_CAPACITY, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.columns = {stage: array('d', bytes(8 * capacity)) for stage in STAGES}
+        self.counts = dict.fromkeys(STAGES, 0)  # 단계별 지금까지 기록한 수
+        self.events = 0       # 지금까지 큐에서 꺼낸 이벤트 수
+        self.event_time = None  # 지금 처리 중인 이벤트를 큐에서 꺼낸 시각
+        self._echo_since = None  # 아직 화면에 안 보인 입력 중 가장 오래된 시각
+        self._unshown = []       # 아직 그려지지 않은 총알과 발사 키 시각
+
+    def record(self, stage, ms):
+        column = self.columns[stage]
+        column[self.counts[stage] % self.capacity] = ms
+        self.counts[stage] += 1
+
+    # --- 이벤트 큐 ---
+    def drained(self, count, started):
+        """events()가 큐를 비우고 처리를 끝냈을 때 호출 (started: 시작 시각)"""
+        if self.enabled:
+            self.events += count
+            self.record('drain', (time.perf_counter() - started) * 1000)
+
+    def receive(self, timestamp=None):
+        """이벤트 처리 시작 (timestamp: 큐에서 꺼낸 시각, 없으면 지금)"""
+        if self.enabled:
+            self.event_time = timestamp if timestamp is not None else time.perf_counter()
+
+    def done(self):
+        self.event_time = None
+
+    # --- 입력 -> 화면 ---
+    def typed(self):
+        """입력창 글자가 바뀌는 키를 처리함"""
+        if self.enabled and self.event_time is not None and self._echo_since is None:
+            self._echo_since = self.event_time
+
+    def fired(self, bullet, event_time=None):
+        """
+        Bullet 생성 (처리 중인 키 이벤트가 있으면 그 시각을 총알에 기록)
+        event_time: 키 이벤트보다 늦게 만든 총알(총알 수 제한으로 대기한 발사)의 원래 입력 시각
+        """
+        if event_time is None:
+            event_time = self.event_time
+        if not self.enabled or event_time is None:
+            return
+        bullet.input_time = event_time
+        self.record('fire', (time.perf_counter() - event_time) * 1000)
+        self._unshown.append((bullet, event_time))
+
+    def hit(self, bullet):
+        """총알이 적에 맞음"""
+        if bullet.input_time is None:
+            return
+        if self.enabled:
+            self.record('hit', (time.perf_counter() - bullet.input_time) * 1000)
+        bullet.input_time = None
+
+    def presented(self):
+        """화면 갱신 직후 호출 (display.flip/update)"""
+        if not self.enabled:
+            self._unshown.clear()
+            self._echo_since = None
+            return
+        now = time.perf_counter()
+        for bullet, input_time in self._unshown:
+            if bullet.alive():
+                self.record('shown', (now - input_time) * 1000)
+        self._unshown.clear()
+        if self._echo_since is not None:
+            self.record('echo', (now - self._echo_since) * 1000)
+            self._echo_since = None
+
+    # --- 결과 ---
+    def samples(self, stage):
+        """단계의 최근 기록 (오래된 것부터, ms)"""
+        column = self.columns[stage]
+        count = self.counts[stage]
+        if count <= self.capacity:
+            return column[:count].tolist()
+        slot = count % self.capacity
+        return (column[slot:] + column[:slot]).tolist()
+
+    def histogram(self, stage, edges=HISTOGRAM_EDGES_MS):
+        """
+        구간별 개수 목록 (edges보다 하나 많음)
+        i번째 값은 edges[i-1] 이상 edges[i] 미만, 마지막은 edges[-1] 이상
+        """
+        bins = [0] * (len(edges) + 1)
+        for value in self.samples(stage):
+            i = 0
+            while i < len(edges) and value >= edges[i]:
+                i += 1
+            bins[i] += 1
+        return bins
+
+    def summary(self):
+        """단계별 개수/평균/p50/p95/p99/최대 (ms)"""
+        result = {}
+        for stage in STAGES:
+            values = sorted(self.samples(stage))
+            if not values:
+                continue
+            result[stage] = {
+                'count': self.counts[stage],
+                'mean': sum(values) / len(values),
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': values[-1],
+            }
+        drains = self.counts['drain']
+        if drains:
+            result['drain']['events_per_frame'] = self.events / drains
+        return result
+
+    def reset(self):
+        self.counts = dict.fromkeys(STAGES, 0)
+        self.events = 0
+        self.event_time = None
+        self._echo_since = None
+        self._unshown.clear()
+
+    def dump(self, path):
+        """요약, 히스토그램, 최근 기록을 JSON으로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'capacity': self.capacity,
+                'summary': self.summary(),
+                'histogram_edges_ms': HISTOGRAM_EDGES_MS,
+                'histograms': {stage: self.histogram(stage) for stage in STAGES},
+                'samples_ms': {stage: self.samples(stage) for stage in STAGES},
+            }, f, indent=2, ensure_ascii=False)
+
+# 게임 전체에서 공유하는 인스턴스
+latency = LatencyTracker()
@@ -0,0 +1,99 @@
+"""
+시작 로딩 (작업 스레드)
+
+창과 로딩 화면을 먼저 띄우고, 오래 걸리는 준비는 작업 스레드에서 진행함
+1. words: 단어 데이터 읽기/검증 (DataManager)
+2. fonts: 시스템 폰트 검색 및 게임에서 쓰는 폰트 로드
+3. atlas: 첫 번째 언어의 적 단어 아틀라스 렌더링
+폰트까지 끝나면 메뉴를 열 수 있고(menu_ready), 아틀라스는 메뉴가 떠 있는 동안 이어서 그림
+아틀라스가 끝나기 전에 게임을 시작하면 cancel()로 멈추고 그리던 아틀라스를 게임 쪽에 넘김
+"""
+import threading
+import time
+import pygame
+from .settings import *
+from .data_manager import DataManager
+from .text_cache import get_font
+from .word_atlas import WordAtlas
+
+class StartupLoader:
+    """
+    시작 준비를 하는 로더
+    stage/progress는 작업 스레드만 쓰고 메인 스레드는 읽기만 하므로 잠금 없이 사용
+    폰트 객체는 모두 작업 스레드에서 만들고 나서 menu_ready를 알리고,
+    아틀라스는 공유 폰트가 아닌 자기 전용 폰트로 그리므로 메뉴가 뜬 뒤 두 스레드가 같은 폰트를 쓰지 않음
+    (SDL_ttf 폰트는 스레드 안전하지 않고 pygame은 렌더링 중 GIL을 놓음)
+    """
+    STAGES = ('words', 'fonts', 'atlas')
+    # 게임에서 쓰는 (크기, 굵기): 메뉴/HUD, 적 단어, 용어집 단어/설명, 성능 오버레이
+    FONTS = ((30, False), (FONT_SIZE_MAIN, True), (28, True), (20, False), (16, False))
+    ATLAS_BATCH = 32  # 아틀라스를 이만큼씩 그리고 진행률 갱신
+
+    def __init__(self, data_path=None, atlas=WORD_ATLAS):
+        self.data_path = data_path
+        self.build_atlas = atlas
+        self.stage = None
+        self.progress = 0.0  # 전체 진행률 (0 ~ 1)
+        self.data_manager = None
+        self.atlas = None     # (언어, WordAtlas)
+        self.error = None     # 작업 스레드에서 난 예외 (메인 스레드에서 다시 발생시킴)
+        self.menu_ready = threading.Event()
+        self.finished = threading.Event()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """작업 스레드에서 로딩 시작"""
+        self._thread = threading.Thread(target=self.run, name="startup-loader", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self):
+        """로딩이 끝날 때까지 대기 (아틀라스 포함)"""
+        self.finished.wait()
+        if self.error is not None:
+            raise self.error
+
+    def cancel(self):
+        """
+        아틀라스 단계를 멈추고 작업 스레드가 끝날 때까지 대기 (한 묶음 그리는 시간 이내)
+        반환 뒤에는 self.atlas를 메인 스레드만 쓰므로 덜 그린 아틀라스를 넘겨받아 이어서 그려도 됨
+        """
+        self._cancel.set()
+        self.wait()
+
+    def _enter(self, stage, fraction=0.0):
+        self.stage = stage
+        self.progress = (self.STAGES.index(stage) + fraction) / len(self.STAGES)
+
+    def run(self):
+        """로딩 전체 진행 (start()를 쓰지 않으면 호출한 스레드에서 바로 진행)"""
+        try:
+            self._enter('words')
+            self.data_manager = DataManager(self.data_path)
+
+            self._enter('fonts')
+            for i, (size, bold) in enumerate(self.FONTS):
+                get_font(size, bold=bold)
+                self._enter('fonts', (i + 1) / len(self.FONTS))
+            self.menu_ready.set()
+
+            self._enter('atlas')
+            languages = self.data_manager.get_language_list()
+            if self.build_atlas and languages:
+                language = languages[0]
+                words = self.data_manager.data.get(language, [])
+                font = pygame.font.SysFont(FONT_NAME, FONT_SIZE_MAIN, bold=True)  # 전용 폰트
+                atlas = WordAtlas([word_data['word'] for word_data in words], font=font)
+                self.atlas = (language, atlas)
+                total = max(1, atlas.stats()['words'])
+                while not atlas.complete and not self._cancel.is_set():
+                    atlas.warm(count=self.ATLAS_BATCH)
+                    self._enter('atlas', atlas.stats()['rendered'] / total)
+            self.stage = None
+            self.progress = 1.0
+        except Exception as e:
+            self.error = e
+            self.menu_ready.set()  # 메인 스레드가 기다리지 않고 오류를 확인하도록
+        finally:
+            self.finished.set()
@@ -0,0 +1,200 @@
+"""
+NumPy 기반 적/총알 물리 백엔드 (선택 사항)
+
+스프라이트마다 update()를 호출하는 대신 모든 적과 총알의 위치, 속도, 타겟,
+곡선 오프셋, 경과 시간을 연속된 배열에 모아 한 번에 갱신함
+스프라이트는 그리기/충돌 판정용 rect만 동기화됨
+NumPy가 없으면 make_physics()가 None을 반환하고 기존 스프라이트 update()를 사용
+"""
+from .settings import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class _Columns:
+    """같은 길이의 배열 묶음 + 슬롯별 스프라이트 (삭제는 마지막 슬롯과 교환)"""
+    def __init__(self, fields, capacity):
+        self.fields = fields
+        self.capacity = capacity
+        self.count = 0
+        self.sprites = []
+        for name, dtype in fields:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, dtype in self.fields:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def append(self, sprite, **values):
+        """스프라이트를 마지막 슬롯에 추가하고 슬롯 번호 반환"""
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        for name, value in values.items():
+            getattr(self, name)[slot] = value
+        self.sprites.append(sprite)
+        sprite.physics_slot = slot
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        """slot을 비우고 마지막 슬롯을 그 자리로 옮김 (옮겨진 원래 슬롯 번호 반환)"""
+        last = self.count - 1
+        if slot != last:
+            for name, _ in self.fields:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            moved.physics_slot = slot
+        self.sprites.pop()
+        self.count -= 1
+        return last
+
+    def view(self, name):
+        """사용 중인 부분만 잘라낸 배열"""
+        return getattr(self, name)[:self.count]
+
+class _Tracker:
+    """TrackedGroup에 등록하는 추적기 (추가/제거를 물리 엔진에 전달)"""
+    def __init__(self, add, remove):
+        self.add = add
+        self.remove = remove
+
+class VectorPhysics:
+    """적과 총알의 이동을 배열 연산으로 일괄 처리하는 물리 엔진"""
+    ENEMY_FIELDS = (
+        ('x', 'f8'), ('y', 'f8'), ('prev_x', 'f8'), ('prev_y', 'f8'),
+        ('speed', 'f8'), ('w', 'i4'), ('h', 'i4'),
+    )
+    BULLET_FIELDS = (
+        ('x', 'f8'), ('y', 'f8'), ('prev_x', 'f8'), ('prev_y', 'f8'),
+        ('vx', 'f8'), ('vy', 'f8'), ('speed', 'f8'), ('curve', 'f8'), ('age', 'f8'),
+        ('target', 'i8'),  # 타겟 적 슬롯 (-1이면 없음)
+        ('w', 'i4'), ('h', 'i4'),
+    )
+
+    def __init__(self, capacity=256):
+        self.enemies = _Columns(self.ENEMY_FIELDS, capacity)
+        self.bullets = _Columns(self.BULLET_FIELDS, capacity)
+        # 스프라이트 그룹에 등록해서 추가/kill() 될 때 배열도 함께 갱신
+        self.enemy_tracker = _Tracker(self.add_enemy, self.remove_enemy)
+        self.bullet_tracker = _Tracker(self.add_bullet, self.remove_bullet)
+
+    # --- 등록/해제 ---
+    def add_enemy(self, enemy):
+        self.enemies.append(enemy, x=enemy.x, y=enemy.y, prev_x=enemy.x, prev_y=enemy.y,
+                            speed=enemy.speed, w=enemy.rect.width, h=enemy.rect.height)
+
+    def remove_enemy(self, enemy):
+        slot = enemy.physics_slot
+        last = self.enemies.remove(slot)
+        # 이 적을 쫓던 총알은 타겟 해제, 옮겨진 적을 쫓던 총알은 새 슬롯으로
+        targets = self.bullets.view('target')
+        targets[targets == slot] = -1
+        if last != slot:
+            targets[targets == last] = slot
+
+    def add_bullet(self, bullet):
+        target = bullet.target
+        slot = target.physics_slot if target is not None and target.alive() else -1
+        self.bullets.append(bullet, x=bullet.x, y=bullet.y, prev_x=bullet.x, prev_y=bullet.y,
+                            vx=bullet.velocity_x, vy=bullet.velocity_y, speed=bullet.speed,
+                            curve=bullet.curve_offset, age=bullet.age, target=slot,
+                            w=bullet.rect.width, h=bullet.rect.height)
+
+    def remove_bullet(self, bullet):
+        self.bullets.remove(bullet.physics_slot)
+
+    # --- 갱신 ---
+    def step(self, dt, curve=True, homing_range=None):
+        """
+        dt초 동안 모든 적/총알 이동
+        curve/homing_range는 Bullet.update()와 같은 의미 (프레임 조절기의 총알 간소화 단계)
+        화면 밖으로 나간 총알 목록 반환 (호출한 쪽에서 kill, 적은 check_floor가 제거)
+        """
+        E, B = self.enemies, self.bullets
+        ex, ey = E.view('x'), E.view('y')
+        E.view('prev_x')[:] = ex
+        E.view('prev_y')[:] = ey
+        # 적: 아래로 이동 (바닥을 지나쳐도 check_floor가 보도록 바닥에 붙잡아 둠, Enemy.update()와 같음)
+        ey += E.view('speed') * dt
+        np.minimum(ey, SCREEN_HEIGHT, out=ey)
+
+        bx, by = B.view('x'), B.view('y')
+        vx, vy = B.view('vx'), B.view('vy')
+        speed = B.view('speed')
+        B.view('prev_x')[:] = bx
+        B.view('prev_y')[:] = by
+
+        # 총알: 살아있는 타겟 쪽으로 속도를 부드럽게 꺾음
+        target = B.view('target')
+        homing = np.nonzero(target >= 0)[0]
+        if homing.size:
+            t = target[homing]
+            dx = ex[t] + E.view('w')[t] / 2 - bx[homing]
+            dy = ey[t] + E.view('h')[t] / 2 - by[homing]
+            distance = np.hypot(dx, dy)
+            moving = distance > 0
+            if homing_range is not None:
+                moving &= distance <= homing_range
+            homing, dx, dy, distance = homing[moving], dx[moving], dy[moving], distance[moving]
+            blend = 1 - 0.7 ** (dt * 60)
+            s = speed[homing] / distance
+            vx[homing] += (dx * s - vx[homing]) * blend
+            vy[homing] += (dy * s - vy[homing]) * blend
+
+        # 곡선 효과 + 위치 갱신
+        age = B.view('age')
+        if curve:
+            bx += (vx + np.sin(age * 6.0) * B.view('curve') * 60) * dt
+        else:
+            bx += vx * dt
+        by += vy * dt
+        age += dt
+
+        # 화면 밖 판정 (rect 기준, 총알만)
+        half_w = B.view('w') // 2
+        half_h = B.view('h') // 2
+        left = np.rint(bx) - half_w
+        top = np.rint(by) - half_h
+        out = ((top + B.view('h') < 0) | (top > SCREEN_HEIGHT) |
+               (left + B.view('w') < 0) | (left > SCREEN_WIDTH))
+        return [B.sprites[i] for i in np.nonzero(out)[0]]
+
+    def sync_rects(self, alpha=1.0):
+        """
+        배열 위치를 스프라이트 rect에 반영
+        alpha < 1이면 이전 틱과 현재 틱 사이 위치 (그리기 전용 보간)
+        """
+        E, B = self.enemies, self.bullets
+        if alpha >= 1.0:
+            ex, ey, bx, by = E.view('x'), E.view('y'), B.view('x'), B.view('y')
+        else:
+            px, py = E.view('prev_x'), E.view('prev_y')
+            ex = px + (E.view('x') - px) * alpha
+            ey = py + (E.view('y') - py) * alpha
+            px, py = B.view('prev_x'), B.view('prev_y')
+            bx = px + (B.view('x') - px) * alpha
+            by = py + (B.view('y') - py) * alpha
+        for sprite, x, y in zip(E.sprites, np.rint(ex).tolist(), np.rint(ey).tolist()):
+            sprite.rect.x = x
+            sprite.rect.y = y
+        for sprite, x, y in zip(B.sprites, np.rint(bx).tolist(), np.rint(by).tolist()):
+            sprite.rect.centerx = x
+            sprite.rect.centery = y
+
+def make_physics(backend=PHYSICS_BACKEND):
+    """설정에 맞는 물리 엔진 생성 ('python'이면 None: 스프라이트 update() 사용)"""
+    if backend == "numpy":
+        if np is None:
+            print("[경고] NumPy가 설치되어 있지 않아 기본 물리 엔진을 사용합니다.")
+            return None
+        return VectorPhysics()
+    return None
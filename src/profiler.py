@@ -0,0 +1,154 @@
+"""
+프레임 구간별 시간 측정기
+
+GameManager의 events/update/draw와 시뮬레이션 세부 단계(생성, 충돌, 이동 등)를
+구간 이름별로 재서 최근 프레임 몇 개를 고정 크기 링 버퍼에 보관함
+꺼져 있을 때 section()은 아무 일도 하지 않는 공용 객체를 돌려주므로 비용이 거의 없음
+
+    with profiler.section('draw'):
+        ...
+"""
+import csv
+import json
+import time
+from array import array
+from .settings import PROFILER_CAPACITY
+
+def percentile(sorted_values, p):
+    """정렬된 값에서 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+class _NullSection:
+    """측정이 꺼져 있을 때 쓰는 빈 구간"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter_ns() - self.start
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0) + elapsed
+        return False
+
+class Profiler:
+    """
+    구간별 프레임 시간 링 버퍼
+    한 프레임 안에서 같은 구간을 여러 번 재면 (틱이 여러 번 돈 update 등) 합산됨
+    'frame'은 이전 프레임 끝부터 이번 프레임 끝까지의 실제 경과 시간
+    """
+    def __init__(self, capacity=PROFILER_CAPACITY, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.columns = {}   # 구간 이름 -> 프레임별 시간 (ms, 링 버퍼)
+        self.frames = 0     # 지금까지 기록한 프레임 수
+        self.gauges = {}    # 마지막으로 기록한 값 (스프라이트 수 등)
+        self._current = {}
+        self._last_end = None
+
+    def section(self, name):
+        """구간 측정용 with 객체 (꺼져 있으면 아무것도 안 함)"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def gauge(self, name, value):
+        """시간이 아닌 값 기록 (오버레이 표시용)"""
+        if self.enabled:
+            self.gauges[name] = value
+
+    def end_frame(self):
+        """이번 프레임의 구간 시간을 링 버퍼에 저장"""
+        if not self.enabled:
+            self._last_end = None
+            return
+        now = time.perf_counter_ns()
+        current, self._current = self._current, {}
+        if self._last_end is not None:
+            current['frame'] = now - self._last_end
+        self._last_end = now
+
+        slot = self.frames % self.capacity
+        for name in current:
+            if name not in self.columns:
+                self.columns[name] = array('d', bytes(8 * self.capacity))
+        for name, column in self.columns.items():
+            column[slot] = current.get(name, 0) / 1e6
+        self.frames += 1
+
+    def reset(self):
+        self.columns.clear()
+        self.gauges.clear()
+        self.frames = 0
+        self._current = {}
+        self._last_end = None
+
+    def samples(self, name):
+        """구간의 최근 기록 (오래된 것부터, ms)"""
+        column = self.columns.get(name)
+        if column is None:
+            return []
+        if self.frames <= self.capacity:
+            return column[:self.frames].tolist()
+        slot = self.frames % self.capacity
+        return (column[slot:] + column[:slot]).tolist()
+
+    def summary(self):
+        """구간별 평균/p50/p95/p99 (ms)"""
+        result = {}
+        for name in self.columns:
+            values = sorted(self.samples(name))
+            result[name] = {
+                'mean': sum(values) / len(values) if values else 0.0,
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': values[-1] if values else 0.0,
+            }
+        return result
+
+    def dump(self, path):
+        """링 버퍼 내용을 파일로 저장 (.csv면 프레임별 표, 그 외는 JSON)"""
+        names = list(self.columns)
+        columns = [self.samples(name) for name in names]
+        first = max(0, self.frames - self.capacity)
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame'] + [f"{name}_ms" for name in names])
+                for i, row in enumerate(zip(*columns)):
+                    writer.writerow([first + i] + [f"{value:.4f}" for value in row])
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'capacity': self.capacity,
+                    'frames': self.frames,
+                    'first_frame': first,
+                    'summary': self.summary(),
+                    'gauges': self.gauges,
+                    'samples_ms': dict(zip(names, columns)),
+                }, f, indent=2, ensure_ascii=False)
+
+# 게임 전체에서 공유하는 인스턴스
+profiler = Profiler()
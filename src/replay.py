@@ -0,0 +1,176 @@
+"""
+입력 녹화 및 재생
+
+GameManager.handle_event로 들어온 키/클릭/휠 입력을 그때의 틱 번호와 함께 기록하고,
+시드와 마지막 결과(상태, 점수, 생명력)를 같이 저장함
+재생할 때는 같은 시드로 게임을 만들고 기록된 틱마다 같은 이벤트를 handle_event에 넣은 뒤
+update()를 최대 속도로 돌려서 결과가 같은지 확인함
+
+    python main.py --record session.json.gz
+    python main.py --replay session.json.gz            # 창 없이 최대 속도
+    python main.py --replay session.json.gz --render   # 화면에 그리면서
+"""
+import gzip
+import json
+import pygame
+
+RECORDING_VERSION = 1
+
+class ReplayMismatch(AssertionError):
+    """재생 결과가 녹화된 결과와 다름"""
+
+class Recording:
+    """
+    녹화 데이터
+    events: [틱 차이, 종류, 값...] 목록 (틱은 바로 앞 이벤트와의 차이로 저장해서 작게 유지)
+    - ['k', key, unicode]: KEYDOWN
+    - ['m', x, y, button]: MOUSEBUTTONDOWN
+    - ['w', x, y]: MOUSEWHEEL
+    - ['t', text]: TEXTINPUT (text_input 모드로 녹화했을 때)
+    - ['q', level]: 프레임 조절기 품질 단계 변경 (입력이 아니라 GameManager.set_quality로 재생)
+    """
+    def __init__(self, seed, events=None, final=None, languages=None, text_input=False):
+        self.seed = seed
+        self.events = events if events is not None else []
+        self.final = final
+        self.languages = languages
+        self.text_input = text_input  # 글자를 TEXTINPUT 이벤트로 받았는지
+        self._last_tick = sum(event[0] for event in self.events)
+
+    def add(self, tick, kind, *values):
+        self.events.append([tick - self._last_tick, kind, *values])
+        self._last_tick = tick
+
+    def timeline(self):
+        """(틱, 종류, 값...) 순서대로 반환"""
+        tick = 0
+        for delta, kind, *values in self.events:
+            tick += delta
+            yield tick, kind, values
+
+    def to_dict(self):
+        return {
+            'version': RECORDING_VERSION,
+            'seed': self.seed,
+            'languages': self.languages,
+            'text_input': self.text_input,
+            'final': self.final,
+            'events': self.events,
+        }
+
+    def save(self, path):
+        """저장 (.gz로 끝나면 gzip 압축)"""
+        text = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'))
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+
+    @classmethod
+    def load(cls, path):
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != RECORDING_VERSION:
+            raise ValueError(f"지원하지 않는 녹화 버전입니다: {data.get('version')}")
+        return cls(data['seed'], data['events'], data.get('final'), data.get('languages'),
+                   data.get('text_input', False))
+
+def outcome(game):
+    """비교에 쓰는 게임 결과"""
+    return {
+        'ticks': game.ticks,
+        'state': game.state,
+        'score': game.sim.score if game.sim else None,
+        'lives': game.sim.lives if game.sim else None,
+    }
+
+class Recorder:
+    """GameManager에 붙여서 입력을 기록하는 녹화기"""
+    def __init__(self, game):
+        self.game = game
+        self.recording = Recording(game.seed, languages=game.data_manager.get_language_list(),
+                                   text_input=game.text_input)
+        game.recorder = self
+        if game.quality:
+            self.recording.add(game.ticks, 'q', game.quality)  # 녹화 시작 전에 정해진 단계
+        # 녹화 중 단어 데이터가 바뀌면 재생 결과가 달라지므로 실시간 반영은 끔
+        game.data_manager.stop_watching()
+
+    def record(self, tick, event):
+        if event.type == pygame.KEYDOWN:
+            self.recording.add(tick, 'k', event.key, event.unicode)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.recording.add(tick, 'm', event.pos[0], event.pos[1], event.button)
+        elif event.type == pygame.MOUSEWHEEL:
+            self.recording.add(tick, 'w', event.x, event.y)
+        elif event.type == pygame.TEXTINPUT:
+            self.recording.add(tick, 't', event.text)
+
+    def record_quality(self, tick, level):
+        self.recording.add(tick, 'q', level)
+
+    def finish(self, path=None):
+        """녹화 종료 (마지막 결과 기록, path가 있으면 저장)"""
+        self.game.recorder = None
+        self.recording.final = outcome(self.game)
+        if path:
+            self.recording.save(path)
+        return self.recording
+
+def make_event(kind, values):
+    """기록된 값으로 pygame 이벤트 다시 만들기"""
+    if kind == 'k':
+        key, unicode = values
+        return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0)
+    if kind == 'm':
+        x, y, button = values
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=button)
+    if kind == 'w':
+        x, y = values
+        return pygame.event.Event(pygame.MOUSEWHEEL, x=x, y=y, flipped=False)
+    if kind == 't':
+        (text,) = values
+        return pygame.event.Event(pygame.TEXTINPUT, text=text)
+    raise ValueError(f"알 수 없는 이벤트 종류: {kind}")
+
+def replay(recording, render=False, check=True, game=None):
+    """
+    녹화를 최대 속도로 재생하고 결과 반환
+    render=True면 틱마다 화면에도 그림, check=True면 결과가 다를 때 ReplayMismatch
+    """
+    from .game_manager import GameManager
+    if game is None:
+        game = GameManager(seed=recording.seed, headless=not render)
+        game.data_manager.stop_watching()  # 재생 중 단어 데이터가 바뀌면 결과가 달라짐
+    game.text_input = recording.text_input
+    languages = game.data_manager.get_language_list()
+    if recording.languages is not None and recording.languages != languages:
+        print("[경고] 녹화할 때와 언어 목록이 다릅니다. 결과가 달라질 수 있습니다.")
+
+    end_tick = recording.final['ticks'] if recording.final else None
+    timeline = recording.timeline()
+    pending = next(timeline, None)
+    while True:
+        # 이번 틱에 들어온 입력을 먼저 처리 (실제 루프에서도 입력 -> update 순서)
+        while pending is not None and pending[0] <= game.ticks:
+            tick, kind, values = pending
+            if kind == 'q':
+                game.set_quality(*values)
+            else:
+                game.handle_event(make_event(kind, values))
+            pending = next(timeline, None)
+        if end_tick is not None and game.ticks >= end_tick:
+            break
+        if end_tick is None and pending is None:
+            break
+        game.update()
+        if render:
+            game.draw()
+            pygame.event.pump()
+
+    result = outcome(game)
+    if check and recording.final is not None:
+        expected = {key: recording.final.get(key) for key in result}
+        if result != expected:
+            raise ReplayMismatch(f"재생 결과가 다릅니다: 녹화 {expected} / 재생 {result}")
+    return result
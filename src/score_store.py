@@ -0,0 +1,251 @@
+"""
+점수 / 단어별 타이핑 기록 저장소 (SQLite, WAL)
+
+게임 루프에서는 기록을 큐에 넣기만 하고, 백그라운드 쓰기 스레드가 모아서 한 트랜잭션으로 저장함
+그래서 update()는 디스크 I/O를 기다리지 않음
+조회(리더보드, 단어별 통계)는 호출한 스레드에서 읽기 전용 연결로 함 (WAL이라 쓰기와 동시에 가능)
+
+    python -m src.score_store --leaderboard --language Python
+    python -m src.score_store --words --language Python --limit 20
+"""
+import argparse
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from itertools import count
+from .settings import *
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    language TEXT NOT NULL,
+    seed INTEGER,
+    started REAL NOT NULL,
+    ended REAL,
+    score INTEGER,
+    lives INTEGER,
+    ticks INTEGER,
+    state TEXT
+);
+CREATE TABLE IF NOT EXISTS word_events (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    language TEXT NOT NULL,
+    word TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    type_ms REAL,
+    tick INTEGER
+);
+CREATE INDEX IF NOT EXISTS sessions_leaderboard ON sessions(language, score DESC);
+CREATE INDEX IF NOT EXISTS word_events_word ON word_events(language, word);
+CREATE INDEX IF NOT EXISTS word_events_session ON word_events(session_id);
+"""
+
+_STOP = object()
+
+def default_path():
+    """프로젝트 data 폴더의 기록 파일 경로"""
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, 'data', SCORE_DB_NAME)
+
+class ScoreStore:
+    """
+    쓰기 지연(write-behind) 저장소
+    begin_session()은 바로 세션 번호(이 프로세스 안에서만 쓰는 값)를 돌려주고,
+    쓰기 스레드가 실제 행 id로 바꿔서 저장함 (여러 프로세스가 같은 파일을 써도 id가 겹치지 않음)
+    """
+    def __init__(self, path=None, batch_size=SCORE_BATCH_SIZE, flush_interval=SCORE_FLUSH_INTERVAL):
+        self.path = path or default_path()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0   # 저장한 기록 수
+        self.batches = 0   # 커밋한 트랜잭션 수
+        self.dropped = 0   # 세션 행이 없어서(시작 기록 실패, 이미 끝난 세션) 버린 기록 수
+        self._handles = count(1)
+        self._queue = queue.Queue()
+        self._reader = None
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with sqlite3.connect(self.path, timeout=SCORE_DB_TIMEOUT) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        conn.close()
+        self._thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+        self._thread.start()
+
+    # --- 기록 (게임 루프에서 호출, 큐에 넣기만 함) ---
+    def begin_session(self, language, seed=None):
+        handle = next(self._handles)
+        self._queue.put(('begin', handle, (language, seed, time.time())))
+        return handle
+
+    def record_word(self, handle, language, word, outcome, type_ms=None, tick=None):
+        self._queue.put(('word', handle, (language, word, outcome, type_ms, tick)))
+
+    def end_session(self, handle, score, lives, ticks, state):
+        self._queue.put(('end', handle, (time.time(), score, lives, ticks, state)))
+
+    def flush(self):
+        """지금까지 넣은 기록이 모두 저장될 때까지 대기"""
+        self._queue.join()
+
+    def close(self):
+        """남은 기록을 저장하고 쓰기 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None, None))
+            self._thread.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    # --- 쓰기 스레드 ---
+    def _next_batch(self):
+        """첫 기록이 올 때까지 기다린 뒤 flush_interval 동안 batch_size개까지 모음"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1][0] is not _STOP:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, conn, rows, batch):
+        """
+        한 트랜잭션으로 저장 (실패하면 롤백되므로 rows는 커밋한 뒤에만 바꿈)
+        세션 행이 없는 번호의 기록은 NULL로 넣지 않고 버림 -> 반환: (저장한 수, 버린 수)
+        """
+        started = {}  # 이 트랜잭션에서 새로 만든 세션 행
+        ended = []
+        words = []
+        written = dropped = 0
+        with conn:
+            for op, handle, values in batch:
+                if op is _STOP:
+                    continue
+                if op == 'begin':
+                    cursor = conn.execute(
+                        "INSERT INTO sessions (language, seed, started) VALUES (?, ?, ?)", values)
+                    started[handle] = cursor.lastrowid
+                    written += 1
+                    continue
+                row = started.get(handle) or rows.get(handle)
+                if row is None or handle in ended:
+                    dropped += 1
+                elif op == 'word':
+                    words.append((row,) + values)
+                    written += 1
+                elif op == 'end':
+                    conn.execute("UPDATE sessions SET ended = ?, score = ?, lives = ?, ticks = ?, "
+                                 "state = ? WHERE id = ?", values + (row,))
+                    ended.append(handle)
+                    written += 1
+            conn.executemany("INSERT INTO word_events (session_id, language, word, outcome, type_ms, "
+                             "tick) VALUES (?, ?, ?, ?, ?, ?)", words)
+        rows.update(started)
+        for handle in ended:
+            rows.pop(handle, None)
+        return written, dropped
+
+    def _run(self):
+        conn = sqlite3.connect(self.path, timeout=SCORE_DB_TIMEOUT)
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 안전
+        rows = {}  # 세션 번호 -> 행 id
+        running = True
+        while running:
+            batch = self._next_batch()
+            running = batch[-1][0] is not _STOP
+            try:
+                for attempt in range(SCORE_WRITE_RETRIES + 1):
+                    try:
+                        written, dropped = self._write(conn, rows, batch)
+                        break
+                    except sqlite3.OperationalError as e:
+                        # 다른 프로세스가 오래 잠그고 있는 경우 등: 잠시 뒤 같은 트랜잭션을 다시 시도
+                        if attempt == SCORE_WRITE_RETRIES:
+                            raise
+                        print(f"[경고] 기록을 저장하지 못해 다시 시도합니다: {e}")
+                        time.sleep(0.1 * (attempt + 1))
+                self.written += written
+                self.batches += 1
+                if dropped:
+                    self.dropped += dropped
+                    print(f"[경고] 시작 기록이 없거나 이미 끝난 게임의 기록 {dropped}개를 버립니다.")
+            except sqlite3.Error as e:
+                print(f"[경고] 기록 {len(batch)}개를 저장하지 못했습니다: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    # --- 조회 ---
+    def _connection(self):
+        if self._reader is None:
+            self._reader = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=SCORE_DB_TIMEOUT)
+            self._reader.row_factory = sqlite3.Row
+        return self._reader
+
+    def leaderboard(self, language=None, limit=10):
+        """끝난 게임 중 점수 순위 (language가 없으면 전체)"""
+        sql = "SELECT id, language, score, ticks, ended FROM sessions WHERE ended IS NOT NULL"
+        params = []
+        if language is not None:
+            sql += " AND language = ?"
+            params.append(language)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self._connection().execute(sql, params)]
+
+    def word_stats(self, language, limit=20, min_seen=1):
+        """단어별 명중/놓침 수, 놓친 비율, 평균 타이핑 시간 (놓친 비율 높은 순)"""
+        sql = """
+            SELECT word,
+                   SUM(outcome = 'hit') AS hits,
+                   SUM(outcome = 'floor') AS misses,
+                   AVG(outcome = 'floor') AS miss_rate,
+                   AVG(type_ms) AS type_ms
+            FROM word_events WHERE language = ?
+            GROUP BY word HAVING COUNT(*) >= ?
+            ORDER BY miss_rate DESC, type_ms DESC LIMIT ?
+        """
+        return [dict(row) for row in self._connection().execute(sql, (language, min_seen, limit))]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense 점수/단어 기록 조회")
+    parser.add_argument('--db', default=None, help="기록 파일 경로 (기본: data/scores.db)")
+    parser.add_argument('--language', default=None)
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--leaderboard', action='store_true', help="점수 순위")
+    parser.add_argument('--words', action='store_true', help="단어별 통계 (--language 필요)")
+    args = parser.parse_args(argv)
+
+    path = args.db or default_path()
+    if not os.path.exists(path):
+        print(f"[오류] 기록 파일이 없습니다: {path}")
+        return 1
+    store = ScoreStore(path)
+    try:
+        if args.words:
+            if args.language is None:
+                parser.error("--words에는 --language가 필요합니다.")
+            for row in store.word_stats(args.language, args.limit):
+                type_ms = f"{row['type_ms']:7.0f}ms" if row['type_ms'] is not None else "      -"
+                print(f"{row['word']:<24} hit {row['hits']:4d}  miss {row['misses']:4d}  "
+                      f"({row['miss_rate']:5.1%})  type {type_ms}")
+        else:
+            for rank, row in enumerate(store.leaderboard(args.language, args.limit), 1):
+                print(f"{rank:3d}. {row['language']:<12} {row['score']:6d}점  "
+                      f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(row['ended']))}")
+    finally:
+        store.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,456 @@
+"""
+세션 서버 (asyncio)
+
+한 프로세스에서 헤드리스 Simulation 여러 개를 고정 틱으로 돌리고, 모든 세션이 DataManager 하나를 공유함
+클라이언트는 로컬 TCP로 접속해서 한 줄에 JSON 하나씩 주고받음
+- 클라이언트 -> 서버: {"type": "join", "language": ..., "seed": ...}, {"type": "word", "text": ...}, {"type": "leave"}
+- 서버 -> 클라이언트: welcome, 틱마다 바뀐 내용만 담은 delta, 밀렸을 때 전체 state,
+  잘못된 메시지에는 {"type": "error", "message": ...} (join이 잘못됐으면 보내고 연결 종료)
+적은 일정한 속도로 아래로만 움직이므로 나타날 때 위치와 속도만 보내고, 사라질 때 id만 보냄
+(클라이언트는 y = y0 + speed * (지금 틱 - 나타난 틱) / tick_rate 로 위치 계산)
+
+    python -m src.server --port 8765
+    python -m src.server --selftest --clients 300 --seconds 10          # 프로세스 안 클라이언트
+    python -m src.server --selftest --clients 100 --seconds 10 --tcp    # 로컬 TCP 클라이언트
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from array import array
+from .settings import *
+from .simulation import Simulation
+from .profiler import percentile
+
+def encode(message):
+    """메시지를 한 줄짜리 JSON 바이트로"""
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def error_message(text):
+    return {'type': 'error', 'message': text}
+
+class Session:
+    """
+    게임 하나 (클라이언트 하나)
+    outbox가 가득 차면 (클라이언트가 느리면) 쌓인 delta를 버리고 다음에 전체 state를 보냄
+    """
+    def __init__(self, session_id, sim):
+        self.id = session_id
+        self.sim = sim
+        self.outbox = asyncio.Queue(maxsize=SERVER_QUEUE_SIZE)
+        self._ids = {}       # 적 -> (세대, 보낸 id)
+        self._next_id = 0
+        self._fired = []     # 이번 틱에 발사한 총알의 타겟 id
+        self._sent = {}      # 마지막으로 보낸 점수/생명력/상태
+        self.resync = False  # 다음에 전체 state를 보내야 하는지
+        self.words = 0       # 받은 단어 수
+
+    def handle(self, message):
+        """클라이언트 메시지 처리"""
+        if message.get('type') != 'word' or self.sim.phase != "PLAYING":
+            return
+        text = message.get('text')
+        if not isinstance(text, str) or len(text) > SERVER_MAX_WORD:
+            return
+        self.words += 1
+        # 입력창에 단어를 친 뒤 엔터를 누른 것과 같음 (check_input)
+        self.sim.input_text = text
+        bullet = self.sim.submit()
+        if bullet is not None:
+            entry = self._ids.get(bullet.target)
+            if entry is not None:
+                self._fired.append(entry[1])
+
+    def _enemy_record(self, eid, enemy):
+        return [eid, enemy.word, enemy.rect.x, enemy.rect.y, round(enemy.speed, 2)]
+
+    def delta(self):
+        """지난 delta 이후 바뀐 내용 (없으면 None)"""
+        sim = self.sim
+        added = []
+        removed = []
+        seen = set()
+        for enemy in sim.enemies:
+            seen.add(enemy)
+            entry = self._ids.get(enemy)
+            if entry is not None and entry[0] == enemy.generation:
+                continue
+            if entry is not None:
+                removed.append(entry[1])  # 같은 객체가 풀에서 다른 적으로 재사용됨
+            eid = self._next_id
+            self._next_id += 1
+            self._ids[enemy] = (enemy.generation, eid)
+            added.append(self._enemy_record(eid, enemy))
+        if len(seen) != len(self._ids):
+            for enemy in [enemy for enemy in self._ids if enemy not in seen]:
+                removed.append(self._ids.pop(enemy)[1])
+
+        message = {}
+        if added:
+            message['add'] = added
+        if removed:
+            message['del'] = removed
+        if self._fired:
+            message['fire'] = self._fired
+            self._fired = []
+        for key, value in (('s', sim.score), ('l', sim.lives), ('p', sim.phase)):
+            if self._sent.get(key) != value:
+                message[key] = self._sent[key] = value
+        if not message:
+            return None
+        message['t'] = sim.tick
+        return message
+
+    def state(self):
+        """전체 상태 (처음 접속했을 때나 밀렸을 때)"""
+        sim = self.sim
+        self.delta()  # id 표를 지금 상태로 맞춤
+        return {
+            'type': 'state',
+            't': sim.tick,
+            'enemies': [self._enemy_record(eid, enemy) for enemy, (_, eid) in self._ids.items()],
+            's': sim.score,
+            'l': sim.lives,
+            'p': sim.phase,
+        }
+
+    def publish(self):
+        """이번 틱 delta를 outbox에 넣음"""
+        if self.resync:
+            if self.outbox.empty():
+                self.resync = False
+                self.outbox.put_nowait(self.state())
+            else:
+                self.delta()  # 아직 밀려 있으면 버림 (다음에 전체 state)
+            return
+        message = self.delta()
+        if message is None:
+            return
+        message['type'] = 'delta'
+        try:
+            self.outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.resync = True
+
+class SessionServer:
+    """
+    여러 세션을 한 이벤트 루프에서 고정 틱으로 진행하는 서버
+    틱마다 모든 세션의 step()을 한 번씩 돌리고 delta를 보냄
+    """
+    def __init__(self, data_manager=None, tick_rate=SERVER_TICK_HZ, config=None):
+        if data_manager is None:
+            from .data_manager import DataManager
+            data_manager = DataManager()
+        self.data_manager = data_manager
+        self.tick_rate = tick_rate
+        self.config = config
+        self.sessions = {}
+        self.running = False
+        self.ticks = 0
+        self.overruns = 0  # 틱 간격 안에 못 끝낸 횟수
+        self._next_session = 0
+        self._tick_ms = array('d', bytes(8 * PROFILER_CAPACITY))
+
+    def open_session(self, language=None, seed=None):
+        """새 게임 세션 생성"""
+        languages = self.data_manager.get_language_list()
+        if language not in languages:
+            language = languages[0]
+        if seed is None:
+            seed = random.randrange(2**32)
+        sim = Simulation(self.data_manager, language, rng=random.Random(seed), config=self.config,
+                         headless=True, tick_rate=self.tick_rate)
+        session = Session(self._next_session, sim)
+        self._next_session += 1
+        self.sessions[session.id] = session
+        return session
+
+    def close_session(self, session):
+        self.sessions.pop(session.id, None)
+        session.sim.reset()  # 남은 적/총알 정리
+
+    def tick(self):
+        """모든 세션 한 틱 진행 후 delta 전송"""
+        start = time.perf_counter()
+        self.data_manager.apply_reload()
+        for session in self.sessions.values():
+            if session.sim.phase != "GAMEOVER":
+                session.sim.step()
+            session.publish()
+        self._tick_ms[self.ticks % len(self._tick_ms)] = (time.perf_counter() - start) * 1000
+        self.ticks += 1
+
+    async def run(self):
+        """틱 루프 (stop()할 때까지)"""
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.tick_rate
+        next_time = loop.time()
+        self.running = True
+        while self.running:
+            self.tick()
+            next_time += interval
+            delay = next_time - loop.time()
+            if delay < 0:
+                # 밀린 틱을 한꺼번에 돌리지 않고 지금부터 다시 맞춤 (느려질 뿐 쌓이지 않음)
+                self.overruns += 1
+                next_time = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def stop(self):
+        self.running = False
+
+    async def handle_connection(self, reader, writer):
+        """TCP 클라이언트 하나 처리 (첫 줄은 join)"""
+        session = None
+        sender = None
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            join = json.loads(line)
+            error = self.check_join(join)
+            if error is not None:
+                writer.write(encode(error_message(error)))
+                await writer.drain()
+                return
+            session = self.open_session(join.get('language'), join.get('seed'))
+            session.outbox.put_nowait(self.welcome(session))
+            sender = asyncio.create_task(self._send_loop(session, writer))
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    # 세션은 유지하고 알려주기만 함 (outbox가 가득 차 있으면 생략)
+                    try:
+                        session.outbox.put_nowait(error_message("메시지는 JSON 객체여야 합니다."))
+                    except asyncio.QueueFull:
+                        pass
+                    continue
+                if message.get('type') == 'leave':
+                    break
+                session.handle(message)
+        except (ConnectionError, ValueError, TypeError):
+            pass  # 끊겼거나 잘못된 메시지면 세션 종료
+        finally:
+            if sender is not None:
+                # 전송 태스크를 정리하고 결과(끊김 예외 포함)를 받아서 버림
+                sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+            if session is not None:
+                self.close_session(session)
+            writer.close()
+
+    def check_join(self, join):
+        """join 메시지 확인 (문제가 있으면 오류 설명, 없으면 None)"""
+        if not isinstance(join, dict) or join.get('type', 'join') != 'join':
+            return "첫 메시지는 join 객체여야 합니다."
+        language = join.get('language')
+        if language is not None and not isinstance(language, str):
+            return "language는 문자열이어야 합니다."
+        seed = join.get('seed')
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            return "seed는 정수여야 합니다."
+        return None
+
+    async def _send_loop(self, session, writer):
+        while True:
+            message = await session.outbox.get()
+            writer.write(encode(message))
+            await writer.drain()
+
+    def welcome(self, session):
+        message = session.state()
+        message.update(type='welcome', session=session.id, language=session.sim.language,
+                       tick_rate=self.tick_rate)
+        return message
+
+    async def serve(self, host=SERVER_HOST, port=SERVER_PORT):
+        """TCP 서버 시작 (asyncio.Server 반환, 틱 루프는 run()으로 따로 실행)"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def stats(self):
+        count = min(self.ticks, len(self._tick_ms))
+        values = sorted(self._tick_ms[:count])
+        return {
+            'sessions': len(self.sessions),
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'tick_mean_ms': sum(values) / len(values) if values else 0.0,
+            'tick_p95_ms': percentile(values, 95),
+            'tick_p99_ms': percentile(values, 99),
+        }
+
+# --- 클라이언트 ---
+class ClientView:
+    """delta를 받아서 화면에 있는 적 목록을 유지하는 클라이언트 쪽 상태"""
+    def __init__(self, tick_rate=SERVER_TICK_HZ):
+        self.tick_rate = tick_rate
+        self.tick = 0
+        self.enemies = {}  # id -> (단어, x, y, 속도, 나타난 틱)
+        self.score = 0
+        self.lives = 0
+        self.phase = None
+        self.messages = 0
+        self.bytes = 0
+
+    def apply(self, message):
+        self.messages += 1
+        self.tick = message.get('t', self.tick)
+        if message['type'] in ('welcome', 'state'):
+            self.tick_rate = message.get('tick_rate', self.tick_rate)
+            self.enemies = {}
+            added = message['enemies']
+        else:
+            added = message.get('add', ())
+            for eid in message.get('del', ()):
+                self.enemies.pop(eid, None)
+        for eid, word, x, y, speed in added:
+            self.enemies[eid] = (word, x, y, speed, self.tick)
+        self.score = message.get('s', self.score)
+        self.lives = message.get('l', self.lives)
+        self.phase = message.get('p', self.phase)
+
+    def position(self, eid):
+        """적의 지금 위치 (나타난 위치와 속도로 계산)"""
+        word, x, y, speed, since = self.enemies[eid]
+        return x, y + speed * (self.tick - since) / self.tick_rate
+
+    def lowest(self, exclude=()):
+        """가장 아래쪽 적의 id"""
+        candidates = [eid for eid in self.enemies if eid not in exclude]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda eid: self.position(eid)[1])
+
+class LocalClient:
+    """같은 프로세스 안에서 세션에 직접 붙는 클라이언트 (테스트/부하 측정용)"""
+    def __init__(self, server, language=None, seed=None):
+        self.server = server
+        self.session = server.open_session(language, seed)
+        self.session.outbox.put_nowait(server.welcome(self.session))
+
+    async def send(self, message):
+        self.session.handle(message)
+
+    async def recv(self):
+        return await self.session.outbox.get()
+
+    async def close(self):
+        self.server.close_session(self.session)
+
+class TcpClient:
+    """로컬 TCP로 접속하는 클라이언트"""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.bytes = 0
+
+    @classmethod
+    async def connect(cls, host=SERVER_HOST, port=SERVER_PORT, language=None, seed=None):
+        reader, writer = await asyncio.open_connection(host, port)
+        client = cls(reader, writer)
+        await client.send({'type': 'join', 'language': language, 'seed': seed})
+        return client
+
+    async def send(self, message):
+        self.writer.write(encode(message))
+        await self.writer.drain()
+
+    async def recv(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("서버 연결이 끊겼습니다.")
+        self.bytes += len(line)
+        return json.loads(line)
+
+    async def close(self):
+        try:
+            await self.send({'type': 'leave'})
+        except ConnectionError:
+            pass
+        self.writer.close()
+
+async def play(client, seconds, reaction, rng):
+    """
+    delta만 보고 게임을 하는 클라이언트 봇
+    가장 아래쪽 적의 단어를 reaction초마다 하나씩 보냄 (같은 적에는 한 번만)
+    """
+    view = ClientView()
+    deadline = time.perf_counter() + seconds
+    next_shot = time.perf_counter() + reaction
+    shot = set()
+    while time.perf_counter() < deadline:
+        try:
+            message = await asyncio.wait_for(client.recv(), timeout=max(0.0, deadline - time.perf_counter()))
+        except asyncio.TimeoutError:
+            break
+        view.apply(message)
+        shot &= view.enemies.keys()
+        now = time.perf_counter()
+        if view.phase == "PLAYING" and now >= next_shot:
+            eid = view.lowest(exclude=shot)
+            if eid is not None:
+                shot.add(eid)
+                await client.send({'type': 'word', 'text': view.enemies[eid][0]})
+                next_shot = now + reaction * rng.uniform(0.5, 1.5)
+    await client.close()
+    return view
+
+async def selftest(clients, seconds, tcp=False, reaction=0.8, port=SERVER_PORT):
+    """서버와 클라이언트 봇 여러 개를 한 이벤트 루프에서 돌리고 틱 시간 통계 반환"""
+    server = SessionServer()
+    ticker = asyncio.create_task(server.run())
+    listener = None
+    if tcp:
+        listener = await server.serve(port=port)
+        connections = [await TcpClient.connect(port=port, seed=i) for i in range(clients)]
+    else:
+        connections = [LocalClient(server, seed=i) for i in range(clients)]
+    views = await asyncio.gather(*(play(client, seconds, reaction, random.Random(i))
+                                   for i, client in enumerate(connections)))
+    stats = server.stats()
+    server.stop()
+    await ticker
+    if listener is not None:
+        listener.close()
+        await listener.wait_closed()
+    stats['clients'] = clients
+    stats['score_mean'] = sum(view.score for view in views) / len(views) if views else 0.0
+    stats['messages_per_client'] = sum(view.messages for view in views) / len(views) if views else 0.0
+    if tcp:
+        stats['bytes_per_client'] = sum(client.bytes for client in connections) / len(connections)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense 세션 서버")
+    parser.add_argument('--host', default=SERVER_HOST)
+    parser.add_argument('--port', type=int, default=SERVER_PORT)
+    parser.add_argument('--selftest', action='store_true', help="프로세스 안 클라이언트 봇으로 부하 측정")
+    parser.add_argument('--clients', type=int, default=100, help="selftest 클라이언트 수")
+    parser.add_argument('--seconds', type=float, default=10.0, help="selftest 시간 (초)")
+    parser.add_argument('--tcp', action='store_true', help="selftest 클라이언트를 로컬 TCP로 접속")
+    args = parser.parse_args(argv)
+
+    if args.selftest:
+        print(asyncio.run(selftest(args.clients, args.seconds, tcp=args.tcp, port=args.port)))
+        return 0
+
+    async def serve_forever():
+        server = SessionServer()
+        listener = await server.serve(args.host, args.port)
+        print(f"[서버] {args.host}:{args.port} 에서 대기 중 (틱 {server.tick_rate}Hz)")
+        async with listener:
+            await server.run()
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
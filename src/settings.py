@@ -18,4 +18,105 @@ YELLOW = (255, 215, 0)
 # --- 폰트 설정 ---
 FONT_NAME = 'Malgun Gothic' 
 FONT_SIZE_MAIN = 24
-FONT_SIZE_DESC = 14 
\ No newline at end of file
+FONT_SIZE_DESC = 14 
+
+# --- 캐시 설정 ---
+TEXT_CACHE_SIZE = 512  # 렌더링된 텍스트 Surface 최대 보관 개수
+
+# --- 입력 설정 ---
+# 입력이 화면의 단어 하나와만 완전히 일치하면 엔터 없이 바로 발사
+AUTO_FIRE_ON_UNIQUE_MATCH = False
+# True면 게임이 쓰는 이벤트만 큐에 받음 (마우스 이동 등이 큐를 채우지 않음)
+INPUT_EVENT_FILTER = True
+# 글자 입력 방식: "keydown" (KEYDOWN의 unicode) 또는 "textinput" (TEXTINPUT 이벤트, IME 조합 글자 지원)
+INPUT_TEXT_MODE = "keydown"
+
+# --- 렌더링 설정 ---
+# True면 게임 화면은 바뀐 영역만 갱신하고, 정적인 화면은 한 번 그린 뒤 다시 그리지 않음
+DIRTY_RECT_RENDERING = True
+
+# --- 프레임 예산 조절 설정 ---
+# 프레임 작업 시간이 FPS 예산을 계속 넘으면 품질 단계를 올리고(HUD -> 총알 -> 총알 수 제한), 여유가 생기면 되돌림
+GOVERNOR = True
+GOVERNOR_WINDOW = 30            # 판단에 쓰는 최근 프레임 수
+GOVERNOR_OVER_RATIO = 0.9       # 예산의 이 비율을 넘으면 빠듯한 프레임
+GOVERNOR_OVER_SHARE = 0.5       # 최근 프레임 중 빠듯한 프레임이 이 비율 이상이면 품질 낮춤
+GOVERNOR_RECOVER_RATIO = 0.5    # 예산의 이 비율 미만이면 여유 있는 프레임
+GOVERNOR_RECOVER_FRAMES = 180   # 여유 있는 프레임이 이만큼 연속되면 품질 한 단계 되돌림 (60FPS 기준 3초)
+GOVERNOR_HUD_INTERVAL = 6       # HUD 간소화 단계에서 바뀐 값을 다시 그리는 프레임 간격
+GOVERNOR_HOMING_RANGE = 300     # 총알 간소화 단계에서 이보다 먼 타겟은 방향을 다시 계산하지 않음 (픽셀)
+GOVERNOR_MAX_BULLETS = 200      # 총알 수 제한 단계에서 동시에 날아가는 최대 총알 수 (넘는 발사는 대기)
+
+# --- 용어 공부 화면 설정 ---
+GLOSSARY_ROWS_PER_TILE = 8   # 미리 렌더링하는 타일 하나의 줄 수
+GLOSSARY_TILE_CACHE = 16     # 메모리에 유지하는 최대 타일 수
+GLOSSARY_SEARCH_CACHE = 32   # 결과를 기억해 두는 최근 검색어 수 (지울 때 바로 이전 결과로)
+GLOSSARY_RANK_LIMIT = 500    # 결과가 이 수 이하일 때만 단어 접두사 > 단어 > 설명 순으로 정렬
+GLOSSARY_FUZZY_MIN_LENGTH = 4  # 오타 후보를 찾는 최소 검색어 길이
+GLOSSARY_FUZZY_THRESHOLD = 5   # 정확히 맞는 결과가 이보다 적으면 오타 후보를 뒤에 붙임
+GLOSSARY_FUZZY_LIMIT = 50      # 오타 후보 최대 수
+GLOSSARY_FUZZY_POSTING_LIMIT = 5000  # 이보다 많은 단어에 들어 있는 3-gram은 오타 후보 계산에서 제외
+
+# --- 시뮬레이션 설정 ---
+SIM_HZ = 60               # 고정 시뮬레이션 틱 (초당 횟수), 렌더링 FPS와 무관
+TIMESTEP = 1.0 / SIM_HZ   # 틱 하나의 길이 (초)
+MAX_FRAME_TIME = 0.25     # 한 프레임에서 따라잡을 최대 시간 (멈췄다 돌아왔을 때 폭주 방지)
+INTERPOLATE_RENDERING = True  # 틱 사이 위치를 보간해서 그리기
+# 적/총알 물리 백엔드: "python" (스프라이트별 update) 또는 "numpy" (배열 일괄 처리, NumPy 필요)
+PHYSICS_BACKEND = "python"
+# 총알-적 충돌 판정: "grid" (공간 해시) 또는 "groupcollide" (모든 쌍 비교)
+COLLISION_BACKEND = "grid"
+GRID_CELL_SIZE = 64       # 공간 해시 칸 크기 (픽셀)
+SPRITE_POOLING = True     # 죽은 적/총알 객체를 모아뒀다가 다시 사용
+ENEMY_IMAGE_CACHE = 256   # 단어별 적 이미지 최대 보관 개수
+# 선택한 언어의 적 이미지를 카운트다운 동안 아틀라스에 미리 렌더링
+WORD_ATLAS = True
+ATLAS_PAGE_SIZE = 1024    # 아틀라스 페이지 한 장의 크기 (픽셀)
+ATLAS_MAX_PAGES = 8       # 최대 페이지 수 (넘치는 단어는 생성할 때 렌더링, 메모리 제한)
+ATLAS_WARM_BUDGET = 0.002         # 카운트다운 중 틱마다 렌더링에 쓰는 최대 시간 (초)
+ATLAS_WARM_BUDGET_PLAYING = 0.0005  # 게임 중 (단어 데이터가 바뀌어 새로 만든 경우)
+
+# --- 단어 데이터 설정 ---
+# data/manifest.json이 있으면 언어별 샤드를 처음 사용할 때 읽고, 최근에 쓴 언어만 메모리에 유지
+WORD_SHARD_RESIDENT = 4   # 동시에 메모리에 올려두는 최대 언어 수
+# 실행 중 단어 파일을 고치면 다시 읽어서 반영 (백그라운드 스레드가 수정 시각/크기를 확인)
+WORD_HOT_RELOAD = True
+WORD_RELOAD_INTERVAL = 1.0  # 확인 간격 (초)
+# 적 단어 뽑기: "adaptive"면 가중치 샘플러 (놓친 단어는 자주, 방금 나온 단어는 드물게), "uniform"이면 균등
+WORD_SAMPLER = "adaptive"
+WORD_WEIGHT_BASE = 8        # 단어 기본 가중치
+WORD_WEIGHT_PER_CHAR = 1    # 글자 하나마다 더하는 가중치 (긴 단어가 조금 더 자주 나옴)
+WORD_WEIGHT_LENGTH_CAP = 16 # 가중치에 반영하는 최대 글자 수
+WORD_MISS_CAP = 4           # 놓친 횟수 상한 (가중치는 최대 1 + 이 값 배)
+WORD_RECENT_WINDOW = 20     # 나온 단어는 이만큼 더 뽑을 동안 가중치를 낮춤
+WORD_RECENT_DIVISOR = 8     # 최근에 나온 단어의 가중치를 나누는 값
+
+# --- 시작 설정 ---
+# True면 창과 로딩 화면을 먼저 띄우고 단어 데이터/폰트/아틀라스 준비는 작업 스레드에서 진행
+BACKGROUND_LOADING = True
+
+# --- 기록 저장 설정 ---
+SCORE_STORE = True                       # 게임 결과와 단어별 기록을 SQLite에 저장
+SCORE_DB_NAME = "scores.db"              # data 폴더 안의 기록 파일 이름
+SCORE_BATCH_SIZE = 256                   # 한 트랜잭션에 저장하는 최대 기록 수
+SCORE_FLUSH_INTERVAL = 0.5               # 첫 기록이 들어온 뒤 더 모으는 시간 (초)
+SCORE_DB_TIMEOUT = 5.0                   # 다른 프로세스가 쓰는 중일 때 잠금을 기다리는 시간 (초)
+SCORE_WRITE_RETRIES = 5                  # 잠금 등으로 저장에 실패한 트랜잭션을 다시 시도하는 횟수
+
+# --- 성능 측정 설정 ---
+PROFILER_CAPACITY = 600   # 구간별 시간을 보관하는 최근 프레임 수 (60FPS 기준 10초)
+LATENCY_CAPACITY = 1000   # 입력 지연 단계별로 보관하는 최근 기록 수
+
+# --- 봇 / 스트레스 테스트 설정 ---
+BOT_WPM = 80              # 봇 타이핑 속도 (분당 단어 수, 1단어 = 5글자)
+BOT_ERROR_RATE = 0.03     # 글자마다 틀리게 칠 확률 (틀리면 백스페이스로 고침)
+BOT_REACTION_DELAY = 0.3  # 새 단어를 고르고 치기 시작할 때까지 걸리는 시간 (초)
+STRESS_SPAWN_RATE = 40.0  # 스트레스 모드 초당 적 생성 수
+STRESS_ENEMY_SPEED = 20.0 # 스트레스 모드 적 속도 (초당 픽셀, 점수와 무관하게 고정)
+
+# --- 세션 서버 설정 ---
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_TICK_HZ = 30      # 서버 세션 틱 (세션마다 이 간격으로 step()하고 delta 전송)
+SERVER_QUEUE_SIZE = 64   # 클라이언트별로 쌓아둘 수 있는 메시지 수 (넘치면 전체 state로 다시 맞춤)
+SERVER_MAX_WORD = 64     # 받는 단어 최대 길이
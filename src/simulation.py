@@ -0,0 +1,475 @@
+import argparse
+import random
+from collections import deque
+import pygame
+from .settings import *
+from .sprites import Enemy, Player, Bullet, SpritePool
+from .groups import TrackedGroup
+from .word_index import EnemyGroup
+from .physics_numpy import make_physics
+from .spatial_hash import SpatialHash, grid_collide, floor_candidates
+from .profiler import profiler
+from .latency import latency
+from .word_atlas import WordAtlas
+from .governor import LEVEL_BULLETS, LEVEL_CAP
+
+class SimulationConfig:
+    """
+    난이도 관련 상수 묶음 (시간은 초, 속도는 초당 픽셀)
+    기본값은 원래 60프레임 기준으로 하드코딩되어 있던 값과 동일
+    """
+    def __init__(self, spawn_interval=2.0, base_enemy_speed=60.0, enemy_speed_step=60.0,
+                 speed_step_score=100, lives=3, score_per_hit=10,
+                 bullet_base_speed=720.0, bullet_speed_jitter=120.0, countdown_seconds=3,
+                 speed_curve=None):
+        self.spawn_interval = spawn_interval        # 적 생성 간격 (초)
+        self.base_enemy_speed = base_enemy_speed    # 기본 적 속도
+        self.enemy_speed_step = enemy_speed_step    # 점수 단계마다 늘어나는 적 속도
+        self.speed_step_score = speed_step_score    # 이 점수마다 적 속도 증가
+        self.lives = lives                          # 시작 생명력
+        self.score_per_hit = score_per_hit          # 적 하나당 점수
+        self.bullet_base_speed = bullet_base_speed  # 총알 기본 속도
+        self.bullet_speed_jitter = bullet_speed_jitter  # 총알 속도 랜덤 폭 (±)
+        self.countdown_seconds = countdown_seconds  # 시작 전 카운트다운
+        # 점수 -> 적 속도 함수 (None이면 점수 단계마다 enemy_speed_step씩 빨라짐)
+        self.speed_curve = speed_curve
+
+    def enemy_speed(self, score):
+        """현재 점수에서 새로 나오는 적의 속도"""
+        if self.speed_curve is not None:
+            return self.speed_curve(score)
+        return self.base_enemy_speed + self.enemy_speed_step * (score // self.speed_step_score)
+
+class Simulation:
+    """
+    게임 규칙(적 생성, 이동, 충돌, 생명력, 점수)만 담당하는 시뮬레이션 코어
+    화면이나 clock.tick 없이 step() 한 번이 고정 길이(1 / tick_rate 초) 한 틱이라
+    헤드리스로 최대 속도 실행 가능하고, 렌더링 FPS와 상관없이 결과가 같음
+    GameManager는 이 객체를 그리기만 함
+    """
+    def __init__(self, data_manager, language, rng=None, config=None, headless=False,
+                 tick_rate=SIM_HZ, physics=PHYSICS_BACKEND, collision=COLLISION_BACKEND,
+                 pooling=SPRITE_POOLING, atlas=None, sampler=WORD_SAMPLER):
+        self.data_manager = data_manager
+        self.language = language
+        self.rng = rng if rng is not None else random.Random()
+        self.config = config or SimulationConfig()
+        self.headless = headless  # True면 스프라이트 이미지를 렌더링하지 않음
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.sampler_mode = sampler  # "adaptive"면 가중치 샘플러, 아니면 균등하게 단어 뽑기
+        self._interpolated = False  # 그리기용으로 rect를 보간해 둔 상태인지
+        # 적이 맞거나 바닥에 닿을 때마다 호출: word_listener(단어, 결과, 타이핑 시간 ms, 틱)
+        self.word_listener = None
+        self.set_quality(0)
+
+        if not pygame.font.get_init():
+            # 적 크기 계산에 폰트가 필요 (디스플레이는 필요 없음)
+            pygame.font.init()
+
+        # 스프라이트 그룹
+        self.all_sprites = pygame.sprite.Group()
+        self.enemies = EnemyGroup()  # 단어 접두사 색인을 함께 관리
+        self.bullets = TrackedGroup()  # draw()가 바뀐 영역 반환
+        self.player = Player()
+        self.all_sprites.add(self.player)
+
+        # 적 이미지 아틀라스 (카운트다운 동안 미리 렌더링, 헤드리스면 사용 안 함)
+        # atlas를 주면 (로딩 중 같은 언어로 미리 그려둔 것) 그대로 사용
+        self.atlas = None
+        if WORD_ATLAS and not headless:
+            if atlas is not None:
+                self.atlas = atlas
+            else:
+                self.build_atlas()
+
+        # 죽은 적/총알을 다시 쓰는 풀 (게임이 진행돼도 새 객체를 만들지 않음)
+        self.enemy_pool = SpritePool(Enemy) if pooling else None
+        self.bullet_pool = SpritePool(Bullet) if pooling else None
+
+        # 물리 백엔드 ("numpy"면 적/총알 이동을 배열로 일괄 처리, 아니면 None)
+        self.physics = make_physics(physics)
+        if self.physics:
+            self.enemies.add_tracker(self.physics.enemy_tracker)
+            self.bullets.add_tracker(self.physics.bullet_tracker)
+
+        # 충돌 판정 ("grid"면 공간 해시로 후보를 좁힘, 아니면 groupcollide로 모든 쌍 비교)
+        self.enemy_grid = self.bullet_grid = None
+        if collision == "grid":
+            self.enemy_grid = SpatialHash()
+            self.bullet_grid = SpatialHash()
+            self.enemies.add_tracker(self.enemy_grid)
+            self.bullets.add_tracker(self.bullet_grid)
+
+        self.reset()
+
+    def reset(self):
+        """게임을 시작 상태로 초기화 (카운트다운부터)"""
+        self.phase = "COUNTDOWN"
+        self.tick = 0  # 지금까지 진행한 틱 수
+        self.score = 0
+        self.lives = self.config.lives
+        self.input_text = ""  # 사용자가 현재 타이핑 중인 글자
+        self.target_candidates = []  # 현재 입력과 접두사가 일치하는 적들 (하이라이트용)
+        # 남은 적/총알은 모든 그룹에서 제거 (풀을 쓰면 풀로 돌아감)
+        for sprite in self.enemies.sprites() + self.bullets.sprites():
+            sprite.kill()
+        # 플레이어 위치 초기화
+        self.player.rect.centerx = SCREEN_WIDTH // 2
+        # 카운트다운 / 적 생성 타이머 초기화 (틱 단위로 세서 누적 오차 없음)
+        self.countdown_timer = 0
+        self.countdown_number = self.config.countdown_seconds
+        self.spawn_timer = 0
+        self.spawn_debt = 0.0  # 틱보다 짧은 생성 간격일 때 밀린 생성 수
+        # 총알 수 제한 단계에서 자리가 없어 기다리는 발사 (적, 적 generation, 입력 시각)
+        self.pending_shots = deque()
+        self.reset_sampler()
+
+    def set_quality(self, level):
+        """
+        프레임 조절기 품질 단계 중 규칙에 영향이 있는 부분 적용 (governor.py 참고)
+        결과가 달라지므로 게임 중에는 틱 사이에서만 바꾸고 녹화에 기록함
+        """
+        self.quality = level
+        simple = level >= LEVEL_BULLETS
+        self.bullet_curve = not simple
+        self.homing_range = GOVERNOR_HOMING_RANGE if simple else None
+        self.max_bullets = GOVERNOR_MAX_BULLETS if level >= LEVEL_CAP else None
+
+    def reset_sampler(self):
+        """
+        단어 샘플러를 기본 가중치로 새로 받음 (새 게임, 또는 이 언어의 단어 데이터가 바뀌었을 때)
+        이미 떠 있는 적의 단어 인덱스는 예전 목록 기준이라 결과를 반영하지 않음
+        """
+        self.sampler = None
+        if self.sampler_mode == "adaptive":
+            self.sampler = self.data_manager.get_sampler(self.language)
+        for enemy in self.enemies:
+            enemy.word_index = None
+
+    # --- 입력 처리 ---
+    def type_text(self, text):
+        """글자 입력 추가"""
+        self.input_text += text
+        self.update_candidates()
+
+    def backspace(self):
+        """마지막 글자 삭제"""
+        self.input_text = self.input_text[:-1]
+        self.update_candidates()
+
+    def submit(self):
+        """엔터: 정답 확인 후 입력 초기화 (발사한 총알 반환, 없으면 None)"""
+        bullet = self.check_input()
+        self.input_text = ""
+        self.update_candidates()
+        return bullet
+
+    def update_candidates(self):
+        """입력이 바뀔 때마다 접두사가 일치하는 적 목록 갱신 (트라이 조회)"""
+        if not self.input_text:
+            self.target_candidates = []
+            return
+        self.target_candidates = self.enemies.match(self.input_text)
+
+        # 자동 발사: 입력이 단어 하나와만 완전히 일치하면 바로 발사
+        if (AUTO_FIRE_ON_UNIQUE_MATCH and len(self.target_candidates) == 1
+                and self.target_candidates[0].word == self.input_text):
+            self.check_input()
+            self.input_text = ""
+            self.target_candidates = []
+
+    def check_input(self):
+        """입력한 단어가 화면의 적과 일치하는지 확인"""
+        # 트라이에서 단어가 정확히 일치하는 적 중 가장 먼저 나온 적 선택
+        enemy = self.enemies.find_word(self.input_text)
+        if enemy:
+            if enemy.typed_tick is None:
+                enemy.typed_tick = self.tick
+            if self.pending_shots or not self.has_bullet_slot():
+                # 총알 수 제한 단계: 자리가 날 때까지 발사를 미룸 (step()에서 순서대로 발사)
+                self.pending_shots.append((enemy, enemy.generation, latency.event_time))
+                return None
+            # 일치하면 총알 발사 (적은 총알이 맞출 때까지 살아있음)
+            # 한 번에 하나만 발사
+            return self.fire(enemy)
+        return None
+
+    def has_bullet_slot(self):
+        return self.max_bullets is None or len(self.bullets) < self.max_bullets
+
+    def fire(self, enemy, event_time=None):
+        """적을 쫓는 총알 하나 생성"""
+        if self._interpolated:
+            # 그리기 때 보간된 rect로 조준하면 프레임 타이밍에 따라 궤적이 달라짐 (재생과 불일치)
+            self.sync_rects()
+        bullet = self.create(self.bullet_pool, Bullet,
+                             self.player.rect.centerx, self.player.rect.top, enemy,
+                             speed=self.config.bullet_base_speed,
+                             jitter=self.config.bullet_speed_jitter,
+                             rng=self.rng, render=not self.headless)
+        self.all_sprites.add(bullet)
+        self.bullets.add(bullet)
+        latency.fired(bullet, event_time)
+        return bullet
+
+    def fire_pending(self):
+        """
+        기다리던 발사를 빈 자리만큼 순서대로 발사
+        그 사이 적이 바닥에 닿았거나 다른 총알에 맞았으면 총알을 만들 때처럼 건너뜀
+        """
+        pending = self.pending_shots
+        while pending and self.has_bullet_slot():
+            enemy, generation, event_time = pending.popleft()
+            if enemy.alive() and enemy.generation == generation:
+                self.fire(enemy, event_time)
+
+    # --- 규칙 진행 ---
+    def seconds_to_ticks(self, seconds):
+        """초 단위 시간을 틱 수로 변환 (최소 1틱)"""
+        return max(1, round(seconds * self.tick_rate))
+
+    def step(self):
+        """한 틱 진행"""
+        if self._interpolated:
+            # 보간된 rect를 실제 위치로 되돌린 뒤 판정
+            self.sync_rects()
+        
+        if self.atlas is not None and not self.atlas.complete:
+            # 적이 나오기 전에 이번 언어의 단어 이미지를 조금씩 미리 렌더링
+            self.atlas.warm(ATLAS_WARM_BUDGET if self.phase == "COUNTDOWN" else ATLAS_WARM_BUDGET_PLAYING)
+
+        if self.phase == "COUNTDOWN":
+            # 카운트다운 처리
+            self.countdown_timer += 1
+            if self.countdown_timer >= self.tick_rate:  # 1초마다 숫자 감소
+                self.countdown_timer = 0
+                self.countdown_number -= 1
+                if self.countdown_number <= 0:
+                    self.phase = "PLAYING"
+                    self.countdown_number = 0
+
+        elif self.phase == "PLAYING":
+            # 1. 적 생성 (약 2초마다)
+            with profiler.section('spawn'):
+                self.update_spawning()
+            # 2. 충돌 체크 (총알 -> 적)
+            with profiler.section('collide'):
+                self.resolve_collisions()
+            # 3. 게임 오버 체크 (적이 바닥에 닿았는지)
+            with profiler.section('floor'):
+                self.check_floor()
+            if self.pending_shots:
+                self.fire_pending()
+            # 4. 스프라이트 이동
+            with profiler.section('move'):
+                self.move_sprites()
+
+        self.tick += 1
+
+    def update_spawning(self):
+        """생성 타이머 진행, 간격이 되면 적 생성"""
+        per_tick = 1.0 / (self.config.spawn_interval * self.tick_rate) if self.config.spawn_interval > 0 else 0.0
+        if per_tick > 1.0:
+            # 간격이 한 틱보다 짧으면 한 틱에 여러 마리 생성 (스트레스 테스트용)
+            self.spawn_debt += per_tick
+            while self.spawn_debt >= 1.0:
+                self.spawn_debt -= 1.0
+                self.spawn_enemy()
+            return
+        self.spawn_timer += 1
+        if self.spawn_timer >= self.seconds_to_ticks(self.config.spawn_interval):
+            self.spawn_timer = 0
+            self.spawn_enemy()
+
+    def resolve_collisions(self):
+        """총알에 맞은 적과 총알 제거 후 점수 추가"""
+        if self.enemy_grid is not None:
+            hits = grid_collide(self.enemy_grid, self.bullet_grid)
+        else:
+            hits = pygame.sprite.groupcollide(self.enemies, self.bullets, True, True)
+        for hit, bullets in hits.items():
+            # 적이 총알에 맞아서 제거됨
+            self.score_hit(hit)
+            if latency.enabled:
+                for bullet in bullets:
+                    latency.hit(bullet)
+        return hits
+
+    def score_hit(self, enemy):
+        """적 하나 명중 처리 (점수, 단어 결과)"""
+        self.score += self.config.score_per_hit
+        self.word_done(enemy, 'hit')
+
+    def check_floor(self):
+        """바닥에 닿은 적 제거 후 생명력 감소"""
+        if self.enemy_grid is not None:
+            # 바닥 줄 칸에 있는 적만 확인 (순서는 그룹 순서와 같음)
+            enemies = floor_candidates(self.enemy_grid, SCREEN_HEIGHT)
+        else:
+            enemies = self.enemies
+        for enemy in enemies:
+            if enemy.rect.bottom > SCREEN_HEIGHT:
+                self.word_done(enemy, 'floor')
+                enemy.kill()  # 적 제거
+                self.lives -= 1  # 생명력 감소
+                if self.lives <= 0:
+                    # 게임 오버
+                    self.phase = "GAMEOVER"
+                    break
+
+    def move_sprites(self):
+        """플레이어, 적, 총알 업데이트"""
+        # 플레이어 업데이트 (방향키 이동 비활성화)
+        self.player.update()
+
+        # 나머지 스프라이트 업데이트
+        if self.physics:
+            # 배열로 한 번에 이동한 뒤 화면 밖으로 나간 총알 제거
+            for sprite in self.physics.step(self.dt, self.bullet_curve, self.homing_range):
+                sprite.kill()
+            self.physics.sync_rects()
+        else:
+            self.enemies.update(self.dt)
+            self.bullets.update(self.dt, self.bullet_curve, self.homing_range)
+
+        # 이동한 스프라이트의 격자 위치 갱신 (칸이 바뀐 것만)
+        if self.enemy_grid is not None:
+            self.enemy_grid.refresh(self.enemies)
+            self.bullet_grid.refresh(self.bullets)
+
+    def sync_rects(self):
+        """모든 적/총알의 rect를 실제 위치로 맞춤"""
+        self._interpolated = False
+        if self.physics:
+            self.physics.sync_rects()
+            return
+        for enemy in self.enemies:
+            enemy.sync_rect()
+        for bullet in self.bullets:
+            bullet.sync_rect()
+
+    def interpolate(self, alpha):
+        """
+        그리기 직전에 호출: 이전 틱과 현재 틱 사이(alpha 0~1) 위치로 rect 이동
+        다음 step() 시작 시 실제 위치로 되돌리므로 판정 결과에는 영향 없음
+        """
+        self._interpolated = True
+        if self.physics:
+            self.physics.sync_rects(alpha)
+            return
+        for enemy in self.enemies:
+            enemy.interpolate(alpha)
+        for bullet in self.bullets:
+            bullet.interpolate(alpha)
+
+    def build_atlas(self):
+        """현재 언어의 단어로 아틀라스 배치 (렌더링은 step()에서 나눠서)"""
+        words = self.data_manager.data.get(self.language, [])
+        self.atlas = WordAtlas([word_data['word'] for word_data in words])
+
+    def create(self, pool, sprite_class, *args, **kwargs):
+        """풀이 있으면 풀에서 꺼내고, 없으면 새로 생성"""
+        if pool is not None:
+            return pool.acquire(*args, **kwargs)
+        return sprite_class(*args, **kwargs)
+
+    def spawn_enemy(self):
+        """현재 언어에서 단어를 뽑아 적 생성"""
+        index = None
+        if self.sampler is not None:
+            index, word_data = self.sampler.draw(self.rng)
+        else:
+            word_data = self.data_manager.get_random_word(self.language, rng=self.rng)
+        if not word_data:
+            return None
+        # 점수 높으면 빨라짐
+        speed = self.config.enemy_speed(self.score)
+        enemy = self.create(self.enemy_pool, Enemy, word_data, speed=speed, rng=self.rng,
+                            render=not self.headless, atlas=self.atlas)
+        enemy.spawn_tick = self.tick
+        enemy.word_index = index
+        self.all_sprites.add(enemy)
+        self.enemies.add(enemy)
+        # 새 적도 입력 중인 접두사와 맞으면 하이라이트
+        if self.input_text:
+            self.target_candidates = self.enemies.match(self.input_text)
+        return enemy
+
+    def word_done(self, enemy, outcome):
+        """
+        단어 하나의 결과를 샘플러 가중치에 반영하고 word_listener에 알림
+        outcome: 'hit' (총알에 맞음) 또는 'floor' (바닥에 닿음)
+        타이핑 시간은 적이 나타난 틱부터 그 단어로 처음 발사한 틱까지 (발사하지 않았으면 None)
+        """
+        if enemy.word_index is not None:
+            self.sampler.record(enemy.word_index, outcome)
+        if self.word_listener is None:
+            return
+        type_ms = None
+        if enemy.typed_tick is not None:
+            type_ms = (enemy.typed_tick - enemy.spawn_tick) * 1000 / self.tick_rate
+        self.word_listener(enemy.word, outcome, type_ms, self.tick)
+
+    def run(self, ticks, policy=None):
+        """
+        최대 ticks 만큼 진행 (게임 오버되면 중단)
+        policy(sim)가 주어지면 매 틱 전에 호출되어 입력을 넣을 수 있음
+        """
+        for _ in range(ticks):
+            if self.phase == "GAMEOVER":
+                break
+            if policy:
+                policy(self)
+            self.step()
+        return self
+
+    def summary(self):
+        """결과 요약"""
+        return {
+            'phase': self.phase,
+            'ticks': self.tick,
+            'score': self.score,
+            'lives': self.lives,
+            'enemies': len(self.enemies),
+            'bullets': len(self.bullets),
+        }
+
+def run_headless(seed, ticks, language=None, config=None, data_manager=None, policy=None,
+                 physics=PHYSICS_BACKEND, collision=COLLISION_BACKEND):
+    """시드 고정된 게임 하나를 화면 없이 실행하고 결과 요약 반환"""
+    if data_manager is None:
+        from .data_manager import DataManager
+        data_manager = DataManager()
+    if language is None:
+        language = data_manager.get_language_list()[0]
+    sim = Simulation(data_manager, language, rng=random.Random(seed),
+                     config=config, headless=True, physics=physics, collision=collision)
+    sim.run(ticks, policy)
+    result = sim.summary()
+    result['seed'] = seed
+    return result
+
+def main(argv=None):
+    """헤드리스 시뮬레이션 실행 (CI / 밸런스 조정용)"""
+    parser = argparse.ArgumentParser(description="Algo-Defense 헤드리스 시뮬레이션")
+    parser.add_argument('--seed', type=int, default=0, help="첫 게임 시드")
+    parser.add_argument('--games', type=int, default=1, help="실행할 게임 수")
+    parser.add_argument('--ticks', type=int, default=SIM_HZ * 60 * 5, help="게임당 최대 틱 수")
+    parser.add_argument('--language', default=None, help="사용할 언어 (기본: 첫 번째 언어)")
+    parser.add_argument('--physics', default=PHYSICS_BACKEND, choices=("python", "numpy"),
+                        help="적/총알 물리 백엔드")
+    parser.add_argument('--collision', default=COLLISION_BACKEND, choices=("grid", "groupcollide"),
+                        help="충돌 판정 방식")
+    args = parser.parse_args(argv)
+
+    from .data_manager import DataManager
+    data_manager = DataManager()
+    for i in range(args.games):
+        result = run_headless(args.seed + i, args.ticks, args.language,
+                              data_manager=data_manager, physics=args.physics,
+                              collision=args.collision)
+        print(result)
+
+if __name__ == "__main__":
+    main()
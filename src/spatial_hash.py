@@ -0,0 +1,127 @@
+from .settings import *
+
+class SpatialHash:
+    """
+    균일 격자 공간 해시
+    스프라이트 rect가 걸친 칸마다 스프라이트를 등록해 두고,
+    이동 후에는 걸친 칸 범위가 바뀐 스프라이트만 다시 등록함
+    TrackedGroup 추적기로 등록하면 추가/kill() 시 자동으로 갱신됨
+    """
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}    # (칸 x, 칸 y) -> {스프라이트: None}
+        self.ranges = {}   # 스프라이트 -> 걸친 칸 범위 (x0, y0, x1, y1)
+        self.order = {}    # 스프라이트 -> 추가된 순서 (그룹 순회 순서와 같음)
+        self._counter = 0
+
+    def _range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _insert(self, sprite, cell_range):
+        x0, y0, x1, y1 = cell_range
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = {}
+                cell[sprite] = None
+
+    def _erase(self, sprite, cell_range):
+        x0, y0, x1, y1 = cell_range
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells[(cx, cy)]
+                del cell[sprite]
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def add(self, sprite):
+        """스프라이트 등록"""
+        cell_range = self._range(sprite.rect)
+        self.ranges[sprite] = cell_range
+        self.order[sprite] = self._counter
+        self._counter += 1
+        self._insert(sprite, cell_range)
+
+    def remove(self, sprite):
+        """스프라이트 등록 해제"""
+        cell_range = self.ranges.pop(sprite, None)
+        if cell_range is None:
+            return
+        del self.order[sprite]
+        self._erase(sprite, cell_range)
+
+    def refresh(self, sprites):
+        """이동한 스프라이트 중 걸친 칸이 바뀐 것만 다시 등록"""
+        size = self.cell_size
+        ranges = self.ranges
+        for sprite in sprites:
+            rect = sprite.rect
+            cell_range = (rect.left // size, rect.top // size,
+                          (rect.right - 1) // size, (rect.bottom - 1) // size)
+            old = ranges[sprite]
+            if cell_range != old:
+                self._erase(sprite, old)
+                self._insert(sprite, cell_range)
+                ranges[sprite] = cell_range
+
+    def query(self, rect):
+        """rect가 걸친 칸에 등록된 스프라이트 후보 (실제 겹침은 호출한 쪽에서 확인)"""
+        x0, y0, x1, y1 = self._range(rect)
+        cells = self.cells
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def sort_by_order(self, sprites):
+        """추가된 순서대로 정렬 (그룹을 순회할 때와 같은 순서)"""
+        return sorted(sprites, key=self.order.__getitem__)
+
+def grid_collide(enemy_grid, bullet_grid):
+    """
+    pygame.sprite.groupcollide(enemies, bullets, True, True)와 같은 결과를
+    격자로 후보를 좁혀서 계산 (적은 그룹 순서대로 처리)
+    반환: {적: [맞은 총알들]}
+    """
+    # 총알이 있는 칸과 같은 칸에 있는 적만 후보
+    enemy_cells = enemy_grid.cells
+    candidates = {}
+    for key in bullet_grid.cells:
+        cell = enemy_cells.get(key)
+        if cell:
+            candidates.update(cell)
+
+    hits = {}
+    for enemy in enemy_grid.sort_by_order(candidates):
+        rect = enemy.rect
+        collided = [bullet for bullet in bullet_grid.query(rect) if rect.colliderect(bullet.rect)]
+        if collided:
+            for bullet in collided:
+                bullet.kill()
+            enemy.kill()
+            hits[enemy] = collided
+    return hits
+
+def floor_candidates(enemy_grid, floor_y, width=SCREEN_WIDTH):
+    """
+    바닥(floor_y)을 넘었을 수 있는 적 후보 (추가된 순서)
+    바닥 줄의 칸만 확인하므로 화면의 적 수와 무관함
+    적은 이동할 때 top이 바닥(SCREEN_HEIGHT)을 넘지 않게 붙잡아 두므로 바닥을 넘은 적은 항상 이 줄에 걸침
+    """
+    size = enemy_grid.cell_size
+    row = floor_y // size
+    cells = enemy_grid.cells
+    found = {}
+    for cx in range(-1, width // size + 2):
+        cell = cells.get((cx, row))
+        if cell:
+            found.update(cell)
+    return enemy_grid.sort_by_order(found)
@@ -1,62 +1,224 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
 from .settings import *
+from .text_cache import get_font, text_cache
 
-class Enemy(pygame.sprite.Sprite):
+# 헤드리스 시뮬레이션에서 이미지 대신 쓰는 공용 Surface (그려지지 않음)
+_HEADLESS_IMAGE = pygame.Surface((1, 1))
+
+# 새로 만든 스프라이트/Surface 수 (풀이 제대로 재사용되는지 확인용)
+allocations = {'sprites': 0, 'surfaces': 0}
+
+def allocation_count():
+    """지금까지 새로 만든 스프라이트와 Surface 수 합계"""
+    return allocations['sprites'] + allocations['surfaces']
+
+class _ImageCache:
+    """
+    단어별 적 이미지(또는 헤드리스용 크기)를 공유하는 LRU 캐시
+    같은 단어의 적은 같은 Surface를 함께 쓰므로 이미지를 직접 수정하면 안 됨
+    """
+    def __init__(self, max_size=ENEMY_IMAGE_CACHE):
+        self.max_size = max_size
+        self._items = OrderedDict()
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key, item):
+        self._items[key] = item
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+        return item
+
+    def clear(self):
+        self._items.clear()
+
+_enemy_images = _ImageCache()
+_enemy_sizes = _ImageCache()
+_bullet_image = None
+
+def _make_enemy_image(word, font):
+    # 텍스트 렌더링 (게임에서는 word만 표시)
+    text_surf = text_cache.render(word, font, RED)
+    
+    # 적의 전체 크기 계산 (word만)
+    image = pygame.Surface((text_surf.get_width() + 20, text_surf.get_height() + 20))
+    image.fill(BLACK) # 배경 투명 대신 검정 (가독성 위함)
+    
+    # 이미지 위에 텍스트 그리기 (word만)
+    image.blit(text_surf, (10, 10))
+    allocations['surfaces'] += 1
+    return image
+
+def _get_bullet_image():
+    """모든 총알이 함께 쓰는 이미지"""
+    global _bullet_image
+    if _bullet_image is None:
+        # 총알 크기를 더 크게 (20x30)
+        _bullet_image = pygame.Surface((20, 30), pygame.SRCALPHA)  # 투명도 지원
+        # 반투명한 초록색 (단어가 가려지지 않도록)
+        _bullet_image.fill((GREEN[0], GREEN[1], GREEN[2], 128))  # 알파값 128 (50% 투명)
+        allocations['surfaces'] += 1
+    return _bullet_image
+
+class SpritePool:
+    """
+    죽은 스프라이트를 모아뒀다가 reset()으로 다시 쓰는 풀
+    acquire()로 꺼낸 스프라이트는 모든 그룹에서 빠지는 순간 (kill, 그룹 remove/empty) 자동으로 돌아옴
+    """
+    def __init__(self, sprite_class):
+        self.sprite_class = sprite_class
+        self._free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(*args, **kwargs)
+            self.created += 1
+        sprite.pool = self
+        sprite.pooled = False
+        return sprite
+
+    def release(self, sprite):
+        if not sprite.pooled:
+            sprite.pooled = True
+            sprite.release()
+            self._free.append(sprite)
+
+    def __len__(self):
+        return len(self._free)
+
+class PooledSprite(pygame.sprite.Sprite):
+    """풀에서 관리되는 스프라이트 (어떤 그룹에도 속하지 않게 되면 풀로 반환)"""
+    pool = None
+    pooled = False
+
+    def __init__(self):
+        super().__init__()
+        allocations['sprites'] += 1
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if self.pool is not None and not self.alive():
+            self.pool.release(self)
+
+    def release(self):
+        """풀로 돌아갈 때 다른 객체 참조 정리"""
+
+class Enemy(PooledSprite):
     """화면 위에서 떨어지는 버그(단어) 클래스"""
-    def __init__(self, data, speed):
+    def __init__(self, data, speed, rng=random, render=True, atlas=None):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.generation = 0  # 풀에서 다시 쓸 때마다 증가 (예전 적을 쫓던 총알 구분용)
+        self.reset(data, speed, rng, render, atlas)
+
+    def reset(self, data, speed, rng=random, render=True, atlas=None):
+        """
+        새 단어/속도로 다시 초기화 (풀에서 재사용할 때)
+        atlas가 있으면 미리 렌더링해 둔 이미지를 그대로 사용
+        """
+        self.generation += 1
         self.word = data['word']  # 타이핑해야 할 단어
         self.desc = data['desc']  # 단어 설명 (게임에서는 표시 안 함)
-        self.speed = speed
-        
-        # 폰트 설정
-        self.font_main = pygame.font.SysFont(FONT_NAME, FONT_SIZE_MAIN, bold=True)
-        
-        # 텍스트 렌더링 (게임에서는 word만 표시)
-        text_surf = self.font_main.render(self.word, True, RED)
+        self.speed = speed  # 초당 이동 픽셀
+        self.spawn_tick = 0     # 나타난 틱 (시뮬레이션이 설정)
+        self.typed_tick = None  # 이 단어로 처음 발사한 틱 (타이핑 시간 계산용)
+        self.word_index = None  # 샘플러에서 뽑은 단어 인덱스 (시뮬레이션이 설정)
         
-        # 적의 전체 크기 계산 (word만)
-        self.image = pygame.Surface((text_surf.get_width() + 20, 
-                                     text_surf.get_height() + 20))
-        self.image.fill(BLACK) # 배경 투명 대신 검정 (가독성 위함)
+        # 폰트 설정 (공유 레지스트리 사용)
+        self.font_main = get_font(FONT_SIZE_MAIN, bold=True)
         
-        # 이미지 위에 텍스트 그리기 (word만)
-        self.image.blit(text_surf, (10, 10))
-        
-        self.rect = self.image.get_rect()
+        image = atlas.get(self.word) if render and atlas is not None else None
+        if image is not None:
+            self.image = image
+            width, height = image.get_size()
+        elif render:
+            # 같은 단어의 이미지는 공유
+            key = (self.word, self.font_main)
+            self.image = _enemy_images.get(key) or _enemy_images.put(key, _make_enemy_image(*key))
+            width, height = self.image.get_size()
+        else:
+            # 헤드리스: 렌더링 없이 크기만 계산 (충돌 판정은 동일)
+            self.image = _HEADLESS_IMAGE
+            key = (self.word, self.font_main)
+            text_w, text_h = _enemy_sizes.get(key) or _enemy_sizes.put(key, self.font_main.size(self.word))
+            width, height = text_w + 20, text_h + 20
+        self.rect.size = (width, height)
         
         # 랜덤한 X 위치, 화면 맨 위 Y 위치에서 시작
-        self.rect.x = random.randint(50, SCREEN_WIDTH - self.rect.width - 50)
+        self.rect.x = rng.randint(50, SCREEN_WIDTH - self.rect.width - 50)
         self.rect.y = -self.rect.height
+        
+        # 실수 좌표 (rect는 그리기/충돌용으로 반올림한 값)
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
-    def update(self):
-        """매 프레임마다 아래로 이동"""
-        self.rect.y += self.speed
-        # 화면 밖으로 나가면 제거
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
+    def update(self, dt):
+        """dt초 동안 아래로 이동"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        # 한 틱에 바닥을 통째로 지나칠 만큼 빨라도 바닥 판정(check_floor)이 보도록 바닥에 붙잡아 둠
+        # (여기서 제거하면 생명력이 줄지 않음, 제거는 check_floor가 함)
+        self.y = min(self.y + self.speed * dt, SCREEN_HEIGHT)
+        self.sync_rect()
 
-class Bullet(pygame.sprite.Sprite):
+    def sync_rect(self):
+        """rect를 현재 실수 좌표에 맞춤"""
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+    def interpolate(self, alpha):
+        """이전 틱과 현재 틱 사이 위치로 rect 이동 (그리기 전용)"""
+        self.rect.x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.rect.y = self.prev_y + (self.y - self.prev_y) * alpha
+
+class Bullet(PooledSprite):
     """플레이어가 발사하는 미사일"""
-    def __init__(self, x, y, target_enemy):
+    def __init__(self, x, y, target_enemy, speed=720, jitter=120, rng=random, render=True):
         super().__init__()
-        # 총알 크기를 더 크게 (20x30)
-        self.image = pygame.Surface((20, 30), pygame.SRCALPHA)  # 투명도 지원
-        # 반투명한 초록색 (단어가 가려지지 않도록)
-        self.image.fill((GREEN[0], GREEN[1], GREEN[2], 128))  # 알파값 128 (50% 투명)
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, 20, 30)
+        self.reset(x, y, target_enemy, speed, jitter, rng, render)
+
+    def reset(self, x, y, target_enemy, speed=720, jitter=120, rng=random, render=True):
+        """새 발사 위치/타겟으로 다시 초기화 (풀에서 재사용할 때)"""
+        # 이미지는 모든 총알이 공유
+        self.image = _get_bullet_image() if render else _HEADLESS_IMAGE
         self.rect.centerx = x
         self.rect.bottom = y
         
-        # 타겟 정보 저장
+        # 타겟 정보 저장 (적이 풀에서 다른 단어로 재사용되면 더 이상 쫓지 않음)
         self.target = target_enemy
+        self.target_generation = target_enemy.generation if target_enemy else 0
         self.target_pos = (target_enemy.rect.centerx, target_enemy.rect.centery) if target_enemy else None
+        self.input_time = None  # 발사 키를 입력한 시각 (입력 지연 측정용)
         
-        # 기본 속도에 약간의 랜덤성 추가 (각 총알이 조금씩 다르게)
-        base_speed = 12
-        self.speed = base_speed + random.uniform(-2, 2)
+        # 실수 좌표 (중심 기준)
+        self.x = float(self.rect.centerx)
+        self.y = float(self.rect.centery)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
+        # 기본 속도(초당 픽셀)에 약간의 랜덤성 추가 (각 총알이 조금씩 다르게)
+        self.speed = speed + rng.uniform(-jitter, jitter)
         
         # 타겟을 향한 방향 벡터 계산
         if self.target_pos:
@@ -75,40 +237,71 @@ class Bullet(pygame.sprite.Sprite):
             self.velocity_x = 0
             self.velocity_y = -self.speed
         
-        # 약간의 곡선 경로를 위한 랜덤 오프셋
-        self.curve_offset = random.uniform(-0.3, 0.3)
-        self.frame = 0
+        # 약간의 곡선 경로를 위한 랜덤 오프셋 (60틱 기준 틱당 픽셀)
+        self.curve_offset = rng.uniform(-0.3, 0.3)
+        self.age = 0.0  # 발사 후 경과 시간 (초)
+
+    def release(self):
+        self.target = None
+
+    def target_alive(self):
+        """쫓던 적이 아직 살아있는지 (같은 객체가 다른 적으로 재사용된 경우는 제외)"""
+        target = self.target
+        return target is not None and target.alive() and target.generation == self.target_generation
 
-    def update(self):
+    def update(self, dt, curve=True, homing_range=None):
+        """
+        dt초 이동
+        curve=False면 곡선 흔들림 없이, homing_range가 있으면 그보다 먼 타겟은 방향을 다시 계산하지 않음
+        (프레임 조절기의 총알 간소화 단계)
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # 타겟이 여전히 존재하면 위치 업데이트
-        if self.target and self.target.alive():
+        if self.target_alive():
             self.target_pos = (self.target.rect.centerx, self.target.rect.centery)
             # 방향 재계산 (타겟이 움직이므로)
-            dx = self.target_pos[0] - self.rect.centerx
-            dy = self.target_pos[1] - self.rect.centery
-            distance = math.sqrt(dx*dx + dy*dy)
+            dx = self.target_pos[0] - self.x
+            dy = self.target_pos[1] - self.y
+            squared = dx*dx + dy*dy
+            if homing_range is not None and squared > homing_range * homing_range:
+                squared = 0  # 멀리 있으면 지금 방향 그대로
+            distance = math.sqrt(squared)
             
             if distance > 0:
                 # 부드러운 추적을 위해 현재 속도와 새 방향을 섞음
                 new_vx = (dx / distance) * self.speed
                 new_vy = (dy / distance) * self.speed
-                # 선형 보간으로 부드럽게 방향 전환
-                self.velocity_x = self.velocity_x * 0.7 + new_vx * 0.3
-                self.velocity_y = self.velocity_y * 0.7 + new_vy * 0.3
+                # 선형 보간으로 부드럽게 방향 전환 (60틱 기준 0.3씩, 틱 길이에 맞게 보정)
+                blend = 1 - 0.7 ** (dt * 60)
+                self.velocity_x += (new_vx - self.velocity_x) * blend
+                self.velocity_y += (new_vy - self.velocity_y) * blend
         
-        # 곡선 효과를 위한 약간의 수평 오프셋
-        curve_x = math.sin(self.frame * 0.1) * self.curve_offset
+        # 곡선 효과를 위한 약간의 수평 오프셋 (초당 픽셀)
+        curve_x = math.sin(self.age * 6.0) * self.curve_offset * 60 if curve else 0.0
         
         # 위치 업데이트
-        self.rect.centerx += self.velocity_x + curve_x
-        self.rect.centery += self.velocity_y
-        self.frame += 1
+        self.x += (self.velocity_x + curve_x) * dt
+        self.y += self.velocity_y * dt
+        self.age += dt
+        self.sync_rect()
         
         # 화면 밖으로 나가면 제거
         if (self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT or 
             self.rect.right < 0 or self.rect.left > SCREEN_WIDTH):
             self.kill()
 
+    def sync_rect(self):
+        """rect를 현재 실수 좌표에 맞춤"""
+        self.rect.centerx = self.x
+        self.rect.centery = self.y
+
+    def interpolate(self, alpha):
+        """이전 틱과 현재 틱 사이 위치로 rect 이동 (그리기 전용)"""
+        self.rect.centerx = self.prev_x + (self.x - self.prev_x) * alpha
+        self.rect.centery = self.prev_y + (self.y - self.prev_y) * alpha
+
 class Player(pygame.sprite.Sprite):
     """하단에 위치한 플레이어 캐릭터"""
     def __init__(self):
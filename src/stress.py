@@ -0,0 +1,194 @@
+"""
+스트레스 테스트 (자동 타자 봇 + 대량 적 생성)
+
+생성 간격과 속도 곡선을 바꿔서 적/총알을 수천 개까지 늘리고,
+봇이 GameManager.check_input을 거쳐 계속 쏘는 동안 update/draw 시간을 측정함
+SDL 더미 비디오 드라이버로 창 없이 실행:
+    python -m src.stress --seconds 60 --spawn-rate 40 --wpm 600
+    python -m src.stress --headless --spawn-rate 200   # 그리기 없이 시뮬레이션만
+    python -m src.stress --spawn-rate 40 --governor    # 프레임 예산 조절기 동작 확인
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import random
+import sys
+import time
+from .settings import *
+from .bot import TypistBot
+from .profiler import percentile
+from .latency import latency
+from .simulation import Simulation, SimulationConfig
+
+def stress_config(spawn_rate=STRESS_SPAWN_RATE, enemy_speed=STRESS_ENEMY_SPEED, speed_curve=None,
+                  bullet_speed=None, lives=10**9):
+    """
+    스트레스 모드 규칙: 초당 spawn_rate마리 생성, 적 속도는 고정 (speed_curve를 주면 그 함수 사용)
+    생명력이 사실상 무한이라 적이 바닥에 닿아도 끝나지 않음
+    bullet_speed를 낮추면 총알이 오래 살아있어서 화면의 총알 수가 늘어남
+    """
+    extra = {}
+    if bullet_speed is not None:
+        extra = {'bullet_base_speed': bullet_speed, 'bullet_speed_jitter': bullet_speed / 6}
+    if speed_curve is None:
+        speed_curve = lambda score: enemy_speed
+    return SimulationConfig(spawn_interval=1.0 / spawn_rate, lives=lives, speed_curve=speed_curve,
+                            countdown_seconds=1, **extra)
+
+def sustained_fps(frame_times, window):
+    """window 프레임씩 묶었을 때 가장 느린 구간의 FPS (일시적인 빠른 프레임에 가려지지 않는 값)"""
+    if not frame_times:
+        return 0.0
+    window = min(window, len(frame_times))
+    total = sum(frame_times[:window])
+    worst = total
+    for i in range(window, len(frame_times)):
+        total += frame_times[i] - frame_times[i - window]
+        worst = max(worst, total)
+    return window / worst if worst > 0 else 0.0
+
+def report(frame_times, peaks, extra):
+    """측정 결과 요약 (시간은 밀리초)"""
+    values = sorted(frame_times)
+    mean = sum(values) / len(values) if values else 0.0
+    return {
+        'frames': len(values),
+        'mean_fps': 1.0 / mean if mean > 0 else 0.0,
+        'sustained_fps': sustained_fps(frame_times, SIM_HZ),
+        'p50_ms': percentile(values, 50) * 1000,
+        'p95_ms': percentile(values, 95) * 1000,
+        'p99_ms': percentile(values, 99) * 1000,
+        'max_ms': values[-1] * 1000 if values else 0.0,
+        'peak_enemies': peaks['enemies'],
+        'peak_bullets': peaks['bullets'],
+        **extra,
+    }
+
+def run_game(args, bot, config):
+    """GameManager로 실행: 프레임마다 봇 입력 -> update() 한 번 -> draw(), update+draw 시간 측정"""
+    from .game_manager import GameManager
+    game = GameManager(seed=args.seed)
+    game.data_manager.stop_watching()
+    game.physics_backend = args.physics
+    game.collision_backend = args.collision
+    game.sim_config = config
+    game.text_input = args.text_input
+    latency.enabled = args.latency
+    game.selected_language = args.language or game.data_manager.get_language_list()[0]
+    if not args.governor:
+        game.governor = None
+    game.start_game()
+
+    frame_times = []
+    update_times = []
+    draw_times = []
+    peaks = {'enemies': 0, 'bullets': 0}
+    level_frames = {}  # 품질 단계별 프레임 수
+    for _ in range(round(args.seconds * SIM_HZ) + SIM_HZ * config.countdown_seconds):
+        latency.receive()
+        bot.drive(game)
+        latency.done()
+        start = time.perf_counter()
+        game.update()
+        middle = time.perf_counter()
+        game.draw()
+        end = time.perf_counter()
+        if game.state != "PLAYING":
+            if game.state == "GAMEOVER":
+                break
+            continue  # 카운트다운은 측정에서 제외
+        frame_times.append(end - start)
+        update_times.append(middle - start)
+        draw_times.append(end - middle)
+        game.govern(end - start)
+        level_frames[game.quality] = level_frames.get(game.quality, 0) + 1
+        peaks['enemies'] = max(peaks['enemies'], len(game.sim.enemies))
+        peaks['bullets'] = max(peaks['bullets'], len(game.sim.bullets))
+    extra = {
+        'update_p95_ms': percentile(sorted(update_times), 95) * 1000,
+        'draw_p95_ms': percentile(sorted(draw_times), 95) * 1000,
+        'score': game.sim.score,
+    }
+    if game.governor is not None:
+        extra['quality_frames'] = level_frames
+        extra['quality_changes'] = game.governor.changes
+    if args.latency:
+        extra['latency'] = latency.summary()
+    return report(frame_times, peaks, extra)
+
+def run_sim(args, bot, config):
+    """화면 없이 Simulation만 실행: 틱마다 step() 시간 측정"""
+    from .data_manager import DataManager
+    data_manager = DataManager()
+    language = args.language or data_manager.get_language_list()[0]
+    sim = Simulation(data_manager, language, rng=random.Random(args.seed), config=config,
+                     headless=True, physics=args.physics, collision=args.collision)
+    frame_times = []
+    peaks = {'enemies': 0, 'bullets': 0}
+    for _ in range(round(args.seconds * SIM_HZ) + SIM_HZ * config.countdown_seconds):
+        bot.policy(sim)
+        start = time.perf_counter()
+        sim.step()
+        end = time.perf_counter()
+        if sim.phase != "PLAYING":
+            if sim.phase == "GAMEOVER":
+                break
+            continue
+        frame_times.append(end - start)
+        peaks['enemies'] = max(peaks['enemies'], len(sim.enemies))
+        peaks['bullets'] = max(peaks['bullets'], len(sim.bullets))
+    return report(frame_times, peaks, {'score': sim.score})
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense 스트레스 테스트")
+    parser.add_argument('--seconds', type=float, default=30.0, help="게임 시간 (초, 틱 기준)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--language', default=None, help="사용할 언어 (기본: 첫 번째 언어)")
+    parser.add_argument('--spawn-rate', type=float, default=STRESS_SPAWN_RATE, help="초당 적 생성 수")
+    parser.add_argument('--enemy-speed', type=float, default=STRESS_ENEMY_SPEED, help="적 속도 (초당 픽셀)")
+    parser.add_argument('--bullet-speed', type=float, default=None,
+                        help="총알 속도 (초당 픽셀, 낮추면 총알 수가 늘어남)")
+    parser.add_argument('--wpm', type=float, default=BOT_WPM, help="봇 타이핑 속도 (분당 단어 수)")
+    parser.add_argument('--error-rate', type=float, default=BOT_ERROR_RATE, help="봇 오타 확률")
+    parser.add_argument('--reaction', type=float, default=BOT_REACTION_DELAY, help="봇 반응 시간 (초)")
+    parser.add_argument('--text-input', action='store_true', help="봇 글자를 TEXTINPUT 이벤트로 입력")
+    parser.add_argument('--latency', action='store_true', help="입력 지연도 측정 (키 -> 발사/표시/명중)")
+    parser.add_argument('--headless', action='store_true', help="그리기 없이 시뮬레이션만 측정")
+    parser.add_argument('--governor', action='store_true',
+                        help="프레임 예산 조절기를 켜고 품질 단계별 프레임 수 출력")
+    parser.add_argument('--physics', default=PHYSICS_BACKEND, choices=("python", "numpy"),
+                        help="적/총알 물리 백엔드")
+    parser.add_argument('--collision', default=COLLISION_BACKEND, choices=("grid", "groupcollide"),
+                        help="충돌 판정 방식")
+    parser.add_argument('--output', default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    config = stress_config(args.spawn_rate, args.enemy_speed, bullet_speed=args.bullet_speed)
+    bot = TypistBot(args.wpm, args.error_rate, args.reaction, rng=random.Random(args.seed))
+    result = run_sim(args, bot, config) if args.headless else run_game(args, bot, config)
+    result['bot'] = bot.stats()
+
+    print(f"frames {result['frames']}  mean {result['mean_fps']:.1f} fps  "
+          f"sustained {result['sustained_fps']:.1f} fps")
+    print(f"frame p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+          f"p99={result['p99_ms']:.2f}ms max={result['max_ms']:.2f}ms")
+    if 'update_p95_ms' in result:
+        print(f"update p95={result['update_p95_ms']:.2f}ms  draw p95={result['draw_p95_ms']:.2f}ms")
+    print(f"peak enemies {result['peak_enemies']}  peak bullets {result['peak_bullets']}  "
+          f"score {result['score']}  bot {result['bot']}")
+    if 'quality_frames' in result:
+        levels = '  '.join(f"{level}: {frames}" for level, frames in sorted(result['quality_frames'].items()))
+        print(f"quality frames {levels}  changes {result['quality_changes']}")
+    for stage, stats in result.get('latency', {}).items():
+        print(f"latency {stage:<6} p50={stats['p50']:.2f}ms p95={stats['p95']:.2f}ms "
+              f"p99={stats['p99']:.2f}ms n={stats['count']}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+난이도 곡선 조정용 일괄 시뮬레이터
+
+난이도 상수(생성 간격, 적 속도와 점수 단계별 증가량, 생명력, 총알 속도)와 봇 실력(타이핑 속도,
+오타율, 반응 시간)의 모든 조합마다 시드 고정 헤드리스 게임을 여러 판 돌리고,
+생존 시간, 점수 분포, 최대 적/총알 수를 열(column) 단위 결과 파일로 저장함
+게임은 concurrent.futures 프로세스 풀에 나눠서 실행 (프로세스마다 DataManager를 한 번만 로드)
+
+    python -m src.sweep --spawn-interval 1.5,2,2.5 --wpm 40,60,80 --seeds 200 --output sweep.json
+    python -m src.sweep --lives 3,5 --enemy-speed 40,60 --seeds 500 --output sweep.npz   # NumPy 필요
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .settings import *
+from .profiler import percentile
+
+# 조합할 수 있는 값: (옵션 이름, 결과 열 이름, 기본값)
+PARAMETERS = (
+    ('spawn-interval', 'spawn_interval', 2.0),
+    ('enemy-speed', 'base_enemy_speed', 60.0),
+    ('speed-step', 'enemy_speed_step', 60.0),
+    ('speed-step-score', 'speed_step_score', 100),
+    ('lives', 'lives', 3),
+    ('bullet-speed', 'bullet_base_speed', 720.0),
+    ('wpm', 'wpm', BOT_WPM),
+    ('error-rate', 'error_rate', BOT_ERROR_RATE),
+    ('reaction', 'reaction_delay', BOT_REACTION_DELAY),
+)
+CONFIG_FIELDS = ('spawn_interval', 'base_enemy_speed', 'enemy_speed_step', 'speed_step_score',
+                 'lives', 'bullet_base_speed')
+BOT_FIELDS = ('wpm', 'error_rate', 'reaction_delay')
+
+# 작업 프로세스마다 한 번 로드하는 단어 데이터
+_data_manager = None
+
+def _init_worker(data_path):
+    global _data_manager
+    from .data_manager import DataManager
+    _data_manager = DataManager(data_path)
+    _data_manager.stop_watching()
+
+def play(params, seed, max_ticks, language=None):
+    """게임 한 판 (봇이 끝까지 플레이) 결과"""
+    from .bot import TypistBot
+    from .simulation import Simulation, SimulationConfig
+    config = SimulationConfig(**{field: params[field] for field in CONFIG_FIELDS},
+                              bullet_speed_jitter=params['bullet_base_speed'] / 6)
+    if language is None:
+        language = _data_manager.get_language_list()[0]
+    sim = Simulation(_data_manager, language, rng=random.Random(seed), config=config, headless=True)
+    bot = TypistBot(params['wpm'], params['error_rate'], params['reaction_delay'],
+                    rng=random.Random(f"bot:{seed}"))
+    peak_enemies = peak_bullets = 0
+    for _ in range(max_ticks):
+        if sim.phase == "GAMEOVER":
+            break
+        bot.policy(sim)
+        sim.step()
+        peak_enemies = max(peak_enemies, len(sim.enemies))
+        peak_bullets = max(peak_bullets, len(sim.bullets))
+    playing_ticks = max(0, sim.tick - config.countdown_seconds * sim.tick_rate)
+    return {
+        'seed': seed,
+        'survival_s': playing_ticks / sim.tick_rate,
+        'gameover': sim.phase == "GAMEOVER",
+        'score': sim.score,
+        'peak_enemies': peak_enemies,
+        'peak_bullets': peak_bullets,
+        'shots': bot.shots,
+    }
+
+def play_batch(combo, params, seeds, max_ticks, language):
+    """한 조합의 시드 여러 개 (프로세스 간 전달 횟수를 줄이려고 묶어서 실행)"""
+    return combo, [play(params, seed, max_ticks, language) for seed in seeds]
+
+def grid(values):
+    """옵션별 값 목록 -> 모든 조합 (dict 목록)"""
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+def summarize(combos, games):
+    """조합별 요약 (열 단위)"""
+    columns = {name: [] for name in combos[0]} if combos else {}
+    stats = ('games', 'gameover_rate', 'survival_mean_s', 'survival_p10_s', 'survival_p50_s',
+             'survival_p90_s', 'score_mean', 'score_p50', 'score_p90', 'peak_enemies_max',
+             'peak_bullets_max')
+    columns.update({name: [] for name in stats})
+    for combo, params in enumerate(combos):
+        rows = games[combo]
+        survival = sorted(row['survival_s'] for row in rows)
+        scores = sorted(row['score'] for row in rows)
+        for name, value in params.items():
+            columns[name].append(value)
+        columns['games'].append(len(rows))
+        columns['gameover_rate'].append(sum(row['gameover'] for row in rows) / len(rows))
+        columns['survival_mean_s'].append(sum(survival) / len(rows))
+        columns['survival_p10_s'].append(percentile(survival, 10))
+        columns['survival_p50_s'].append(percentile(survival, 50))
+        columns['survival_p90_s'].append(percentile(survival, 90))
+        columns['score_mean'].append(sum(scores) / len(rows))
+        columns['score_p50'].append(percentile(scores, 50))
+        columns['score_p90'].append(percentile(scores, 90))
+        columns['peak_enemies_max'].append(max(row['peak_enemies'] for row in rows))
+        columns['peak_bullets_max'].append(max(row['peak_bullets'] for row in rows))
+    return columns
+
+def game_columns(combos, games):
+    """게임별 결과 (열 단위, 조합 번호와 조합 값 포함)"""
+    columns = {'combo': []}
+    columns.update({name: [] for name in combos[0]})
+    for combo, params in enumerate(combos):
+        for row in games[combo]:
+            columns['combo'].append(combo)
+            for name, value in params.items():
+                columns[name].append(value)
+            for name, value in row.items():
+                columns.setdefault(name, []).append(value)
+    return columns
+
+def save(path, meta, games, summary):
+    """결과 저장 (.npz면 NumPy 배열, 그 외는 열 목록 JSON)"""
+    if path.lower().endswith('.npz'):
+        import numpy as np
+        arrays = {f"game_{name}": np.asarray(values) for name, values in games.items()}
+        arrays.update({f"summary_{name}": np.asarray(values) for name, values in summary.items()})
+        arrays['meta'] = np.asarray(json.dumps(meta))
+        np.savez_compressed(path, **arrays)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'summary': summary, 'games': games}, f, ensure_ascii=False)
+
+def run_sweep(values, seeds, max_ticks, workers=None, batch=25, language=None, data_path=None,
+              first_seed=0, progress=None):
+    """
+    모든 조합 x 시드를 프로세스 풀에서 실행
+    반환: (조합 목록, 조합 번호 -> 게임 결과 목록)
+    """
+    combos = grid(values)
+    games = {combo: [] for combo in range(len(combos))}
+    seed_list = list(range(first_seed, first_seed + seeds))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data_path,)) as executor:
+        futures = [executor.submit(play_batch, combo, params, seed_list[i:i + batch], max_ticks, language)
+                   for combo, params in enumerate(combos)
+                   for i in range(0, len(seed_list), batch)]
+        for done, future in enumerate(as_completed(futures), 1):
+            combo, rows = future.result()
+            games[combo].extend(rows)
+            if progress:
+                progress(done, len(futures))
+    for rows in games.values():
+        rows.sort(key=lambda row: row['seed'])  # 완료 순서와 관계없이 같은 결과 파일
+    return combos, games
+
+def parse_values(kind):
+    def parse(text):
+        return [kind(value) for value in text.split(',') if value]
+    return parse
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Algo-Defense 난이도 일괄 시뮬레이션")
+    for option, name, default in PARAMETERS:
+        kind = int if isinstance(default, int) else float
+        parser.add_argument(f'--{option}', dest=name, type=parse_values(kind), default=[default],
+                            help=f"{name} 값 목록 (쉼표 구분, 기본 {default})")
+    parser.add_argument('--seeds', type=int, default=100, help="조합마다 돌릴 게임 수")
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--max-ticks', type=int, default=SIM_HZ * 60 * 5, help="게임당 최대 틱 수")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--batch', type=int, default=25, help="작업 하나에 묶는 게임 수")
+    parser.add_argument('--language', default=None, help="사용할 언어 (기본: 첫 번째 언어)")
+    parser.add_argument('--data', default=None, help="단어 데이터 경로 (기본: data/)")
+    parser.add_argument('--output', default=None, help="결과 파일 (.json 또는 .npz)")
+    args = parser.parse_args(argv)
+
+    values = {name: getattr(args, name) for _, name, _ in PARAMETERS}
+    started = time.perf_counter()
+
+    def progress(done, total):
+        print(f"\r[진행] {done}/{total}", end='', file=sys.stderr, flush=True)
+    combos, games = run_sweep(values, args.seeds, args.max_ticks, args.workers, args.batch,
+                              args.language, args.data, args.first_seed, progress)
+    print(file=sys.stderr)
+    elapsed = time.perf_counter() - started
+    summary = summarize(combos, games)
+
+    varied = [name for name, options in values.items() if len(options) > 1]
+    for i in range(len(combos)):
+        label = ' '.join(f"{name}={summary[name][i]}" for name in varied) or 'default'
+        print(f"{label:<48} survival p50={summary['survival_p50_s'][i]:7.1f}s "
+              f"gameover={summary['gameover_rate'][i]:5.1%} score p50={summary['score_p50'][i]:7.0f} "
+              f"peak enemies={summary['peak_enemies_max'][i]}")
+    total_games = len(combos) * args.seeds
+    print(f"[완료] {total_games}판 / {elapsed:.1f}초 ({total_games / elapsed:.1f}판/초, "
+          f"프로세스 {args.workers or os.cpu_count()}개)")
+
+    if args.output:
+        meta = {
+            'values': values,
+            'seeds': args.seeds,
+            'first_seed': args.first_seed,
+            'max_ticks': args.max_ticks,
+            'tick_rate': SIM_HZ,
+            'elapsed_s': elapsed,
+        }
+        save(args.output, meta, game_columns(combos, games), summary)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import pygame
+from collections import OrderedDict
+from .settings import *
+from .profiler import profiler
+
+class FontRegistry:
+    """
+    (폰트 이름, 크기, 굵기) 조합별로 폰트를 한 번만 로드해서 공유하는 클래스
+    pygame.font.SysFont는 호출할 때마다 시스템 폰트를 검색하므로 매 프레임 호출하면 느림
+    """
+    def __init__(self):
+        self._fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size, bold=False, name=FONT_NAME):
+        """캐시된 폰트 반환 (없으면 로드 후 저장)"""
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = pygame.font.SysFont(name, size, bold=bold)
+            self._fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def clear(self):
+        """로드된 폰트 모두 제거 (pygame 재초기화 시 사용)"""
+        self._fonts.clear()
+
+class TextCache:
+    """
+    렌더링된 텍스트 Surface를 (텍스트, 폰트, 색상, 안티앨리어싱) 키로 보관하는 LRU 캐시
+    반환된 Surface는 여러 곳에서 공유하므로 직접 수정하면 안 됨
+    """
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, antialias=True):
+        """캐시된 텍스트 Surface 반환 (없으면 렌더링 후 저장)"""
+        key = (text, font, color, antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        with profiler.section('text_render'):
+            surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        # 가장 오래 사용하지 않은 항목부터 제거
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        """캐시 비우기"""
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+# 게임 전체에서 공유하는 인스턴스
+fonts = FontRegistry()
+text_cache = TextCache()
+
+def get_font(size, bold=False, name=FONT_NAME):
+    """공유 폰트 레지스트리에서 폰트 가져오기"""
+    return fonts.get(size, bold, name)
+
+def render_text(text, size, color, bold=False, name=FONT_NAME, antialias=True):
+    """공유 캐시를 통해 텍스트 렌더링"""
+    return text_cache.render(text, fonts.get(size, bold, name), color, antialias)
+
+def get_cache_stats():
+    """폰트/텍스트 캐시 적중 통계 반환 (동작 확인용)"""
+    return {
+        'font_hits': fonts.hits,
+        'font_misses': fonts.misses,
+        'text_hits': text_cache.hits,
+        'text_misses': text_cache.misses,
+        'text_cached': len(text_cache),
+    }
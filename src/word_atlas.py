@@ -0,0 +1,103 @@
+import time
+import pygame
+from .settings import *
+from .text_cache import get_font
+
+class WordAtlas:
+    """
+    선택한 언어의 적 이미지(검정 배경 + 빨간 단어)를 큰 페이지 Surface에 모아 그려두는 아틀라스
+    배치(위치 계산)는 글자 크기만 재서 바로 끝내고, 실제 렌더링은 warm()으로 조금씩 진행
+    적은 아틀라스의 subsurface를 그대로 이미지로 쓰므로 생성할 때 렌더링이 없음
+    """
+    PADDING = 10  # Enemy 이미지와 같은 여백
+
+    def __init__(self, words, font=None, page_size=ATLAS_PAGE_SIZE, max_pages=ATLAS_MAX_PAGES):
+        self.font = font or get_font(FONT_SIZE_MAIN, bold=True)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = []
+        self._cells = {}      # 단어 -> (페이지 번호, Rect)
+        self._images = {}     # 단어 -> 렌더링이 끝난 subsurface
+        self._pending = []    # 아직 렌더링하지 않은 단어 (배치 순서)
+        self.hits = 0         # 미리 렌더링된 이미지를 바로 쓴 횟수
+        self.misses = 0       # 생성 시점에 렌더링해야 했던 횟수
+        self._layout(words)
+
+    def _layout(self, words):
+        """선반(shelf) 방식으로 단어 칸 배치 (렌더링 없이 크기만 계산)"""
+        x = y = shelf_height = 0
+        page = -1
+        for word in dict.fromkeys(words):  # 중복 제거, 순서 유지
+            text_w, text_h = self.font.size(word)
+            width, height = text_w + self.PADDING * 2, text_h + self.PADDING * 2
+            if width > self.page_size or height > self.page_size:
+                continue  # 너무 긴 단어는 아틀라스에 넣지 않음 (생성 시 따로 렌더링)
+            if page < 0 or x + width > self.page_size:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if page < 0 or y + height > self.page_size:
+                if page + 1 >= self.max_pages:
+                    break  # 페이지가 다 찼으면 나머지 단어는 생성 시 따로 렌더링 (메모리 제한)
+                page += 1
+                x = y = shelf_height = 0
+            self._cells[word] = (page, pygame.Rect(x, y, width, height))
+            self._pending.append(word)
+            x += width
+            shelf_height = max(shelf_height, height)
+        self._page_count = page + 1
+        self._pending.reverse()  # pop()으로 배치 순서대로 꺼내기 위해
+
+    def _page(self, index):
+        while len(self.pages) <= index:
+            page = pygame.Surface((self.page_size, self.page_size))
+            page.fill(BLACK)
+            self.pages.append(page)
+        return self.pages[index]
+
+    def _render(self, word):
+        page_index, rect = self._cells[word]
+        page = self._page(page_index)
+        page.blit(self.font.render(word, True, RED), (rect.x + self.PADDING, rect.y + self.PADDING))
+        image = self._images[word] = page.subsurface(rect)
+        return image
+
+    @property
+    def complete(self):
+        return len(self._images) == len(self._cells)
+
+    def warm(self, budget=None, count=None):
+        """
+        아직 안 그린 단어를 이어서 렌더링
+        budget(초)이나 count(개수)만큼만 하고 멈춤 (둘 다 없으면 전부), 렌더링한 개수 반환
+        """
+        deadline = time.perf_counter() + budget if budget is not None else None
+        done = 0
+        while self._pending:
+            word = self._pending.pop()
+            if word not in self._images:
+                self._render(word)
+                done += 1
+            if count is not None and done >= count:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return done
+
+    def get(self, word):
+        """단어 이미지 (아틀라스에 없는 단어면 None)"""
+        image = self._images.get(word)
+        if image is not None:
+            self.hits += 1
+            return image
+        if word not in self._cells:
+            return None
+        self.misses += 1
+        return self._render(word)
+
+    def stats(self):
+        return {
+            'words': len(self._cells),
+            'rendered': len(self._images),
+            'pages': self._page_count,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
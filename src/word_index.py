@@ -0,0 +1,98 @@
+from .groups import TrackedGroup
+
+class _TrieNode:
+    __slots__ = ('children', 'enemies', 'exact')
+
+    def __init__(self):
+        self.children = {}
+        self.enemies = {}  # 이 접두사로 시작하는 단어를 가진 적 (삽입 순서 유지)
+        self.exact = {}    # 단어가 정확히 이 접두사와 같은 적
+
+class WordTrie:
+    """
+    살아있는 적의 단어를 접두사로 찾기 위한 트라이
+    노드마다 해당 접두사를 가진 적 목록을 들고 있어서
+    조회 비용은 적의 수와 무관하게 입력 길이에만 비례함
+    """
+    def __init__(self):
+        self.root = _TrieNode()
+        self.size = 0
+
+    def add(self, enemy):
+        """적 등록 (단어 길이만큼의 노드를 갱신)"""
+        node = self.root
+        node.enemies[enemy] = None
+        for ch in enemy.word:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            child.enemies[enemy] = None
+            node = child
+        node.exact[enemy] = None
+        self.size += 1
+
+    def remove(self, enemy):
+        """적 제거 (비어버린 노드는 정리)"""
+        path = [self.root]
+        node = self.root
+        for ch in enemy.word:
+            node = node.children.get(ch)
+            if node is None:
+                return
+            path.append(node)
+        if enemy not in node.exact:
+            return
+        del node.exact[enemy]
+        for node in path:
+            node.enemies.pop(enemy, None)
+        # 아무 적도 없는 가지는 잘라냄
+        for i in range(len(enemy.word), 0, -1):
+            if not path[i].enemies:
+                del path[i - 1].children[enemy.word[i - 1]]
+            else:
+                break
+        self.size -= 1
+
+    def _find(self, prefix):
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def match(self, prefix):
+        """접두사로 시작하는 단어를 가진 적 목록 (등장 순서)"""
+        node = self._find(prefix)
+        return list(node.enemies) if node else []
+
+    def count(self, prefix):
+        """접두사로 시작하는 적의 수"""
+        node = self._find(prefix)
+        return len(node.enemies) if node else 0
+
+    def exact(self, word):
+        """단어가 정확히 일치하는 적 중 가장 먼저 등장한 적 (없으면 None)"""
+        node = self._find(word)
+        if node and node.exact:
+            return next(iter(node.exact))
+        return None
+
+class EnemyGroup(TrackedGroup):
+    """
+    적 스프라이트 그룹
+    추가/kill() 될 때 트라이를 함께 갱신해서 항상 살아있는 적만 색인함
+    """
+    def __init__(self, *sprites):
+        self.index = WordTrie()
+        super().__init__()
+        self.add_tracker(self.index)
+        self.add(*sprites)
+
+    def match(self, prefix):
+        """입력 중인 접두사와 일치하는 적 목록"""
+        return self.index.match(prefix)
+
+    def find_word(self, word):
+        """정확히 일치하는 적 반환"""
+        return self.index.exact(word)
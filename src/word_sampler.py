@@ -0,0 +1,148 @@
+"""
+적 단어 가중치 샘플러
+
+언어별 단어 목록에서 가중치에 비례해 단어를 뽑음
+- 긴 단어일수록 기본 가중치가 조금 큼
+- 바닥에 떨어뜨린(놓친) 단어는 가중치가 커지고, 맞히면 다시 줄어듦
+- 방금 나온 단어는 WORD_RECENT_WINDOW번 더 뽑을 동안 가중치를 낮춤
+가중치는 정수 펜윅 트리(Fenwick tree)에 두어서 뽑기/갱신 모두 O(log n)
+정수라 누적 오차가 없고, 뽑을 때 rng.randrange() 한 번만 쓰므로 시드가 같으면 결과도 같음
+"""
+from collections import deque
+from .settings import *
+
+class FenwickTree:
+    """정수 가중치의 구간 합 트리 (인덱스는 0부터)"""
+    def __init__(self, weights=(), tree=None):
+        if tree is not None:
+            self.tree = tree
+        else:
+            # O(n) 구성: 각 노드 값을 자기가 포함되는 부모 노드에 한 번씩 더함
+            self.tree = [0]
+            self.tree.extend(weights)
+            n = len(self.tree) - 1
+            for i in range(1, n + 1):
+                parent = i + (i & -i)
+                if parent <= n:
+                    self.tree[parent] += self.tree[i]
+        self.size = len(self.tree) - 1
+        self.top = 1 << self.size.bit_length() - 1 if self.size else 0
+
+    def copy(self):
+        return FenwickTree(tree=self.tree[:])
+
+    def add(self, index, delta):
+        i = index + 1
+        tree = self.tree
+        n = self.size
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index):
+        """0 ~ index-1 가중치 합"""
+        total = 0
+        tree = self.tree
+        i = index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix(self.size)
+
+    def find(self, target):
+        """누적 합이 target을 처음 넘는 인덱스 (0 <= target < total)"""
+        tree = self.tree
+        n = self.size
+        pos = 0
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+def base_weight(word):
+    """단어 길이에 따른 기본 가중치"""
+    return WORD_WEIGHT_BASE + WORD_WEIGHT_PER_CHAR * min(len(word), WORD_WEIGHT_LENGTH_CAP)
+
+class SamplerTemplate:
+    """
+    한 언어의 기본 가중치와 트리 (DataManager가 언어마다 한 번 만들어 둠)
+    게임마다 copy만 하면 되므로 새 게임의 샘플러 준비는 리스트 복사 두 번
+    """
+    def __init__(self, words):
+        self.words = words
+        self.base = [base_weight(word_data['word']) for word_data in words]
+        self.tree = FenwickTree(self.base)
+
+    def sampler(self):
+        return WordSampler(self.words, self.base, self.tree.copy())
+
+class WordSampler:
+    """
+    게임 한 판 동안의 단어 가중치 (놓친 횟수, 최근에 나온 단어)
+    가중치 = 기본 가중치 * (1 + 놓친 횟수) // (최근에 나왔으면 WORD_RECENT_DIVISOR)
+    """
+    def __init__(self, words, base, tree):
+        self.words = words
+        self.base = base
+        self.tree = tree
+        self.weights = base[:]
+        self.total = tree.total()
+        self.misses = {}       # 단어 인덱스 -> 놓친 횟수 (맞히면 절반으로)
+        self.recent = deque()  # (가중치를 되돌릴 뽑기 번호, 단어 인덱스)
+        self.recent_until = {}  # 단어 인덱스 -> 가장 마지막으로 뽑힌 뒤 되돌릴 뽑기 번호
+        self.draws = 0
+
+    def weight(self, index):
+        weight = self.base[index] * (1 + self.misses.get(index, 0))
+        if index in self.recent_until:
+            weight //= WORD_RECENT_DIVISOR
+        return max(1, weight)
+
+    def refresh(self, index):
+        """바뀐 상태로 가중치를 다시 계산해 트리에 반영"""
+        weight = self.weight(index)
+        delta = weight - self.weights[index]
+        if delta:
+            self.weights[index] = weight
+            self.total += delta
+            self.tree.add(index, delta)
+
+    def draw(self, rng):
+        """가중치에 비례해 단어 하나 뽑기 -> (인덱스, 단어 객체)"""
+        self.draws += 1
+        # 최근 목록에서 기간이 지난 단어의 가중치 되돌리기
+        recent = self.recent
+        while recent and recent[0][0] <= self.draws:
+            until, expired = recent.popleft()
+            if self.recent_until.get(expired) == until:  # 그 뒤에 다시 뽑혔으면 아직 최근 단어
+                del self.recent_until[expired]
+                self.refresh(expired)
+        index = self.tree.find(rng.randrange(self.total))
+        until = self.draws + WORD_RECENT_WINDOW
+        self.recent_until[index] = until
+        recent.append((until, index))
+        self.refresh(index)
+        return index, self.words[index]
+
+    def record(self, index, outcome):
+        """
+        단어 결과 반영
+        outcome: 'floor'면 놓친 횟수 증가 (최대 WORD_MISS_CAP), 'hit'이면 절반으로
+        """
+        misses = self.misses.get(index, 0)
+        if outcome == 'floor':
+            misses = min(misses + 1, WORD_MISS_CAP)
+        else:
+            misses //= 2
+        if misses:
+            self.misses[index] = misses
+        else:
+            self.misses.pop(index, None)
+        self.refresh(index)
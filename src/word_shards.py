@@ -0,0 +1,150 @@
+"""
+언어별 단어 샤드
+
+data/manifest.json에는 언어 이름, 샤드 파일, 단어 수만 들어 있어서 시작할 때는
+이 작은 목록만 읽음. 각 언어의 단어는 처음 필요할 때 샤드 파일에서 읽고,
+최근에 쓴 언어 몇 개만 메모리에 남겨둠
+
+    data/
+    ├── manifest.json      # {"languages": [{"name": "Python", "file": "shards/python.json", "count": 19}, ...]}
+    └── shards/
+        └── python.json    # {"Python": [{"word": ..., "desc": ...}, ...]} (words.json과 같은 형식)
+
+words.json을 샤드로 나누기:
+    python -m src.word_shards data/words.json data
+"""
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from .settings import WORD_SHARD_RESIDENT
+
+MANIFEST_NAME = 'manifest.json'
+SHARD_DIR = 'shards'
+
+def shard_name(language):
+    """언어 이름으로 샤드 파일 이름 생성 (C++ -> cpp, C# -> csharp)"""
+    slug = language.lower().replace('+', 'p').replace('#', 'sharp')
+    return re.sub(r'[^0-9a-z]+', '_', slug).strip('_') or 'language'
+
+def write_shards(data, directory):
+    """검증된 데이터({언어: 단어 목록})를 언어별 샤드와 매니페스트로 저장"""
+    os.makedirs(os.path.join(directory, SHARD_DIR), exist_ok=True)
+    entries = []
+    used = set()
+    for language, words in data.items():
+        name = shard_name(language)
+        while name in used:
+            name += '_'
+        used.add(name)
+        relative = f"{SHARD_DIR}/{name}.json"
+        with open(os.path.join(directory, relative), 'w', encoding='utf-8') as f:
+            json.dump({language: list(words)}, f, ensure_ascii=False, indent=2)
+        entries.append({'name': language, 'file': relative, 'count': len(words)})
+    with open(os.path.join(directory, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'languages': entries}, f, ensure_ascii=False, indent=2)
+    return entries
+
+def read_manifest(path):
+    """매니페스트를 {언어: {'file': 절대 경로, 'count': 단어 수}}로 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    entries = OrderedDict()
+    for entry in manifest.get('languages', []):
+        if not isinstance(entry, dict) or 'name' not in entry or 'file' not in entry:
+            print("[경고] 매니페스트에 유효하지 않은 항목이 있습니다. 건너뜁니다.")
+            continue
+        entries[entry['name']] = {
+            'file': os.path.join(base, entry['file']),
+            'count': entry.get('count'),
+        }
+    return entries
+
+class ShardedWords(Mapping):
+    """
+    {언어: 단어 목록}처럼 쓰는 지연 로딩 딕셔너리
+    키(언어 목록)는 매니페스트에서 바로 나오고, 값은 처음 꺼낼 때 샤드를 읽음
+    load_shard(path)는 샤드 파일을 읽어 {언어: 단어 목록}을 반환하는 함수
+    """
+    def __init__(self, manifest_path, load_shard, max_resident=WORD_SHARD_RESIDENT):
+        self.manifest_path = manifest_path
+        self.entries = read_manifest(manifest_path)
+        self.load_shard = load_shard
+        self.max_resident = max_resident
+        self._resident = OrderedDict()
+        self.loads = 0
+        self.evictions = 0
+
+    def __getitem__(self, language):
+        words = self._resident.get(language)
+        if words is not None:
+            self._resident.move_to_end(language)
+            return words
+        entry = self.entries[language]  # 매니페스트에 없는 언어면 KeyError
+        words = self.load_shard(entry['file']).get(language, [])
+        self.loads += 1
+        self._resident[language] = words
+        while len(self._resident) > self.max_resident:
+            self._resident.popitem(last=False)
+            self.evictions += 1
+        return words
+
+    def __contains__(self, language):
+        return language in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def count(self, language):
+        """샤드를 읽지 않고 매니페스트에 기록된 단어 수 반환"""
+        return self.entries[language]['count']
+
+    def is_resident(self, language):
+        """언어가 메모리에 올라와 있는지 (다른 스레드에서 확인해도 안전)"""
+        return language in self._resident
+
+    def replace(self, language, words):
+        """
+        다시 읽은 단어로 교체 (메인 스레드에서 호출)
+        words가 None이면 메모리에서 내려서 다음에 필요할 때 새로 읽게 함
+        """
+        if words is None:
+            self._resident.pop(language, None)
+        elif language in self._resident:
+            self._resident[language] = words
+
+    def set_entries(self, entries):
+        """새 매니페스트 항목으로 교체 (빠진 언어는 메모리에서도 내림)"""
+        self.entries = entries
+        for language in list(self._resident):
+            if language not in entries:
+                del self._resident[language]
+
+    def resident(self):
+        """현재 메모리에 있는 언어 목록 (오래 안 쓴 순서)"""
+        return list(self._resident)
+
+def main(argv=None):
+    import argparse
+    from .data_manager import DataManager
+
+    parser = argparse.ArgumentParser(description="words.json을 언어별 샤드와 매니페스트로 나누기")
+    parser.add_argument('source', help="원본 words.json")
+    parser.add_argument('directory', help="매니페스트와 shards/ 폴더를 만들 위치")
+    args = parser.parse_args(argv)
+
+    manager = DataManager(args.source, use_snapshot=False)
+    if not manager.data:
+        return 1
+    entries = write_shards(manager.data, args.directory)
+    print(f"{os.path.join(args.directory, MANIFEST_NAME)}: 언어 {len(entries)}개")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+단어 데이터 바이너리 스냅샷
+
+검증이 끝난 words.json 내용을 한 번 컴파일해 두고, 다음 실행부터는
+JSON 파싱/검증 없이 mmap으로 바로 여는 용도
+    python -m src.word_snapshot data/words.json
+
+파일 구조 (리틀 엔디언):
+    헤더 | 문자열 오프셋(u32 * (문자열 수 + 1)) | 항목(u32 단어, u32 설명) | 언어 표 | 문자열 데이터(UTF-8)
+- 같은 문자열은 한 번만 저장 (단어/설명/언어 이름 공용)
+- 언어 표에는 첫 항목 위치, 항목 수, 가장 긴 단어 길이를 미리 계산해 둠
+- 헤더에 원본 JSON의 수정 시각/크기를 기록해서 원본이 바뀌면 다시 컴파일
+"""
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+
+MAGIC = b'ADWS'
+VERSION = 1
+# magic, version, 언어 수, 문자열 수, 항목 수, 원본 mtime(ns), 원본 크기
+HEADER = struct.Struct('<4sIIIIqq')
+# 언어 이름 문자열 번호, 첫 항목 번호, 항목 수, 가장 긴 단어 길이
+LANGUAGE = struct.Struct('<IIII')
+
+class SnapshotError(Exception):
+    """스냅샷 파일이 없거나 형식이 맞지 않음"""
+
+def snapshot_path_for(json_path):
+    """원본 JSON 옆에 두는 스냅샷 경로 (data/words.json -> data/words.snapshot)"""
+    return os.path.splitext(json_path)[0] + '.snapshot'
+
+def write_snapshot(data, path, source_stat=None):
+    """
+    검증된 데이터({언어: [{'word', 'desc'}, ...]})를 스냅샷으로 저장
+    임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 스냅샷은 그대로 남음
+    """
+    strings = []
+    ids = {}
+
+    def intern(text):
+        index = ids.get(text)
+        if index is None:
+            index = ids[text] = len(strings)
+            strings.append(text)
+        return index
+
+    entries = []
+    languages = []
+    for language, words in data.items():
+        first = len(entries) // 2
+        longest = 0
+        for word_obj in words:
+            entries.append(intern(word_obj['word']))
+            entries.append(intern(word_obj['desc']))
+            longest = max(longest, len(word_obj['word']))
+        languages.append((intern(language), first, len(words), longest))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for blob in encoded:
+        offsets.append(offsets[-1] + len(blob))
+
+    mtime_ns, size = (source_stat.st_mtime_ns, source_stat.st_size) if source_stat else (0, -1)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(languages), len(strings), len(entries) // 2,
+                            mtime_ns, size))
+        f.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        f.write(struct.pack(f'<{len(entries)}I', *entries))
+        for language in languages:
+            f.write(LANGUAGE.pack(*language))
+        f.write(b''.join(encoded))
+    os.replace(tmp_path, path)
+
+class WordSnapshot:
+    """mmap으로 연 스냅샷 (문자열은 처음 읽을 때 디코딩해서 재사용)"""
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise SnapshotError("리틀 엔디언 시스템에서만 스냅샷을 사용할 수 있습니다.")
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError("빈 스냅샷 파일입니다.")
+        try:
+            self._parse()
+        except (struct.error, TypeError, ValueError) as e:
+            self.close()
+            raise SnapshotError(f"스냅샷 형식 오류: {e}")
+
+    def _parse(self):
+        buf = self._buf = memoryview(self._mmap)
+        magic, version, language_count, string_count, entry_count, mtime_ns, size = \
+            HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("지원하지 않는 스냅샷 버전")
+        self.source_mtime_ns = mtime_ns
+        self.source_size = size
+
+        pos = HEADER.size
+        self._offsets = buf[pos:pos + (string_count + 1) * 4].cast('I')
+        pos += (string_count + 1) * 4
+        self._entries = buf[pos:pos + entry_count * 8].cast('I')
+        pos += entry_count * 8
+        language_table = pos
+        pos += language_count * LANGUAGE.size
+        self._text = buf[pos:]
+        if len(self._text) != self._offsets[string_count]:
+            raise ValueError("문자열 데이터 길이가 맞지 않음")
+        self._strings = [None] * string_count
+
+        self.languages = {}
+        for i in range(language_count):
+            name_id, first, count, longest = LANGUAGE.unpack_from(buf, language_table + i * LANGUAGE.size)
+            word_list = SnapshotWordList(self, first, count, longest)
+            self.languages[self.string(name_id)] = word_list
+
+    def string(self, index):
+        """index번째 문자열 (한 번 디코딩한 문자열은 같은 객체를 반환)"""
+        text = self._strings[index]
+        if text is None:
+            start, end = self._offsets[index], self._offsets[index + 1]
+            text = self._strings[index] = str(self._text[start:end], 'utf-8')
+        return text
+
+    def entry(self, index):
+        """index번째 항목을 {'word', 'desc'} 딕셔너리로 반환"""
+        return {'word': self.string(self._entries[index * 2]),
+                'desc': self.string(self._entries[index * 2 + 1])}
+
+    def matches(self, source_stat):
+        """원본 JSON이 스냅샷을 만든 뒤로 바뀌지 않았는지 확인"""
+        return (self.source_mtime_ns == source_stat.st_mtime_ns
+                and self.source_size == source_stat.st_size)
+
+    def close(self):
+        for name in ('_offsets', '_entries', '_text', '_buf'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+class SnapshotWordList(Sequence):
+    """한 언어의 단어 목록 (리스트처럼 쓰되 항목은 접근할 때 만들어짐)"""
+    def __init__(self, snapshot, first, count, longest_word):
+        self.snapshot = snapshot
+        self.first = first
+        self.count = count
+        self.longest_word = longest_word
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("단어 목록 범위를 벗어났습니다.")
+        return self.snapshot.entry(self.first + index)
+
+def main(argv=None):
+    import argparse
+    from .data_manager import DataManager
+
+    parser = argparse.ArgumentParser(description="words.json을 바이너리 스냅샷으로 컴파일")
+    parser.add_argument('source', nargs='?', default=None, help="원본 JSON (기본 data/words.json)")
+    parser.add_argument('--output', default=None, help="스냅샷 경로 (기본: 원본 옆 .snapshot)")
+    args = parser.parse_args(argv)
+
+    manager = DataManager(args.source, use_snapshot=False)
+    if not manager.data:
+        return 1
+    output = args.output or snapshot_path_for(manager.file_path)
+    write_snapshot(manager.data, output, os.stat(manager.file_path))
+    entries = sum(len(words) for words in manager.data.values())
+    print(f"{output}: 언어 {len(manager.data)}개, 단어 {entries}개, {os.path.getsize(output)} bytes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
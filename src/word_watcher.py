@@ -0,0 +1,169 @@
+"""
+단어 데이터 실시간 다시 읽기
+
+백그라운드 스레드가 단어 파일의 수정 시각/크기를 주기적으로 확인하고,
+바뀐 파일이 있으면 다시 읽어 내용이 달라진 언어만 골라 대기 목록에 올려둠
+실제 교체는 메인 스레드가 프레임 사이에 DataManager.apply_reload()로 한 번에 수행
+"""
+import json
+import os
+import threading
+from .settings import WORD_RELOAD_INTERVAL
+from .word_shards import ShardedWords, read_manifest
+
+def _stat_key(path):
+    """변경 감지용 (수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _digest(word_list):
+    """단어 리스트 내용 비교용 해시 (검증 전 원본에도 사용)"""
+    if not isinstance(word_list, list):
+        return hash(repr(word_list))
+    return hash(tuple((word_obj.get('word'), word_obj.get('desc')) if isinstance(word_obj, dict)
+                      else repr(word_obj) for word_obj in word_list))
+
+class WordWatcher:
+    """
+    DataManager의 원본 파일을 감시하는 백그라운드 스레드
+    - words.json 하나: 파일 전체를 다시 파싱하되, 내용이 같은 언어는 검증도 건너뜀
+    - 매니페스트 + 샤드: 바뀐 샤드 파일만 다시 읽음
+    바뀐 언어는 pending에 {언어: 새 단어 리스트 (삭제면 None)}로 쌓임
+    """
+    def __init__(self, manager, interval=WORD_RELOAD_INTERVAL):
+        self.manager = manager
+        self.interval = interval
+        self.sharded = isinstance(manager.data, ShardedWords)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._pending_entries = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.reloads = 0
+
+        # 시작 시점 상태 (이후 변경은 이 기준과 비교)
+        if self.sharded:
+            self._stats = {path: _stat_key(path) for path in self._watched_paths(manager.data.entries)}
+        else:
+            self._stats = {manager.file_path: _stat_key(manager.file_path)}
+            self._words = dict(manager.data)  # 감시 스레드가 아는 최신 데이터 (스냅샷 재생성용)
+            self._digests = None  # 첫 변경 때 계산
+
+    def _watched_paths(self, entries):
+        return [self.manager.file_path] + [entry['file'] for entry in entries.values()]
+
+    # --- 스레드 ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="word-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # 편집 중인 파일을 읽다가 실패해도 감시는 계속
+                print(f"[경고] 단어 데이터 다시 읽기 실패: {e}")
+
+    def poll(self):
+        """한 번 확인해서 바뀐 언어를 대기 목록에 추가 (바뀐 언어 집합 반환)"""
+        if self.sharded:
+            changes = self._poll_shards()
+        else:
+            changes = self._poll_file()
+        if changes:
+            with self._lock:
+                self._pending.update(changes)
+        return set(changes)
+
+    def take(self):
+        """
+        대기 중인 변경을 꺼내고 비움 (메인 스레드에서 호출)
+        반환: (바뀐 언어 딕셔너리, 새 매니페스트 항목 또는 None)
+        """
+        with self._lock:
+            changes, self._pending = self._pending, {}
+            entries, self._pending_entries = self._pending_entries, None
+        return changes, entries
+
+    # --- words.json 하나 ---
+    def _poll_file(self):
+        path = self.manager.file_path
+        key = _stat_key(path)
+        if key is None or key == self._stats[path]:
+            return {}
+        self._stats[path] = key
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)  # 편집 중이라 깨진 JSON이면 예외 -> 다음 저장 때 다시 읽음
+        if not isinstance(raw, dict):
+            print("[경고] 데이터가 딕셔너리 형식이 아닙니다. 다시 읽기를 건너뜁니다.")
+            return {}
+
+        if self._digests is None:
+            self._digests = {language: _digest(list(words)) for language, words in self._words.items()}
+        changes = {}
+        digests = {}
+        for language, word_list in raw.items():
+            digest = digests[language] = _digest(word_list)
+            if digest == self._digests.get(language):
+                continue
+            # 내용이 바뀐 언어만 검증
+            changes[language] = self.manager._validate_language(language, word_list)
+        for language in self._digests:
+            if language not in raw:
+                changes[language] = None
+        self._digests = digests
+
+        if changes:
+            words = {}
+            for language in raw:
+                valid = changes[language] if language in changes else self._words.get(language)
+                if valid:
+                    words[language] = valid
+            self._words = words
+            self.manager.save_snapshot(words)
+            self.reloads += 1
+        return changes
+
+    # --- 매니페스트 + 샤드 ---
+    def _poll_shards(self):
+        store = self.manager.data
+        manifest_path = self.manager.file_path
+        key = _stat_key(manifest_path)
+        entries = store.entries
+        changes = {}
+        if key is not None and key != self._stats.get(manifest_path):
+            entries = read_manifest(manifest_path)
+            self._stats[manifest_path] = key
+            for language in store.entries:
+                if language not in entries:
+                    changes[language] = None
+            with self._lock:
+                self._pending_entries = entries  # 언어 목록 교체도 메인 스레드에서
+
+        for language, entry in entries.items():
+            path = entry['file']
+            key = _stat_key(path)
+            if self._stats.get(path, key) == key:
+                self._stats[path] = key
+                continue
+            self._stats[path] = key
+            if not store.is_resident(language):
+                continue  # 메모리에 없는 언어는 다음에 필요할 때 새 파일을 읽음
+            words = self.manager.load_shard(path).get(language) if key else None
+            if words is None and key:
+                continue  # 읽을 수 없는 샤드는 기존 단어를 그대로 사용
+            changes[language] = words
+        if changes:
+            self.reloads += 1
+        return changes